@@ -0,0 +1,120 @@
+"""
+can_receive_from.py
+
+Times type checking every edge of a built workflow, with the memoized
+can_receive_from results cleared before each check (cold) and kept (warm).
+
+    python benchmarks/can_receive_from.py --steps 2000
+"""
+
+import argparse
+import time
+
+from janis_core import (
+    Array,
+    CommandToolBuilder,
+    File,
+    Int,
+    Logger,
+    String,
+    ToolInput,
+    ToolOutput,
+    UnionType,
+    WorkflowBuilder,
+)
+from janis_core.types.data_types import clear_compatibility_cache
+
+
+class TextFile(File):
+    @staticmethod
+    def name():
+        return "TextFile"
+
+
+class CsvFile(TextFile):
+    @staticmethod
+    def name():
+        return "CsvFile"
+
+
+def build_workflow(nsteps: int):
+    tool = CommandToolBuilder(
+        tool="receive_from",
+        base_command="echo",
+        inputs=[
+            ToolInput("inp", CsvFile),
+            ToolInput("files", Array(TextFile)),
+            ToolInput("nested", Array(Array(File))),
+            ToolInput("value", UnionType(String, Int)),
+            ToolInput("optional", String(optional=True)),
+        ],
+        outputs=[
+            ToolOutput("out", CsvFile, selector="out.csv"),
+            ToolOutput("outs", Array(CsvFile), selector="*.csv"),
+            ToolOutput("nested", Array(Array(CsvFile)), selector="*.csv"),
+        ],
+        container="ubuntu:latest",
+        version="dev",
+    )
+
+    w = WorkflowBuilder("receive_from")
+    w.input("inp", CsvFile)
+    w.input("files", Array(CsvFile))
+    w.input("nested", Array(Array(TextFile)))
+    w.input("value", Int)
+    w.input("name", String)
+    previous = w.step(
+        "stp0",
+        tool(inp=w.inp, files=w.files, nested=w.nested, value=w.value),
+    )
+    for i in range(1, nsteps):
+        previous = w.step(
+            f"stp{i}",
+            tool(
+                inp=previous.out,
+                files=previous.outs,
+                nested=previous.nested,
+                value=w.value,
+                optional=w.name,
+            ),
+        )
+    w.output("out", source=previous.out)
+    return w
+
+
+def check_edges(edges, cold: bool) -> float:
+    start = time.perf_counter()
+    for edge in edges:
+        if cold:
+            clear_compatibility_cache()
+        edge.check_types()
+    return time.perf_counter() - start
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args(args)
+
+    Logger.mute()
+    w = build_workflow(args.steps)
+    edges = [
+        e
+        for stp in w.step_nodes.values()
+        for sti in stp.sources.values()
+        for e in sti.source_map
+    ]
+
+    cold = min(check_edges(edges, cold=True) for _ in range(args.repeats))
+    check_edges(edges, cold=False)
+    warm = min(check_edges(edges, cold=False) for _ in range(args.repeats))
+
+    print(f"edges: {len(edges)}")
+    print(f"cold: {cold * 1e6 / len(edges):.1f} µs per edge ({cold:.3f} s)")
+    print(f"warm: {warm * 1e6 / len(edges):.1f} µs per edge ({warm:.3f} s)")
+    print(f"speedup: {cold / warm:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+graph_memory.py
+
+Reports the memory a built workflow keeps alive per step, and the size of the
+(hot) graph objects that make up each step. With --baseline, the same is measured
+with janis_core as of a git revision (eg: before the graph objects used __slots__)
+to compare against.
+
+    python benchmarks/graph_memory.py --steps 5000 [--literals] [--baseline 6568d2e^]
+"""
+
+import argparse
+import gc
+import io
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import tracemalloc
+from typing import Dict
+
+from janis_core import Logger, String, WorkflowBuilder
+from janis_core.graph.steptaginput import Edge, StepTagInput
+from janis_core.operators.selectors import InputNodeSelector, StepOutputSelector
+from janis_core.tests.testtools import SingleTestTool
+from janis_core.tool.commandtool import ToolInput
+from janis_core.tool.tool import TInput, TOutput
+
+
+def build_workflow(nsteps: int, literals=False):
+    w = WorkflowBuilder("graph_memory")
+    w.input("inp", String)
+    previous = w.inp
+    for i in range(nsteps):
+        # a literal creates an input (with an optional copy of the input's type)
+        extra = {"input3": "literal"} if literals else {}
+        stp = w.step(f"stp{i}", SingleTestTool(input1=previous, input2=w.inp, **extra))
+        previous = stp.out
+    w.output("out", source=previous)
+    return w
+
+
+def instance_size(obj) -> int:
+    """
+    The size of the object and (if it has one) its __dict__, not of its attributes
+    """
+    size = sys.getsizeof(obj)
+    if hasattr(obj, "__dict__"):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def measure(nsteps: int, literals=False) -> Dict[str, int]:
+    """
+    The memory kept per step of a workflow with nsteps, and the size of each graph object
+    """
+    Logger.mute()
+    build_workflow(10)  # warm up the caches (types, tool io maps)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    w = build_workflow(nsteps, literals=literals)
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    stp = w.step_nodes["stp1"]
+    sti = stp.sources["input1"]
+    tool_input = stp.tool.inputs()[0]
+    objects = [
+        ("Edge", sti.source_map[0], Edge),
+        ("StepTagInput", sti, StepTagInput),
+        ("StepOutputSelector", sti.source_map[0].source, StepOutputSelector),
+        (
+            "InputNodeSelector",
+            InputNodeSelector(w.input_nodes["inp"]),
+            InputNodeSelector,
+        ),
+        ("TInput", stp.inputs()["input1"], TInput),
+        ("TOutput", stp.outputs()["out"], TOutput),
+        ("ToolInput", tool_input, ToolInput),
+    ]
+
+    results = {"bytes per step": round((after - before) / nsteps)}
+    for name, obj, cls in objects:
+        assert isinstance(obj, cls)
+        results[name] = instance_size(obj)
+    return results
+
+
+def measure_at_revision(revision: str, nsteps: int, literals=False) -> Dict[str, int]:
+    """
+    Measure (in a subprocess) with the janis_core package as of the git revision
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        archive = subprocess.run(
+            ["git", "archive", revision, "janis_core"],
+            cwd=root,
+            check=True,
+            stdout=subprocess.PIPE,
+        ).stdout
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(tmpdir)
+
+        command = [sys.executable, __file__, "--steps", str(nsteps), "--json"]
+        if literals:
+            command.append("--literals")
+        env = {**os.environ, "PYTHONPATH": tmpdir}
+        out = subprocess.run(
+            command, env=env, check=True, stdout=subprocess.PIPE
+        ).stdout
+    return json.loads(out)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--steps", type=int, default=5000)
+    parser.add_argument(
+        "--literals", action="store_true", help="connect a literal to each step"
+    )
+    parser.add_argument(
+        "--baseline", help="a git revision to measure (and compare against) too"
+    )
+    parser.add_argument("--json", action="store_true", help="print the results as json")
+    args = parser.parse_args(args)
+
+    results = measure(args.steps, literals=args.literals)
+    if args.json:
+        print(json.dumps(results))
+        return
+
+    baseline = None
+    if args.baseline:
+        baseline = measure_at_revision(args.baseline, args.steps, args.literals)
+
+    print(f"steps: {args.steps}")
+    for name, value in results.items():
+        unit = "" if name == "bytes per step" else " bytes"
+        if baseline is not None:
+            print(f"{name}: {baseline.get(name)} -> {value}{unit}")
+        else:
+            print(f"{name}: {value}{unit}")
+
+
+if __name__ == "__main__":
+    main()
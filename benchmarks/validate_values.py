@@ -0,0 +1,58 @@
+"""
+validate_values.py
+
+Times validating (and hinting at the invalid elements of) large array inputs.
+
+    python benchmarks/validate_values.py --elements 100000
+"""
+
+import argparse
+import time
+
+from janis_core import Array, File, Int, String
+
+
+def best_of(repeats: int, f) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        f()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--elements", type=int, default=100000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args(args)
+
+    n = args.elements
+    files = [f"/data/sample{i}.bam" for i in range(n)]
+    strings = [f"sample{i}" for i in range(n)]
+    # one invalid element in the middle
+    ints = list(range(n))
+    ints[n // 2] = "invalid"
+
+    cases = [
+        (
+            "Array<File>.validate_value",
+            lambda: Array(File).validate_value(files, False),
+        ),
+        (
+            "Array<String>.validate_value",
+            lambda: Array(String).validate_value(strings, False),
+        ),
+        (
+            "Array<Int>.invalid_value_hint",
+            lambda: Array(Int).invalid_value_hint(ints),
+        ),
+    ]
+
+    print(f"elements: {n}")
+    for name, f in cases:
+        print(f"{name}: {best_of(args.repeats, f) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -109,6 +109,25 @@ class CodeTool(Tool):
     def has_tool_with_no_container(self):
         return self.container() is None
 
+    def structural_components(self) -> dict:
+        components = super().structural_components()
+        components.update(
+            {
+                "container": self.container(),
+                "base_command": self.base_command(),
+                "script_name": self.script_name(),
+                "scripts": [
+                    self.prepared_script(t)
+                    for t in (SupportedTranslation.CWL, SupportedTranslation.WDL)
+                ],
+                "cpus": self.cpus({}),
+                "memory": self.memory({}),
+                "time": self.time({}),
+                "disk": self.disk({}),
+            }
+        )
+        return components
+
     def tool_inputs(self) -> List[TInput]:
         return self.inputs()
 
@@ -6,6 +6,7 @@
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Dict, List, Tuple, Any
+from weakref import WeakValueDictionary
 
 from janis_core.tool.tool import TInput, TOutput
 
@@ -47,7 +48,8 @@ class NodeType(Enum):
 class Node(object):
 
     _N_counter: int = 1
-    _N_nodeId_map: Dict[int, Any] = {}
+    # weak, so the map doesn't keep every node (and its workflow) alive
+    _N_nodeId_map: Dict[int, Any] = WeakValueDictionary()
 
     def __init__(self, wf, node_type: NodeType, identifier: NodeLabel, depth=0):
 
@@ -23,20 +23,34 @@ def full_dot(node: Node, tag: Optional[str]) -> str:
 
 
 class Edge:
+    # a workflow has (at least) one of these for each connection, so they're kept small
+    __slots__ = ("source", "finish", "ftag", "compatible_types", "scatter")
+
     def __init__(
-        self, source: Selector, finish: Node, ftag: Optional[str], should_scatter
+        self,
+        source: Selector,
+        finish: Node,
+        ftag: Optional[str],
+        should_scatter,
+        defer_checks=False,
     ):
-        Logger.log(
-            f"Creating edge: ({source} → "
-            f"({NodeType.to_str(finish.node_type)}) '{finish.id()}.{ftag}'"
-        )
-
+        """
+        :param defer_checks: Don't validate the tag or check the types (or log), the
+            caller calls validate_tags and check_types later (see WorkflowBase.batch)
+        """
         self.source = source
         self.finish: Node = finish
         self.ftag: Optional[str] = ftag
         self.compatible_types: Optional[bool] = None
         self.scatter = should_scatter
 
+        if defer_checks:
+            return
+
+        Logger.log(
+            f"Creating edge: ({source} → "
+            f"({NodeType.to_str(finish.node_type)}) '{finish.id()}.{ftag}'"
+        )
         self.validate_tags()
         self.check_types()
 
@@ -55,7 +69,10 @@ class Edge:
                 f"Could not find the tag '{self.ftag}' in the outputs of '{self.finish.id()}': {list(self.finish.inputs().keys())}"
             )
 
-    def check_types(self):
+    def check_types(self) -> Optional[str]:
+        """
+        :return: The (logged) message if the types aren't compatible
+        """
         from janis_core.workflow.workflow import InputNode, StepNode
 
         # stoolin: TOutput = self.start.outputs()[
@@ -97,6 +114,7 @@ class Edge:
             if stype.is_array() and ftype.can_receive_from(stype.subtype()):
                 message += " (did you forget to SCATTER?)"
             Logger.critical(message)
+            return message
 
 
 class StepTagInput:
@@ -105,6 +123,8 @@ class StepTagInput:
     will have one StepTagInput for each potential input of the tool.
     """
 
+    __slots__ = ("finish", "ftag", "multiple_inputs", "source_map")
+
     def __init__(self, finish: Node, finish_tag: str):
 
         self.finish: Node = finish
@@ -114,12 +134,15 @@ class StepTagInput:
 
         self.source_map: List[Edge] = []
 
-    def add_source(self, operator: Selector, should_scatter) -> Edge:
+    def add_source(
+        self, operator: Selector, should_scatter, defer_checks=False
+    ) -> Edge:
         """
         Add a connection
         :param start:
         :param stag:
         :param should_scatter:
+        :param defer_checks: Defer the checks of the edge, see Edge
         :return:
         """
 
@@ -145,12 +168,14 @@ class StepTagInput:
         #     stype = Array(stype)
 
         if should_scatter:
-            if not stype.is_array():
+            if stype.is_array():
+                stype = get_instantiated_type(stype.subtype())
+            elif not defer_checks:
+                # (when deferred, it's reported by the edge's check_types)
                 raise Exception(
                     f"Scatter was required for '{operator} → '{self.finish.id()}.{self.ftag}' but "
                     f"the input type was {type(stype).__name__} and not an array"
                 )
-            stype = get_instantiated_type(stype.subtype())
 
         if len(self.source_map) == 1:  # and start.id() not in self.source_map:
             self.multiple_inputs = True
@@ -164,7 +189,13 @@ class StepTagInput:
             # https://www.commonwl.org/user_guide/misc/#connect-a-solo-value-to-an-input-that-expects-an-array-of-that-type
             self.multiple_inputs = True
 
-        e = Edge(operator, self.finish, self.ftag, should_scatter=should_scatter)
+        e = Edge(
+            operator,
+            self.finish,
+            self.ftag,
+            should_scatter=should_scatter,
+            defer_checks=defer_checks,
+        )
         # todo: deal with source_map
         self.source_map.append(e)
         return e
@@ -12,6 +12,9 @@ from janis_core.utils.logger import Logger
 
 
 class Selector(ABC):
+    # the selectors below don't have a __dict__, subclasses without __slots__ still do
+    __slots__ = ()
+
     @staticmethod
     def is_selector():
         return True
@@ -272,6 +275,8 @@ SelectorOrValue = Union[Selector, int, str, float]
 
 
 class InputSelector(Selector):
+    __slots__ = ("input_to_select", "type_hint", "remove_file_extension")
+
     def __init__(
         self, input_to_select, remove_file_extension=None, type_hint=File, **kwargs
     ):
@@ -328,6 +333,8 @@ class InputSelector(Selector):
 
 
 class InputNodeSelector(Selector):
+    __slots__ = ("input_node",)
+
     def __init__(self, input_node):
         from janis_core.workflow.workflow import InputNode
 
@@ -341,6 +348,10 @@ class InputNodeSelector(Selector):
     def id(self):
         return self.input_node.id()
 
+    def fingerprint_state(self):
+        # the id of the node, rather than the node (and its workflow)
+        return self.input_node.id()
+
     def returntype(self):
         out = first_value(self.input_node.outputs()).outtype
 
@@ -364,6 +375,8 @@ class InputNodeSelector(Selector):
 
 
 class StepOutputSelector(Selector):
+    __slots__ = ("node", "tag")
+
     def __init__(self, node, tag):
 
         outputs = node.outputs()
@@ -393,6 +406,9 @@ class StepOutputSelector(Selector):
     def from_tuple(step_tuple):
         return StepOutputSelector(step_tuple[0], step_tuple[1])
 
+    def fingerprint_state(self):
+        return [self.node.id(), self.tag]
+
     def __repr__(self):
         parts = [p for p in (self.node.id(), self.tag) if p is not None]
 
@@ -407,6 +423,8 @@ class StepOutputSelector(Selector):
 
 
 class WildcardSelector(Selector):
+    __slots__ = ("wildcard", "select_first")
+
     def __init__(self, wildcard, select_first=False):
         self.wildcard = wildcard
         self.select_first = select_first
@@ -423,6 +441,8 @@ class AliasSelector(Selector):
     Simply a way to silence the Janis type system
     """
 
+    __slots__ = ("inner_selector", "data_type")
+
     def __init__(self, inner: Selector, dt: ParseableType):
         self.inner_selector = inner
         self.data_type = get_instantiated_type(dt)
@@ -440,6 +460,8 @@ class AliasSelector(Selector):
 
 
 class ForEachSelector(Selector):
+    __slots__ = ()
+
     def returntype(self) -> DataType:
         return File()
 
@@ -450,6 +472,8 @@ class ForEachSelector(Selector):
 
 
 class ResourceSelector(InputSelector):
+    __slots__ = ("resource_type", "default")
+
     def __init__(
         self,
         resource_to_select: str,
@@ -495,6 +519,8 @@ class ResourceSelector(InputSelector):
 
 
 class MemorySelector(ResourceSelector):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__("runtime_memory", Int(optional=False), 4)
 
@@ -503,6 +529,8 @@ class MemorySelector(ResourceSelector):
 
 
 class CpuSelector(ResourceSelector):
+    __slots__ = ()
+
     def __init__(self, default=1):
         super().__init__("runtime_cpu", Int(optional=bool(default is None)), default)
 
@@ -511,6 +539,8 @@ class CpuSelector(ResourceSelector):
 
 
 class DiskSelector(ResourceSelector):
+    __slots__ = ()
+
     def __init__(self, default=20):
         super().__init__("runtime_disks", Int(optional=True), default)
 
@@ -519,6 +549,8 @@ class DiskSelector(ResourceSelector):
 
 
 class TimeSelector(ResourceSelector):
+    __slots__ = ()
+
     def __init__(self, default=86400):
         """
         Specified in seconds
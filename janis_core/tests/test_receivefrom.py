@@ -4,6 +4,11 @@ from janis_core.types import UnionType
 
 from janis_core import String, Array, File, Int, Stdout
 from janis_core.types.common_data_types import Filename
+from janis_core.types.data_types import (
+    DataType,
+    _compatibility_cache,
+    clear_compatibility_cache,
+)
 
 
 class FileSubclass(File):
@@ -125,3 +130,45 @@ class TestReceiveFromUnion(unittest.TestCase):
         s1 = UnionType(String, Int)
         s2 = String()
         self.assertFalse(s2.can_receive_from(s1))
+
+
+class TestReceiveFromCache(unittest.TestCase):
+    def setUp(self):
+        clear_compatibility_cache()
+
+    def test_cached_result(self):
+        self.assertFalse(String().can_receive_from(String(optional=True)))
+        self.assertIn(
+            (
+                DataType,
+                String().compatibility_key(),
+                String(optional=True).compatibility_key(),
+                False,
+            ),
+            _compatibility_cache,
+        )
+        self.assertFalse(String().can_receive_from(String(optional=True)))
+        self.assertTrue(
+            String().can_receive_from(String(optional=True), source_has_default=True)
+        )
+
+    def test_nested_types_differ(self):
+        self.assertTrue(Array(File()).can_receive_from(Array(FileSubclass())))
+        self.assertFalse(Array(FileSubclass()).can_receive_from(Array(File())))
+        self.assertFalse(Array(Array(File())).can_receive_from(Array(File())))
+        self.assertTrue(FileSubclass().can_receive_from(Stdout(FileSubclass())))
+        self.assertFalse(FileSubclass().can_receive_from(Stdout(File())))
+
+    def test_super_isnt_answered_by_subclass(self):
+        # Filename receives from String, the String it calls super() on doesn't
+        self.assertTrue(Filename().can_receive_from(String()))
+        self.assertTrue(String().can_receive_from(Filename()))
+        self.assertFalse(Int().can_receive_from(String()))
+
+    def test_clear_on_add_type(self):
+        from janis_core.toolbox.toolbox import JanisShed
+
+        String().can_receive_from(String())
+        self.assertTrue(_compatibility_cache)
+        JanisShed.add_type(String)
+        self.assertFalse(_compatibility_cache)
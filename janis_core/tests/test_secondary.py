@@ -1,5 +1,9 @@
 import unittest
 from janis_core.translations.wdl import apply_secondary_file_format_to_filename
+from janis_core.utils.secondary import (
+    apply_secondary_file_formats_to_filenames,
+    parse_secondary_file_formats,
+)
 
 
 class TestApplySecondaryFileFormat(unittest.TestCase):
@@ -50,3 +54,40 @@ class TestApplySecondaryFileFormat(unittest.TestCase):
             "/path/with.dot/filename.txt",
             apply_secondary_file_format_to_filename(base, sec),
         )
+
+
+class TestApplySecondaryFileFormats(unittest.TestCase):
+    def test_matrix(self):
+        self.assertEqual(
+            [["a.bam.bai", "a.bai"], ["dir/b.bam.bai", "dir/b.bai"]],
+            apply_secondary_file_formats_to_filenames(
+                ["a.bam", "dir/b.bam"], [".bai", "^.bai"]
+            ),
+        )
+
+    def test_matches_single_filename(self):
+        filepaths = [
+            None,
+            "",
+            "filename",
+            "filename.ext",
+            "filename.ext1.ext2",
+            "/path/with.dot/filename.ext",
+            "/path/with.dot/filename",
+            "s3://bucket/path/file.vcf.gz",
+        ]
+        secondaries = [".tsv", "^.tsv", "^^.tsv", "^^^^^^^^.tsv", ".tbi", "^"]
+        names = apply_secondary_file_formats_to_filenames(filepaths, secondaries)
+        for filepath, row in zip(filepaths, names):
+            self.assertEqual(
+                [
+                    apply_secondary_file_format_to_filename(filepath, sec)
+                    for sec in secondaries
+                ],
+                row,
+            )
+
+    def test_parsed_formats_are_cached(self):
+        parsed = parse_secondary_file_formats((".bai", "^.bai"))
+        self.assertEqual(((".bai", 0), (".bai", 1)), parsed)
+        self.assertIs(parsed, parse_secondary_file_formats((".bai", "^.bai")))
@@ -1,9 +1,27 @@
+import copy
+import os
+import pickle
+import shutil
+import tempfile
 from unittest import TestCase
 
+from janis_core.tool.commandtool import ToolInput
+
 from janis_core.workflow.workflow import WorkflowBuilder
-from janis_core.types.common_data_types import Array, String
+from janis_core.types.common_data_types import (
+    Array,
+    Directory,
+    File,
+    String,
+    UnionType,
+)
 
-from janis_core.tests.testtools import TestTool, ArrayTestTool, TestToolV2
+from janis_core.tests.testtools import (
+    TestTool,
+    ArrayTestTool,
+    TestToolV2,
+    TestTypeWithSecondary,
+)
 
 
 class TestContainers(TestCase):
@@ -31,3 +49,186 @@ class TestContainers(TestCase):
         self.assertIsNone(cons["ArrayStepTool"])
         self.assertEqual("ubuntu:latest", cons["TestTranslationtool"])
         self.assertEqual("ubuntu:latest", cons["TestTranslationtool_v0_0_2"])
+
+
+class TestIOMaps(TestCase):
+    def test_inputs_map_is_computed_once(self):
+        t = TestTool()
+        self.assertIs(t.inputs_map(), t.inputs_map())
+        self.assertIs(t.outputs_map(), t.outputs_map())
+        self.assertIsNot(t.inputs_map(), TestTool().inputs_map())
+
+    def test_invalidate(self):
+        t = TestTool()
+        ins = t.inputs_map()
+        t.invalidate_io_maps()
+        self.assertIsNot(ins, t.inputs_map())
+        self.assertSetEqual(set(ins), set(t.inputs_map()))
+
+    def test_workflow_maps_follow_new_nodes(self):
+        w = WorkflowBuilder("test_io_maps")
+        w.input("inp", String)
+        self.assertSetEqual({"inp"}, set(w.inputs_map()))
+        w.input("inp2", String)
+        self.assertSetEqual({"inp", "inp2"}, set(w.inputs_map()))
+
+        w.step("stp", TestTool(testtool=w.inp))
+        w.output("out", source=w.stp.std)
+        self.assertSetEqual({"out"}, set(w.outputs_map()))
+        w.output("out2", source=w.stp.std)
+        self.assertSetEqual({"out", "out2"}, set(w.outputs_map()))
+
+    def test_conditional_step_outputs(self):
+        w = WorkflowBuilder("test_io_maps_conditional")
+        w.input("inp", String)
+        stp = w.step("stp", TestTool(testtool=w.inp), when=w.inp.equals("a"))
+        outs = stp.outputs()
+        self.assertIs(outs, stp.outputs())
+        self.assertTrue(all(o.outtype.optional for o in outs.values()))
+        self.assertFalse(
+            any(o.outtype.optional for o in stp.tool.outputs_map().values())
+        )
+
+
+class TestSlots(TestCase):
+    def test_graph_objects_have_no_dict(self):
+        w = WorkflowBuilder("test_slots")
+        w.input("inp", String)
+        stp = w.step("stp", TestTool(testtool=w.inp))
+        w.step("stp2", TestTool(testtool=w.stp.std.as_type(String)))
+
+        sti = stp.sources["testtool"]
+        alias = w.step_nodes["stp2"].sources["testtool"].source_map[0].source
+        objects = [
+            sti,
+            sti.source_map[0],
+            sti.source_map[0].source,
+            stp.std,
+            alias,
+            stp.inputs()["testtool"],
+            stp.outputs()["std"],
+            stp.tool.inputs()[0],
+        ]
+        for obj in objects:
+            self.assertFalse(hasattr(obj, "__dict__"), type(obj).__name__)
+
+    def test_tool_input_copies(self):
+        t = TestTool().inputs()[0]
+        for copied in [copy.copy(t), pickle.loads(pickle.dumps(t))]:
+            self.assertEqual(t.tag, copied.tag)
+            self.assertEqual(t.position, copied.position)
+            self.assertEqual(repr(t.input_type), repr(copied.input_type))
+
+    def test_tool_input_repr(self):
+        r = repr(ToolInput("inp", String(), prefix="--inp", position=2))
+        self.assertTrue(r.startswith("ToolInput(prefix='--inp'"))
+        self.assertIn("position=2", r)
+        self.assertIn("tag='inp'", r)
+
+
+class TestPreflightInputs(TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+
+        w = WorkflowBuilder("preflight")
+        w.input("sec", TestTypeWithSecondary)
+        w.input("files", Array(File))
+        w.input("directory", Directory(optional=True))
+        w.input("name", String, default="unused")
+        self.workflow = w
+
+    def touch(self, name):
+        path = os.path.join(self.tmpdir, name)
+        open(path, "w").close()
+        return path
+
+    def test_all_exist(self):
+        report = self.workflow.preflight_inputs(
+            {
+                "sec": self.touch("a.bam"),
+                "files": [self.touch("b.txt"), self.touch("c.txt")],
+                "directory": self.tmpdir,
+            }
+        )
+        self.touch("a.txt")
+        self.assertFalse(report.is_valid())
+        self.assertEqual({"sec": [os.path.join(self.tmpdir, "a.txt")]}, report.missing)
+
+        report = self.workflow.preflight_inputs(
+            {"sec": os.path.join(self.tmpdir, "a.bam"), "directory": self.tmpdir}
+        )
+        self.assertTrue(report.is_valid(), report.summary())
+        self.assertEqual(3, report.checked)
+
+    def test_missing_grouped_by_input(self):
+        missing = os.path.join(self.tmpdir, "missing.txt")
+        report = self.workflow.preflight_inputs(
+            {"files": [self.touch("b.txt"), missing, missing], "directory": missing}
+        )
+        self.assertEqual(
+            {"files": [missing, missing], "directory": [missing]}, report.missing
+        )
+        self.assertEqual({}, report.wrong_kind)
+        self.assertIn("missing.txt", report.summary())
+
+    def test_wrong_kind_and_unchecked(self):
+        report = self.workflow.preflight_inputs(
+            {"files": [self.tmpdir, "s3://bucket/b.txt"]}
+        )
+        self.assertEqual({"files": [self.tmpdir]}, report.wrong_kind)
+        self.assertEqual({"files": ["s3://bucket/b.txt"]}, report.unchecked)
+
+    def test_cache(self):
+        path = os.path.join(self.tmpdir, "later.txt")
+        cache = {}
+        self.assertFalse(
+            self.workflow.preflight_inputs({"files": [path]}, cache=cache).is_valid()
+        )
+        self.touch("later.txt")
+        # the result is reused from the cache
+        self.assertFalse(
+            self.workflow.preflight_inputs({"files": [path]}, cache=cache).is_valid()
+        )
+        self.assertTrue(self.workflow.preflight_inputs({"files": [path]}).is_valid())
+
+    def test_union_secondaries_by_extension(self):
+        from janis_core.tool.preflight import PATH_FILE, get_expected_paths
+
+        class IndexedBam(File):
+            def __init__(self, optional=False):
+                super().__init__(optional, extension=".bam")
+
+            @staticmethod
+            def secondary_files():
+                return [".bai", ".md5"]
+
+        class IndexedVcf(File):
+            def __init__(self, optional=False):
+                super().__init__(optional, extension=".vcf.gz")
+
+            @staticmethod
+            def secondary_files():
+                return [".tbi", ".md5"]
+
+        # the UnionType doesn't (yet) accept types with secondaries when constructed
+        union = UnionType(File, String)
+        union.subtypes = [IndexedBam(), IndexedVcf()]
+
+        self.assertListEqual(
+            [
+                ("a.vcf.gz", PATH_FILE),
+                ("a.vcf.gz.tbi", PATH_FILE),
+                ("a.vcf.gz.md5", PATH_FILE),
+            ],
+            get_expected_paths(union, "a.vcf.gz"),
+        )
+        self.assertListEqual(
+            [("a.bam", PATH_FILE), ("a.bam.bai", PATH_FILE), ("a.bam.md5", PATH_FILE)],
+            get_expected_paths(union, "a.bam"),
+        )
+        # neither extension, so only the secondaries of every subtype
+        self.assertListEqual(
+            [("a.cram", PATH_FILE), ("a.cram.md5", PATH_FILE)],
+            get_expected_paths(union, "a.cram"),
+        )
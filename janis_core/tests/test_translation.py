@@ -1,9 +1,26 @@
 import unittest
+from unittest import mock
 from os import getcwd
 import os.path
 
-from janis_core import String
+from janis_core import String, WorkflowBuilder
+from janis_core.tests.testtools import (
+    EchoTestTool,
+    CatTestTool,
+    TestWorkflowWithNestedSubworkflows,
+    TestWorkflowWithSubworkflow,
+)
 from janis_core.translationdeps.exportpath import ExportPathKeywords
+from janis_core.translationdeps.exportwriter import (
+    DirectoryWriter,
+    CallbackWriter,
+    ExportWriter,
+    ZipWriter,
+    build_zip,
+)
+from janis_core.translationdeps.translationcache import TranslationCache
+from janis_core.translationdeps.translationsession import TranslationSession
+from janis_core.translations import CwlTranslator, WdlTranslator, translate_many
 from janis_core.translations.translationbase import TranslatorBase
 
 
@@ -241,3 +258,595 @@ class TestExportPath(unittest.TestCase):
 #         # new interpretation: can't skip because default
 #         self.assertEqual(False, can_skip)
 #         # self.assertEqual(True, can_skip)
+
+
+class TestTranslationCache(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache = TranslationCache(self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_same_tool_same_key(self):
+        self.assertEqual(
+            TranslationCache.key_for("cwl", EchoTestTool()),
+            TranslationCache.key_for("cwl", EchoTestTool()),
+        )
+
+    def test_changed_tool_changes_key(self):
+        class ChangedEchoTestTool(EchoTestTool):
+            def container(self):
+                return "ubuntu:20.04"
+
+        self.assertNotEqual(
+            TranslationCache.key_for("cwl", EchoTestTool()),
+            TranslationCache.key_for("cwl", ChangedEchoTestTool()),
+        )
+
+    def test_options_change_key(self):
+        self.assertNotEqual(
+            TranslationCache.key_for("cwl", EchoTestTool()),
+            TranslationCache.key_for(
+                "cwl", EchoTestTool(), with_resource_overrides=True
+            ),
+        )
+
+    def test_translation_is_identical(self):
+        for translator in [CwlTranslator(), WdlTranslator()]:
+            wf = TestWorkflowWithSubworkflow()
+            expected = translator.translate(wf, to_console=False)
+            first = translator.translate(wf, to_console=False, cache=self.cache)
+            second = translator.translate(wf, to_console=False, cache=self.cache)
+            self.assertEqual(expected, first)
+            self.assertEqual(expected, second)
+
+    def test_only_changed_tool_is_translated(self):
+        wf = TestWorkflowWithSubworkflow()
+        CwlTranslator().translate(wf, to_console=False, cache=self.cache)
+        self.assertEqual(0, self.cache.hits)
+        self.assertEqual(2, self.cache.misses)
+
+        class ChangedCatTestTool(CatTestTool):
+            def container(self):
+                return "ubuntu:20.04"
+
+        wf = TestWorkflowWithSubworkflow(ChangedCatTestTool)
+        CwlTranslator().translate(wf, to_console=False, cache=self.cache)
+        self.assertEqual(1, self.cache.hits)
+        self.assertEqual(3, self.cache.misses)
+
+    def test_eviction(self):
+        cache = TranslationCache(self.tmpdir.name, max_size=10)
+        cache.set("a", "0123456")
+        cache.set("b", "0123456")
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual("0123456", cache.get("b"))
+        self.assertLessEqual(cache.size(), 10)
+
+    def test_overwrite(self):
+        cache = TranslationCache(self.tmpdir.name, max_size=100)
+        cache.set("a", "0123")
+        cache.set("b", "012")
+        cache.set("a", "0123456")
+        cache.set("a", "0123456")
+        # the running total only counts the latest value of the overwritten key
+        self.assertEqual(10, cache._size)
+        self.assertEqual(cache.size(), cache._size)
+        self.assertEqual("0123456", cache.get("a"))
+
+
+class TestParallelTranslation(unittest.TestCase):
+    def test_translation_is_identical(self):
+        wf = TestWorkflowWithSubworkflow()
+        for translator in [CwlTranslator(), WdlTranslator()]:
+            self.assertEqual(
+                translator.translate(wf, to_console=False),
+                translator.translate(wf, to_console=False, parallel=2),
+            )
+
+    def test_unpicklable_tool_falls_back(self):
+        class LocalCatTestTool(CatTestTool):
+            pass
+
+        wf = TestWorkflowWithSubworkflow(LocalCatTestTool)
+        self.assertEqual(
+            CwlTranslator().translate(wf, to_console=False),
+            CwlTranslator().translate(wf, to_console=False, parallel=2),
+        )
+
+    def test_unique_tools(self):
+        wf = TestWorkflowWithSubworkflow()
+        self.assertListEqual(
+            ["EchoTestTool_TEST", "CatTestTool_TEST"],
+            list(CwlTranslator.get_unique_tools(wf)),
+        )
+
+    def test_tools_are_translated_in_pool(self):
+        wf = TestWorkflowWithSubworkflow()
+        session = TranslationSession()
+        CwlTranslator.translate_tools_in_parallel(wf, parallel=2, session=session)
+        self.assertSetEqual(
+            {"EchoTestTool_TEST", "CatTestTool_TEST"}, {k[1] for k in session.tools}
+        )
+        self.assertTrue(all(isinstance(t, str) for t in session.tools.values()))
+        self.assertEqual(2, session.tool_translations)
+
+
+class TestTranslationSession(unittest.TestCase):
+
+    def test_each_tool_translated_once(self):
+        for translator in [CwlTranslator, WdlTranslator]:
+            session = TranslationSession()
+            _, tools = translator.translate_workflow(
+                TestWorkflowWithNestedSubworkflows(), session=session
+            )
+            self.assertSetEqual(
+                {
+                    "TestMidWorkflow1",
+                    "TestMidWorkflow2",
+                    "TestSubworkflow",
+                    "EchoTestTool_TEST",
+                    "CatTestTool_TEST",
+                },
+                set(tools.keys()),
+            )
+            self.assertEqual(2, session.tool_translations)
+            self.assertEqual(3, session.workflow_translations)
+            self.assertGreaterEqual(session.workflow_hits, 1)
+
+    def test_session_is_shared_between_exports(self):
+        session = TranslationSession()
+        wf = TestWorkflowWithNestedSubworkflows()
+        first = CwlTranslator().translate(wf, to_console=False, session=session)
+        second = CwlTranslator().translate(wf, to_console=False, session=session)
+        self.assertEqual(first, second)
+        self.assertEqual(first, CwlTranslator().translate(wf, to_console=False))
+        self.assertEqual(2, session.tool_translations)
+        self.assertEqual(3, session.workflow_translations)
+
+    def test_options_are_memoized_separately(self):
+        session = TranslationSession()
+        wf = TestWorkflowWithNestedSubworkflows()
+        CwlTranslator.translate_workflow(wf, session=session)
+        CwlTranslator.translate_workflow(
+            wf, with_resource_overrides=True, session=session
+        )
+        self.assertEqual(4, session.tool_translations)
+
+    def test_tools_keyed_by_versioned_id(self):
+        from janis_core.tests.testtools import TestTool, TestToolV2
+
+        w = WorkflowBuilder("session_versions")
+        w.input("inp", str)
+        w.step("stp1", TestTool(testtool=w.inp))
+        w.step("stp2", TestToolV2(testtool=w.inp))
+
+        _, tools = CwlTranslator.translate_workflow(w)
+        self.assertSetEqual(
+            {"TestTranslationtool", "TestTranslationtool_v0_0_2"}, set(tools)
+        )
+
+    def test_tools_keyed_by_structure(self):
+        from janis_core import CommandToolBuilder, ToolInput, ToolOutput, Stdout
+
+        session = TranslationSession()
+        for command in ["echo", "cat"]:
+            tool = CommandToolBuilder(
+                tool="session_same_id",
+                base_command=command,
+                inputs=[ToolInput("inp", str, position=0)],
+                outputs=[ToolOutput("out", Stdout())],
+                container="ubuntu:latest",
+                version="dev",
+            )
+            w = WorkflowBuilder("session_structure_" + command)
+            w.input("inp", str)
+            w.step("stp1", tool(inp=w.inp))
+            _, tools = CwlTranslator.translate_workflow(w, session=session)
+            self.assertEqual(command, tools["session_same_id_dev"].baseCommand)
+        self.assertEqual(2, session.tool_translations)
+
+    def test_cache_and_session_conflict(self):
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as d:
+            self.assertRaises(
+                Exception,
+                TranslationSession.try_get_session,
+                TranslationSession(),
+                cache=TranslationCache(d),
+            )
+
+
+class TestTranslateMany(unittest.TestCase):
+
+    def test_results_match_translate(self):
+        wfs = [
+            TestWorkflowWithSubworkflow(identifier="many_wf1"),
+            TestWorkflowWithSubworkflow(identifier="many_wf2"),
+        ]
+        results, _ = translate_many(wfs, translations=["cwl", "wdl"])
+        self.assertSetEqual({"many_wf1", "many_wf2"}, set(results))
+        for w in wfs:
+            self.assertEqual(
+                CwlTranslator().translate(w, to_console=False),
+                results[w.versioned_id()]["cwl"],
+            )
+            self.assertEqual(
+                WdlTranslator().translate(w, to_console=False),
+                results[w.versioned_id()]["wdl"],
+            )
+
+    def test_shared_tools_are_translated_once(self):
+        wfs = [TestWorkflowWithSubworkflow(identifier=f"many_wf{i}") for i in range(3)]
+        _, summary = translate_many(wfs, translations=["cwl"])
+        self.assertEqual(2, summary["tool_translations"])
+        # the EchoTestTool is used twice in the first
+        self.assertEqual(5, summary["tool_hits"])
+        self.assertEqual(6, summary["stringify_hits"])
+
+    def test_parallel(self):
+        wfs = [
+            TestWorkflowWithSubworkflow(identifier="many_wf1"),
+            TestWorkflowWithSubworkflow(identifier="many_wf2"),
+        ]
+        results, summary = translate_many(wfs, translations=["cwl"], parallel=2)
+        self.assertEqual(translate_many(wfs, translations=["cwl"])[0], results)
+        self.assertEqual(2, summary["tool_translations"])
+
+    def test_summary_has_cache_hits(self):
+        import tempfile
+
+        wfs = [TestWorkflowWithSubworkflow(identifier="many_wf1")]
+        with tempfile.TemporaryDirectory() as d:
+            translate_many(wfs, translations=["cwl"], cache=d)
+            _, summary = translate_many(wfs, translations=["cwl"], cache=d)
+        self.assertEqual(2, summary["cache_hits"])
+        self.assertEqual(0, summary["cache_misses"])
+
+    def test_duplicate_ids(self):
+        wfs = [
+            TestWorkflowWithSubworkflow(identifier="many_wf1"),
+            TestWorkflowWithSubworkflow(identifier="many_wf1"),
+        ]
+        self.assertRaises(Exception, translate_many, wfs, translations=["cwl"])
+
+
+class TestTimingReport(unittest.TestCase):
+
+    def test_timings_are_opt_in(self):
+        session = TranslationSession()
+        CwlTranslator().translate(
+            TestWorkflowWithSubworkflow(), to_console=False, session=session
+        )
+        self.assertListEqual([], session.timing_reports)
+
+    def test_phases_and_tools(self):
+        for translator in [CwlTranslator(), WdlTranslator()]:
+            session = TranslationSession()
+            translator.translate(
+                TestWorkflowWithSubworkflow(),
+                to_console=False,
+                session=session,
+                timings=True,
+            )
+            report = session.timing_reports[0]
+            self.assertEqual("TestWorkflowWithSubworkflow", report.name)
+            for phase in [
+                "translate_workflow",
+                "translate_tool",
+                "unwrap_expression",
+                "build_inputs_file",
+                "stringify",
+            ]:
+                self.assertIn(phase, report.phases)
+            self.assertEqual(2, report.phases["translate_tool"].calls)
+            self.assertSetEqual(
+                {"TestSubworkflow", "EchoTestTool_TEST", "CatTestTool_TEST"},
+                set(report.tools),
+            )
+            self.assertGreaterEqual(
+                report.total_seconds, report.phases["translate_workflow"].seconds
+            )
+
+    def test_reentered_phase_is_timed_once(self):
+        from janis_core.translationdeps.timingreport import (
+            TimingReport,
+            recording,
+            timed,
+        )
+
+        report = TimingReport()
+        with recording(report):
+            with timed("outer"):
+                with timed("outer"):
+                    pass
+        self.assertEqual(2, report.phases["outer"].calls)
+        self.assertLessEqual(report.phases["outer"].seconds, report.total_seconds)
+
+    def test_written_next_to_export(self):
+        import json
+        import tempfile
+        from janis_core.translationdeps.timingreport import TimingReport
+
+        with tempfile.TemporaryDirectory() as d:
+            CwlTranslator().translate(
+                TestWorkflowWithSubworkflow(),
+                to_console=False,
+                to_disk=True,
+                export_path=d,
+                timings=True,
+            )
+            with open(os.path.join(d, TimingReport.FILENAME)) as f:
+                timings = json.load(f)
+        self.assertIn("write_to_disk", timings["phases"])
+        self.assertIn("zip", timings["phases"])
+        self.assertEqual(1, timings["tools"]["CatTestTool_TEST"]["calls"])
+
+    @mock.patch("janis_core.translationdeps.timingreport.TimingReport.log")
+    def test_logged_without_session_or_to_disk(self, log):
+        from janis_core.translations import translate_many
+
+        CwlTranslator().translate(
+            TestWorkflowWithSubworkflow(), to_console=False, timings=True
+        )
+        self.assertEqual(1, log.call_count)
+        translate_many(
+            [
+                TestWorkflowWithSubworkflow(identifier="timings_wf1"),
+                TestWorkflowWithSubworkflow(identifier="timings_wf2"),
+            ],
+            ["cwl"],
+            timings=True,
+        )
+        self.assertEqual(3, log.call_count)
+
+        # the report is kept by the session provided instead
+        session = TranslationSession()
+        CwlTranslator().translate(
+            TestWorkflowWithSubworkflow(),
+            to_console=False,
+            session=session,
+            timings=True,
+        )
+        self.assertEqual(3, log.call_count)
+        self.assertEqual(1, len(session.timing_reports))
+
+    def test_translate_many_with_session(self):
+        from janis_core.translations import translate_many
+
+        session = TranslationSession()
+        translate_many(
+            [TestWorkflowWithSubworkflow()], ["cwl"], session=session, timings=True
+        )
+        self.assertEqual(1, len(session.timing_reports))
+
+
+class TestIncrementalExport(unittest.TestCase):
+    def setUp(self):
+        import tempfile
+
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def export(self, wf, incremental=True):
+        session = TranslationSession()
+        CwlTranslator().translate(
+            wf,
+            to_console=False,
+            to_disk=True,
+            export_path=self.tmpdir.name,
+            should_zip=False,
+            session=session,
+            incremental=incremental,
+        )
+        return session.export_reports[0]
+
+    def test_first_export_writes_everything(self):
+        report = self.export(TestWorkflowWithSubworkflow())
+        self.assertEqual(5, len(report.written))
+        self.assertEqual(0, len(report.skipped))
+
+    def test_unchanged_export_skips_everything(self):
+        wf = TestWorkflowWithSubworkflow()
+        self.export(wf)
+        path = os.path.join(self.tmpdir.name, "tools", "EchoTestTool_TEST.cwl")
+        mtime = os.stat(path).st_mtime_ns
+
+        report = self.export(wf)
+        self.assertEqual(0, len(report.written))
+        self.assertEqual(5, len(report.skipped))
+        self.assertEqual(mtime, os.stat(path).st_mtime_ns)
+
+    def test_only_changed_tool_is_written(self):
+        self.export(TestWorkflowWithSubworkflow())
+
+        class ChangedCatTestTool(CatTestTool):
+            def container(self):
+                return "ubuntu:20.04"
+
+        report = self.export(TestWorkflowWithSubworkflow(ChangedCatTestTool))
+        self.assertListEqual(["tools/CatTestTool_TEST.cwl"], report.written)
+
+    def test_without_manifest(self):
+        wf = TestWorkflowWithSubworkflow()
+        self.export(wf)
+        os.remove(os.path.join(self.tmpdir.name, DirectoryWriter.MANIFEST_FILENAME))
+        self.assertEqual(0, len(self.export(wf).written))
+
+    def test_not_incremental_writes_everything(self):
+        wf = TestWorkflowWithSubworkflow()
+        self.export(wf, incremental=False)
+        report = self.export(wf, incremental=False)
+        self.assertEqual(5, len(report.written))
+        self.assertFalse(
+            os.path.exists(
+                os.path.join(self.tmpdir.name, DirectoryWriter.MANIFEST_FILENAME)
+            )
+        )
+
+
+class TestToolsZip(unittest.TestCase):
+    files = [("tools/b.cwl", "b: 2\n"), ("tools/a.cwl", "a: 1\n")]
+
+    def test_zip_is_reproducible(self):
+        self.assertEqual(build_zip(self.files), build_zip(list(reversed(self.files))))
+
+    def test_zip_entries(self):
+        import io
+        import zipfile
+
+        with zipfile.ZipFile(io.BytesIO(build_zip(self.files))) as zf:
+            self.assertListEqual(
+                ["tools/", "tools/a.cwl", "tools/b.cwl"], zf.namelist()
+            )
+            self.assertEqual(b"a: 1\n", zf.read("tools/a.cwl"))
+            self.assertEqual((1980, 1, 1, 0, 0, 0), zf.getinfo("tools/b.cwl").date_time)
+
+    def test_compression_level(self):
+        import io
+        import zipfile
+
+        files = [("tools/a.cwl", "a" * 1000)]
+        stored, compressed = build_zip(files, 0), build_zip(files, 9)
+        self.assertGreater(len(stored), len(compressed))
+        with zipfile.ZipFile(io.BytesIO(stored)) as zf:
+            self.assertEqual(
+                zipfile.ZIP_STORED, zf.getinfo("tools/a.cwl").compress_type
+            )
+
+    def test_export_zip(self):
+        import tempfile
+        import zipfile
+
+        w = WorkflowBuilder("zip_wf")
+        w.input("inp", str)
+        w.step("stp1", EchoTestTool(inp=w.inp))
+        w.output("out", source=w.stp1.out)
+
+        with tempfile.TemporaryDirectory() as d:
+            _, _, str_tools = CwlTranslator().translate(
+                w, to_console=False, to_disk=True, export_path=d
+            )
+            with zipfile.ZipFile(os.path.join(d, "tools.zip")) as zf:
+                self.assertEqual(str_tools[0][1], zf.read(str_tools[0][0]).decode())
+
+
+class TestStreamingTranslation(unittest.TestCase):
+
+    def test_stream_is_identical(self):
+        wf = TestWorkflowWithSubworkflow()
+        for translator in [CwlTranslator(), WdlTranslator()]:
+            str_tool, str_inp, str_tools = translator.translate(wf, to_console=False)
+            expected = {
+                translator.workflow_filename(wf): str_tool,
+                translator.inputs_filename(wf): str_inp,
+                **dict(str_tools),
+            }
+            self.assertDictEqual(expected, dict(translator.translate_iter(wf)))
+
+    def test_stream_tool(self):
+        translator, tool = CwlTranslator(), EchoTestTool()
+        str_tool, str_inp, _ = translator.translate(tool, to_console=False)
+        self.assertListEqual(
+            [
+                (translator.workflow_filename(tool), str_tool),
+                (translator.inputs_filename(tool), str_inp),
+            ],
+            list(translator.translate_iter(tool)),
+        )
+
+    def test_stream_in_session(self):
+        wf = TestWorkflowWithSubworkflow()
+        for translator in [CwlTranslator(), WdlTranslator()]:
+            expected = dict(translator.translate_iter(wf))
+            session = TranslationSession()
+            for _ in range(2):
+                self.assertDictEqual(
+                    expected, dict(translator.translate_iter(wf, session=session))
+                )
+            self.assertEqual(2, session.tool_translations)
+            self.assertEqual(2, session.tool_hits)
+
+            tool = EchoTestTool()
+            self.assertListEqual(
+                list(translator.translate_iter(tool)),
+                list(translator.translate_iter(tool, session=session)),
+            )
+
+    def test_stream_with_cache(self):
+        import tempfile
+
+        wf = TestWorkflowWithSubworkflow()
+        with tempfile.TemporaryDirectory() as d:
+            first = dict(CwlTranslator().translate_iter(wf, cache=d))
+            session = TranslationSession(cache=d)
+            self.assertDictEqual(
+                first, dict(CwlTranslator().translate_iter(wf, session=session))
+            )
+            self.assertEqual(0, session.tool_translations)
+
+    def test_callback_writer(self):
+        files = []
+        report = CwlTranslator().translate_to_writer(
+            TestWorkflowWithSubworkflow(),
+            CallbackWriter(lambda path, content: files.append(path)),
+            write_inputs_file=False,
+        )
+        self.assertListEqual(
+            [
+                "tools/TestSubworkflow.cwl",
+                "tools/EchoTestTool_TEST.cwl",
+                "tools/CatTestTool_TEST.cwl",
+                "TestWorkflowWithSubworkflow.cwl",
+            ],
+            files,
+        )
+        self.assertListEqual(files, report.written)
+
+    def test_writer_must_implement_write(self):
+        class NoWriteWriter(ExportWriter):
+            pass
+
+        self.assertRaises(TypeError, ExportWriter)
+        self.assertRaises(TypeError, NoWriteWriter)
+
+    def test_zip_writer(self):
+        import io
+        import zipfile
+
+        buffer = io.BytesIO()
+        CwlTranslator().translate_to_writer(
+            TestWorkflowWithSubworkflow(), ZipWriter(buffer)
+        )
+        with zipfile.ZipFile(buffer) as zf:
+            self.assertListEqual(
+                [
+                    "tools/",
+                    "tools/TestSubworkflow.cwl",
+                    "tools/EchoTestTool_TEST.cwl",
+                    "tools/CatTestTool_TEST.cwl",
+                    "TestWorkflowWithSubworkflow.cwl",
+                    "TestWorkflowWithSubworkflow-inp.yml",
+                ],
+                zf.namelist(),
+            )
+
+    def test_directory_writer(self):
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as d:
+            CwlTranslator().translate_to_writer(
+                TestWorkflowWithSubworkflow(), DirectoryWriter(d)
+            )
+            self.assertTrue(
+                os.path.exists(os.path.join(d, "TestWorkflowWithSubworkflow.cwl"))
+            )
+            self.assertTrue(
+                os.path.exists(os.path.join(d, "tools", "EchoTestTool_TEST.cwl"))
+            )
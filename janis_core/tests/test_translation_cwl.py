@@ -17,6 +17,7 @@ from janis_core.tests.testtools import (
     FilenameGeneratedTool,
     OperatorResourcesTestTool,
     TestForEach,
+    TestWorkflowWithSubworkflow,
 )
 
 from janis_core.deps import cwlgen
@@ -127,6 +128,60 @@ id: tid
         self.assertEqual("wid-resources.yml", self.translator.resources_filename(w))
 
 
+class TestCwlEmitter(unittest.TestCase):
+    """
+    The cwlformat (should_format) output is the reference for the native emitter
+    """
+
+    @staticmethod
+    def cwlformat(saved):
+        from cwlformat.formatter import cwl_format
+
+        return cwl_format(
+            cwl.SHEBANG + "\n" + CwlTranslator.stringify_commentedmap(saved)
+        )
+
+    def assertMatchesCwlFormat(self, saved):
+        from janis_core.translationdeps.cwlemitter import emit_cwl
+
+        self.maxDiff = None
+        self.assertEqual(self.cwlformat(saved), emit_cwl(saved))
+
+    def test_tools(self):
+        for tool in [TestTool(), SingleTestTool(), ArrayTestTool(), EchoTestTool()]:
+            self.assertMatchesCwlFormat(
+                CwlTranslator.translate_tool_internal(
+                    tool, allow_empty_container=True
+                ).save()
+            )
+
+    def test_workflows(self):
+        for wf in [TestWorkflowWithStepInputExpression(), TestForEach()]:
+            w, tools = CwlTranslator.translate_workflow(wf)
+            self.assertMatchesCwlFormat(w.save())
+            for t in tools.values():
+                self.assertMatchesCwlFormat(t.save())
+
+    def test_scalars(self):
+        self.assertMatchesCwlFormat(
+            {
+                "class": "CommandLineTool",
+                "id": "scalars",
+                "baseCommand": ["echo"],
+                "zzz": {},
+                "inputs": [
+                    {"id": "a", "type": "string", "default": "1.0"},
+                    {"id": "b", "type": "float", "default": 1e-5},
+                    {"id": "c", "type": "string", "default": "yes"},
+                    {"id": "d", "doc": "line1\nline2"},
+                    {"id": "e", "doc": "word " * 30},
+                    {"id": "f", "default": None, "aaa": []},
+                    {"id": "g", "valueFrom": '$(inputs.x)  # q: "x"'},
+                ],
+            }
+        )
+
+
 class TestCwlArraySeparators(unittest.TestCase):
     # Based on https://www.commonwl.org/user_guide/09-array-inputs/index.html
 
@@ -629,6 +684,71 @@ class TestPackedWorkflow(unittest.TestCase):
         print(CwlTranslator.stringify_translated_workflow(c))
 
 
+class TestPackedExport(unittest.TestCase):
+    def test_each_tool_defined_once(self):
+        import ruamel.yaml
+
+        str_wf, _, str_tools = CwlTranslator().translate(
+            TestWorkflowWithSubworkflow(), to_console=False, packed=True
+        )
+        self.assertListEqual([], str_tools)
+
+        d = ruamel.yaml.load(str_wf, Loader=ruamel.yaml.Loader)
+        self.assertEqual(cwl.CWL_VERSION, d["cwlVersion"])
+        self.assertListEqual(
+            ["TestSubworkflow", "EchoTestTool_TEST", "CatTestTool_TEST", "main"],
+            [t["id"] for t in d["$graph"]],
+        )
+        self.assertTrue(all("cwlVersion" not in t for t in d["$graph"]))
+
+        main = d["$graph"][-1]
+        self.assertListEqual(
+            ["#TestSubworkflow", "#CatTestTool_TEST", "#EchoTestTool_TEST"],
+            [s["run"] for s in main["steps"]],
+        )
+        self.assertEqual("#EchoTestTool_TEST", d["$graph"][0]["steps"][0]["run"])
+
+    def test_packed_json(self):
+        import json
+
+        str_wf, _, _ = CwlTranslator().translate(
+            TestWorkflowWithSubworkflow(), to_console=False, packed=True, as_json=True
+        )
+        d = json.loads(str_wf)
+        self.assertEqual(4, len(d["$graph"]))
+
+    def test_packed_to_disk(self):
+        import os
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as d:
+            CwlTranslator().translate(
+                TestWorkflowWithSubworkflow(),
+                to_console=False,
+                to_disk=True,
+                export_path=d,
+                packed=True,
+            )
+            self.assertSetEqual(
+                {
+                    "TestWorkflowWithSubworkflow.cwl",
+                    "TestWorkflowWithSubworkflow-inp.yml",
+                },
+                set(os.listdir(d)),
+            )
+
+    def test_packed_unsupported(self):
+        from janis_core.translations import WdlTranslator
+
+        self.assertRaises(
+            Exception,
+            WdlTranslator().translate,
+            TestWorkflowWithSubworkflow(),
+            to_console=False,
+            packed=True,
+        )
+
+
 class TestContainerOverride(unittest.TestCase):
     def test_tool_dict_override(self):
         import ruamel.yaml
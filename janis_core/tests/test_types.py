@@ -1,8 +1,12 @@
 import unittest
+from copy import copy
 from typing import Optional, List, Union
 
 from janis_core import Array, String, Stdout, File, Int, Float, Boolean
 from janis_core.types import get_instantiated_type, get_from_python_type
+from janis_core.tool.commandtool import ToolInput
+from janis_core.types.data_types import intern_type
+from janis_core.utils.fingerprint import fingerprint
 
 
 class DataTypeWithSecondary(File):
@@ -143,3 +147,68 @@ class TestPythonAnnotations(unittest.TestCase):
         st = t.subtype()
         self.assertTrue(st.optional)
         self.assertIsInstance(st, String)
+
+
+class TestInternedTypes(unittest.TestCase):
+    def test_instantiated_class_is_shared(self):
+        self.assertIs(get_instantiated_type(String), get_instantiated_type(String))
+        self.assertIs(
+            get_instantiated_type(File, optional=True),
+            get_instantiated_type(File, optional=True),
+        )
+        self.assertIsNot(
+            get_instantiated_type(File), get_instantiated_type(File, optional=True)
+        )
+
+    def test_nested_types_are_shared(self):
+        a1, a2 = intern_type(Array(File)), intern_type(Array(File()))
+        self.assertIs(a1, a2)
+        self.assertIs(a1.subtype(), get_instantiated_type(File))
+        self.assertIsNot(a1, intern_type(Array(File(optional=True))))
+
+    def test_interned_type_is_frozen(self):
+        t = get_instantiated_type(Int)
+        self.assertTrue(t.is_interned())
+        self.assertRaises(Exception, setattr, t, "optional", True)
+        self.assertFalse(t.optional)
+
+    def test_with_optional(self):
+        t = get_instantiated_type(Int)
+        opt = t.with_optional(True)
+        self.assertTrue(opt.optional)
+        self.assertFalse(t.optional)
+        self.assertIs(opt, get_instantiated_type(Int, optional=True))
+        self.assertIs(t, t.with_optional(False))
+
+    def test_copy_is_mutable(self):
+        t = get_instantiated_type(String)
+        for copied in (copy(t), t.copy()):
+            self.assertFalse(copied.is_interned())
+            copied.optional = True
+            self.assertTrue(copied.optional)
+        self.assertFalse(t.optional)
+
+    def test_passed_instance_isnt_frozen(self):
+        s = String()
+        self.assertIs(get_instantiated_type(s), s)
+        self.assertIsNot(intern_type(s), s)
+        s.optional = True
+        self.assertTrue(s.optional)
+
+    def test_same_fingerprint_as_constructed(self):
+        self.assertEqual(
+            fingerprint(ToolInput("xx", File)), fingerprint(ToolInput("xx", File()))
+        )
+        self.assertEqual(
+            fingerprint(intern_type(Array(File(optional=True)))),
+            fingerprint(Array(File(optional=True))),
+        )
+        self.assertNotEqual(
+            fingerprint(get_instantiated_type(File)),
+            fingerprint(get_instantiated_type(File, optional=True)),
+        )
+
+    def test_stdout_isnt_interned(self):
+        s = Stdout(File, optional=True)
+        self.assertIs(intern_type(s), s)
+        self.assertFalse(s.received_type().optional)
@@ -1,6 +1,8 @@
 import unittest
 
-from janis_core import Array, String, Int
+from janis_core import Array, String, Int, Float, Boolean, File, Directory
+from janis_core.types import UnionType
+from janis_core.types.common_data_types import Filename
 
 
 class TestValidateInputvalue(unittest.TestCase):
@@ -41,3 +43,46 @@ class TestValidateInputvalue(unittest.TestCase):
 
     def test_int_invalid_float(self):
         self.assertFalse(Array(Int()).validate_value(2.0, True))
+
+
+class TestValidateValues(unittest.TestCase):
+    def test_valid(self):
+        self.assertEqual([], String().validate_values(["aa", "bb", 2, 3.0], False))
+        self.assertEqual([], File().validate_values(["a.txt"] * 100, False))
+
+    def test_invalid_indices(self):
+        self.assertEqual([1, 3], Int().validate_values([1, "2", 3, 4.0, True], False))
+        self.assertEqual([2], Float().validate_values([1, 2.0, "3"], False))
+        self.assertEqual([0, 2], Directory().validate_values([1, "dir", []], False))
+
+    def test_nulls(self):
+        values = ["aa", None, "bb", None]
+        self.assertEqual([1, 3], String().validate_values(values, False))
+        self.assertEqual([], String().validate_values(values, True))
+        self.assertEqual([], String(optional=True).validate_values(values, False))
+
+    def test_matches_validate_value(self):
+        values = [1, "2", None, 3.0, True, [], {}, "true"]
+        for dt in (String(), Int(), Float(), Boolean(), File(), Array(String())):
+            self.assertEqual(
+                [i for i, v in enumerate(values) if not dt.validate_value(v, False)],
+                dt.validate_values(values, False),
+            )
+
+    def test_subclass_validate_value(self):
+        # Filename accepts anything, so doesn't use the (String) isinstance check
+        self.assertEqual([], Filename().validate_values([None, []], False))
+
+    def test_union(self):
+        self.assertEqual(
+            [2, 3], UnionType(Int, File).validate_values([1, "a", 2.0, None], False)
+        )
+
+    def test_array(self):
+        self.assertEqual(
+            [1, 2], Array(Int()).validate_values([[1, 2], [1, "2"], 3, None], True)
+        )
+        hint = Array(Int()).invalid_value_hint([1, "2", 3])
+        self.assertIn("1. ", hint)
+        self.assertNotIn("0. ", hint)
+        self.assertIsNone(Array(Int()).invalid_value_hint([1, 2, 3]))
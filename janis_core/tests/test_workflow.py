@@ -1,3 +1,4 @@
+import copy
 from unittest import TestCase
 
 from janis_core.operators import InputNodeSelector
@@ -8,12 +9,23 @@ from janis_core import (
     Array,
     Logger,
     String,
+    Workflow,
     WorkflowBuilder,
     InputDocumentation,
     InputQualityType,
+    ForEachSelector,
 )
 from janis_core.graph.steptaginput import StepTagInput, first_value, Edge
-from janis_core.tests.testtools import SingleTestTool, ArrayTestTool
+from janis_core.tests.testtools import (
+    SingleTestTool,
+    ArrayTestTool,
+    EchoTestTool,
+    TestBranchingSubworkflow,
+    TestBranchingWorkflow,
+    TestForEach,
+    TestResourcesWorkflow,
+    resources_test_tool,
+)
 
 
 class TestWorkflow(TestCase):
@@ -358,3 +370,581 @@ class TestCaptureInputsFromTool(TestCase):
 
         self.assertEqual(len(Tool.tool_inputs()) - 1, len(d))
         self.assertNotIn("input1", d)
+
+
+class TestNodeRegistry(TestCase):
+    def test_dropped_workflows_are_freed(self):
+        import gc
+        import tracemalloc
+        import weakref
+        from janis_core.graph.node import Node
+
+        # warm up any lazily built (module level) state
+        for _ in range(10):
+            TestBranchingSubworkflow()
+        gc.collect()
+        n_registered = len(Node._N_nodeId_map)
+
+        tracemalloc.start()
+        try:
+            before = tracemalloc.get_traced_memory()[0]
+            refs = []
+            for _ in range(1000):
+                refs.append(weakref.ref(TestBranchingSubworkflow()))
+            gc.collect()
+            growth = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+
+        self.assertEqual(0, sum(r() is not None for r in refs))
+        self.assertLessEqual(len(Node._N_nodeId_map), n_registered)
+        # the weakrefs themselves are ~100 KB, 1000 live workflows would be ~5 MB
+        self.assertLess(growth, 1024 * 1024)
+
+
+class TestTopologicalOrder(TestCase):
+    def setUp(self):
+        Logger.mute()
+
+    def tearDown(self):
+        Logger.unmute()
+
+    def test_depths(self):
+        w = TestBranchingWorkflow()
+        self.assertDictEqual(
+            {
+                "inp": 0,
+                "unused": 0,
+                "stp1": 1,
+                "stp2": 2,
+                "stp3": 2,
+                "stp4": 1,
+                "sub": 3,
+                "out": 3,
+                "out4": 2,
+                "outsub": 4,
+            },
+            {k: n.depth for k, n in w.nodes.items()},
+        )
+        self.assertEqual(3, w.max_depth())
+
+    def test_order_and_levels(self):
+        w = TestBranchingWorkflow()
+        self.assertListEqual(
+            [
+                "inp",
+                "unused",
+                "stp1",
+                "stp4",
+                "stp2",
+                "stp3",
+                "out4",
+                "sub",
+                "out",
+                "outsub",
+            ],
+            [n.id() for n in w.topological_order()],
+        )
+        self.assertListEqual(
+            [
+                ["inp", "unused"],
+                ["stp1", "stp4"],
+                ["stp2", "stp3", "out4"],
+                ["sub", "out"],
+                ["outsub"],
+            ],
+            [[n.id() for n in level] for level in w.levels()],
+        )
+
+    def test_foreach(self):
+        w = WorkflowBuilder("topological_foreach")
+        w.input("inps", Array(String))
+        w.step("stp1", ArrayTestTool(inps=w.inps))
+        # stp2 only depends on stp1 through its foreach
+        w.step("stp2", EchoTestTool(inp=ForEachSelector()), _foreach=w.stp1.outs)
+        w.output("out", source=w.stp2.out)
+        self.assertDictEqual(
+            {"inps": 0, "stp1": 1, "stp2": 2, "out": 3},
+            {k: n.depth for k, n in w.nodes.items()},
+        )
+        self.assertEqual(2, w.max_depth())
+        self.assertListEqual(
+            [["inps"], ["stp1"], ["stp2"], ["out"]],
+            [[n.id() for n in level] for level in w.levels()],
+        )
+
+    def test_edge_added_later(self):
+        w = TestBranchingWorkflow()
+        w.stp3["input2"] = w.stp2.out
+        self.assertEqual(3, w.stp3.depth)
+        order = [n.id() for n in w.topological_order()]
+        self.assertLess(order.index("stp2"), order.index("stp3"))
+
+    def test_depth_propagates_downstream(self):
+        w = WorkflowBuilder("topological_propagate")
+        w.input("inp", String)
+        w.step("stp1", SingleTestTool(input1=w.inp))
+        w.step("stp2", SingleTestTool(input1=w.stp1.out))
+        w.step("stp3", SingleTestTool(input1=w.inp))
+        w.step("stp4", SingleTestTool(input1=w.stp3.out))
+        w.output("out", source=w.stp4.out)
+
+        w.stp3["input2"] = w.stp2.out
+        self.assertListEqual(
+            [0, 1, 2, 3, 4, 5],
+            [w.nodes[n].depth for n in ["inp", "stp1", "stp2", "stp3", "stp4", "out"]],
+        )
+
+    def test_cycle(self):
+        w = TestBranchingWorkflow()
+        self.assertRaises(Exception, w.stp1.__setitem__, "input2", w.stp2.out)
+        self.assertNotIn("input2", w.stp1.sources)
+
+
+class TestResourceEstimate(TestCase):
+    def setUp(self):
+        Logger.mute()
+
+    def tearDown(self):
+        Logger.unmute()
+
+    def test_critical_path(self):
+        estimate = TestResourcesWorkflow().estimate_resources(to_console=False)
+        self.assertListEqual(["slow"], estimate.critical_path)
+        self.assertEqual(100, estimate.critical_path_seconds)
+        self.assertEqual(10, estimate.steps["last"].start)
+
+    def test_peaks_with_scatter_widths(self):
+        estimate = TestResourcesWorkflow().estimate_resources(
+            scatter_widths={"scattered": 5}, to_console=False
+        )
+        # fast + slow + 5 shards of scattered all start at 0
+        self.assertEqual(7, estimate.peak_parallelism)
+        self.assertEqual(1 + 4 + 10, estimate.peak_cpus)
+        self.assertEqual(2 + 8 + 15, estimate.peak_memory)
+        self.assertListEqual(
+            [7, 1], [level["parallelism"] for level in estimate.levels]
+        )
+
+    def test_subworkflow(self):
+        sub = TestResourcesWorkflow()
+        w = WorkflowBuilder("estimate_outer")
+        w.input("inp", String)
+        w.input("inps", Array(String))
+        w.step("sub", sub(inp=w.inp, inps=w.inps))
+        w.step(
+            "after", resources_test_tool("after", 1, 1, 1)(inp=w.inp, inp2=w.sub.out)
+        )
+        estimate = w.estimate_resources(
+            scatter_widths={"sub.scattered": 5}, to_console=False
+        )
+        self.assertListEqual(["sub", "after"], estimate.critical_path)
+        self.assertEqual(101, estimate.critical_path_seconds)
+        self.assertEqual(15, estimate.steps["sub"].cpus)
+
+    def test_scattered_subworkflow_parallelism(self):
+        sub = TestResourcesWorkflow()
+        w = WorkflowBuilder("estimate_outer_scattered")
+        w.input("inp", String)
+        w.input("inps", Array(Array(String)))
+        w.step("sub", sub(inp=w.inp, inps=w.inps), scatter="inps")
+        w.step("after", resources_test_tool("after", 1, 1, 1)(inp=w.inp))
+        estimate = w.estimate_resources(
+            scatter_widths={"sub": 3, "sub.scattered": 5}, to_console=False
+        )
+        # each of the 3 shards runs fast + slow + 5 shards of scattered at once
+        self.assertEqual(21, estimate.steps["sub"].parallelism)
+        self.assertEqual(22, estimate.peak_parallelism)
+        self.assertListEqual([22], [level["parallelism"] for level in estimate.levels])
+
+    def test_foreach(self):
+        w = WorkflowBuilder("estimate_foreach")
+        w.input("inps", Array(String))
+        w.step("list", ArrayTestTool(inps=w.inps))
+        w.step(
+            "each",
+            resources_test_tool("each", 1, 1, 5)(inp=ForEachSelector()),
+            _foreach=w.list.outs,
+        )
+        estimate = w.estimate_resources(scatter_widths={"each": 3}, to_console=False)
+        # 'each' waits for the list it iterates over
+        self.assertListEqual(["list", "each"], estimate.critical_path)
+        self.assertEqual(86400, estimate.steps["each"].start)
+        self.assertEqual(3, estimate.steps["each"].scatter_width)
+
+    def test_defaults_and_outputs(self):
+        import json
+
+        w = WorkflowBuilder("estimate_defaults")
+        w.input("inp", String)
+        w.step("stp", SingleTestTool(input1=w.inp))
+        estimate = w.estimate_resources(to_console=False)
+        self.assertListEqual(
+            ["cpus", "memory", "disk", "time"], estimate.steps["stp"].defaulted
+        )
+        self.assertEqual(86400, estimate.critical_path_seconds)
+        self.assertEqual(2, len(estimate.table()))
+        self.assertEqual(estimate.to_dict(), json.loads(estimate.to_json()))
+
+
+class TestAdjacencyIndex(TestCase):
+    def setUp(self):
+        Logger.mute()
+
+    def tearDown(self):
+        Logger.unmute()
+
+    def test_upstream_and_downstream(self):
+        w = TestBranchingWorkflow()
+        self.assertListEqual(
+            ["stp1", "inp"], [n.id() for n in w.upstream_nodes("stp2")]
+        )
+        self.assertListEqual(
+            ["stp2", "stp3"], [n.id() for n in w.downstream_nodes("stp1")]
+        )
+        self.assertListEqual(
+            ["sub", "out"], [n.id() for n in w.downstream_nodes("stp2")]
+        )
+        self.assertListEqual([], w.downstream_nodes("stp3"))
+
+    def test_consumers(self):
+        w = TestBranchingWorkflow()
+        self.assertListEqual(
+            [("stp2", "input1"), ("stp3", "input1")],
+            [(n.id(), t) for n, t in w.consumers("stp1", "out")],
+        )
+        self.assertListEqual(
+            [("stp1", "input1"), ("stp2", "input2")],
+            [(n.id(), t) for n, t in w.consumers("inp")],
+        )
+        self.assertListEqual(
+            [("sub", "inp"), ("out", None)],
+            [(n.id(), t) for n, t in w.consumers("stp2")],
+        )
+
+    def test_foreach(self):
+        w = TestForEach()
+        self.assertListEqual(["inp"], [n.id() for n in w.upstream_nodes("print")])
+        self.assertListEqual(["print"], [n.id() for n in w.downstream_nodes("inp")])
+        self.assertListEqual(
+            [("print", None)], [(n.id(), t) for n, t in w.consumers("inp")]
+        )
+
+    def test_edge_added_later(self):
+        w = TestBranchingWorkflow()
+        w.stp3["input2"] = w.stp2.out
+        self.assertIn("stp2", [n.id() for n in w.upstream_nodes("stp3")])
+        self.assertIn(
+            ("stp3", "input2"), [(n.id(), t) for n, t in w.consumers("stp2", "out")]
+        )
+
+
+class TestPruning(TestCase):
+    def setUp(self):
+        Logger.mute()
+
+    def tearDown(self):
+        Logger.unmute()
+
+    def test_outputs(self):
+        w = TestBranchingWorkflow()
+        pruned = w.prune(outputs=["out", "outsub"])
+        self.assertEqual(w.id(), pruned.id())
+        self.assertListEqual(
+            ["inp", "stp1", "stp2", "sub", "out", "outsub"], list(pruned.nodes)
+        )
+        self.assertListEqual(["inp", "inner1", "out1"], list(pruned.sub.tool.nodes))
+
+    def test_steps(self):
+        w = TestBranchingWorkflow()
+        pruned = w.prune(steps=["stp4"])
+        self.assertListEqual(["unused", "stp4", "out4"], list(pruned.nodes))
+
+    def test_subworkflow_steps(self):
+        w = TestBranchingWorkflow()
+        pruned = w.prune(steps=["sub.inner2"])
+        # (out is kept, as its source is kept for the subworkflow)
+        self.assertListEqual(["inp", "stp1", "stp2", "sub", "out"], list(pruned.nodes))
+        self.assertListEqual(["inp", "inner2", "out2"], list(pruned.sub.tool.nodes))
+
+    def test_edge_added_later(self):
+        w = TestBranchingWorkflow()
+        w.stp4["input2"] = w.stp2.out
+        pruned = w.prune(outputs=["out4"])
+        self.assertListEqual(
+            ["inp", "unused", "stp1", "stp2", "stp4", "out4"], list(pruned.nodes)
+        )
+        self.assertSetEqual(
+            {"stp2", "unused"}, {n.id() for n in pruned.upstream_nodes("stp4")}
+        )
+
+    def test_foreach(self):
+        pruned = TestForEach().prune(outputs=["out"])
+        self.assertListEqual(["inp", "print", "out"], list(pruned.nodes))
+        self.assertIs(pruned.input_nodes["inp"], pruned.print.foreach.input_node)
+        self.assertListEqual(["inp"], [n.id() for n in pruned.upstream_nodes("print")])
+
+    def test_original_unchanged(self):
+        w = TestBranchingWorkflow()
+        nodes, subnodes = list(w.nodes), list(w.sub.tool.nodes)
+        w.prune(outputs=["outsub"])
+        self.assertListEqual(nodes, list(w.nodes))
+        self.assertListEqual(subnodes, list(w.sub.tool.nodes))
+        self.assertListEqual(
+            ["stp2", "stp3"], [n.id() for n in w.downstream_nodes("stp1")]
+        )
+
+    def test_translates(self):
+        pruned = TestBranchingWorkflow().prune(outputs=["out"])
+        tool, _, _ = pruned.translate(
+            "wdl", to_console=False, allow_empty_container=True
+        )
+        self.assertIn("as stp2", tool)
+        self.assertNotIn("stp3", tool)
+
+    def test_subworkflow_pruned_differently(self):
+        sub = TestBranchingWorkflow().sub.tool
+        w = WorkflowBuilder("pruning_twice")
+        w.input("inp", String)
+        w.step("sub1", sub(inp=w.inp))
+        w.step("sub2", sub(inp=w.inp))
+        w.output("out1", source=w.sub1.out1)
+        w.output("out2", source=w.sub2.out2)
+
+        pruned = w.prune(outputs=["out1", "out2"])
+        sub1, sub2 = pruned.sub1.tool, pruned.sub2.tool
+        self.assertNotEqual(sub1.id(), sub2.id())
+        self.assertListEqual(["out1"], list(sub1.output_nodes))
+        self.assertListEqual(["out2"], list(sub2.output_nodes))
+
+        _, _, tools = pruned.translate(
+            "cwl", to_console=False, allow_empty_container=True
+        )
+        exported = dict(tools)
+        self.assertIn("id: out1", exported[f"tools/{sub1.id()}.cwl"])
+        self.assertNotIn("id: out2", exported[f"tools/{sub1.id()}.cwl"])
+        self.assertIn("id: out2", exported[f"tools/{sub2.id()}.cwl"])
+
+    def test_unknown(self):
+        w = TestBranchingWorkflow()
+        self.assertRaises(Exception, w.prune)
+        self.assertRaises(Exception, w.prune, outputs=["out5"])
+        self.assertRaises(Exception, w.prune, steps=["stp5"])
+        self.assertRaises(Exception, w.prune, steps=["stp1.inner"])
+
+
+class TestBatch(TestCase):
+    def setUp(self):
+        Logger.mute()
+
+    def tearDown(self):
+        Logger.unmute()
+
+    def test_same_as_unbatched(self):
+        w = WorkflowBuilder("batch_wf")
+        w.input("inp", String)
+        with w.batch():
+            w.step("stp1", SingleTestTool(input1=w.inp))
+            w.step("stp2", SingleTestTool(input1=w.stp1.out, input2=w.inp))
+            w.output("out", source=w.stp2.out)
+
+        self.assertListEqual(["inp", "stp1", "stp2", "out"], list(w.nodes))
+        edges = w.stp2.sources["input1"].source_map
+        self.assertEqual(1, len(edges))
+        self.assertTrue(edges[0].compatible_types)
+        self.assertListEqual(
+            ["stp1", "inp"], [n.id() for n in w.upstream_nodes("stp2")]
+        )
+
+    def test_errors_reported_together(self):
+        w = WorkflowBuilder("batch_wf_errors")
+        w.input("inp", String)
+        with self.assertRaises(Exception) as e:
+            with w.batch():
+                w.step("1stp", SingleTestTool(input1=w.inp))
+                w.step("stp2", SingleTestTool(input1=w.inp, input5=w.inp))
+                w.step("stp3", SingleTestTool())
+        message = str(e.exception)
+        self.assertIn("Found 3 error(s)", message)
+        self.assertIn("'1stp'", message)
+        self.assertIn("input5", message)
+        self.assertIn("'input1' when creating 'stp3'", message)
+
+    def test_connect_missing_later(self):
+        w = WorkflowBuilder("batch_wf_later")
+        w.input("inp", String)
+        with w.batch():
+            w.step("stp1", SingleTestTool())
+            w.stp1["input1"] = w.inp
+        self.assertIn("input1", w.stp1.sources)
+
+    def test_duplicate_identifier(self):
+        w = WorkflowBuilder("batch_wf_duplicate")
+        w.input("inp", String)
+        with w.batch():
+            w.step("stp1", SingleTestTool(input1=w.inp))
+            self.assertRaises(Exception, w.step, "stp1", SingleTestTool(input1=w.inp))
+
+    def test_type_mismatch(self):
+        w = WorkflowBuilder("batch_wf_types")
+        w.input("inp", Array(String))
+        with self.assertRaises(Exception) as e:
+            with w.batch():
+                for i in range(3):
+                    w.step(f"stp{i}", SingleTestTool(input1=w.inp))
+        self.assertIn("Found 3 error(s)", str(e.exception))
+        for i in range(3):
+            self.assertIn(f"to 'stp{i}.input1'", str(e.exception))
+            edge = w.step_nodes[f"stp{i}"].sources["input1"].source_map[0]
+            self.assertFalse(edge.compatible_types)
+
+    def test_scatter_non_array(self):
+        w = WorkflowBuilder("batch_wf_scatter")
+        w.input("inp", String)
+        with self.assertRaises(Exception) as e:
+            with w.batch():
+                w.step("stp1", SingleTestTool(input1=w.inp), scatter="input1")
+                w.step("2stp", SingleTestTool(input1=w.inp))
+        message = str(e.exception)
+        self.assertIn("Found 2 error(s)", message)
+        self.assertIn("not an array", message)
+
+    def test_nested(self):
+        w = WorkflowBuilder("batch_wf_nested")
+        w.input("inp", String)
+        with self.assertRaises(Exception):
+            with w.batch():
+                with w.batch():
+                    w.step("stp1", SingleTestTool())
+                self.assertIsNotNone(w._batch)
+        self.assertIsNone(w._batch)
+
+
+class TestStructuralHash(TestCase):
+    def setUp(self):
+        Logger.mute()
+
+    def tearDown(self):
+        Logger.unmute()
+
+    def test_identical_structures(self):
+        self.assertEqual(
+            TestBranchingWorkflow().structural_hash(),
+            TestBranchingWorkflow().structural_hash(),
+        )
+        self.assertEqual(
+            SingleTestTool().structural_hash(), SingleTestTool().structural_hash()
+        )
+        self.assertNotEqual(
+            SingleTestTool().structural_hash(), ArrayTestTool().structural_hash()
+        )
+
+    def test_different_edge(self):
+        w1, w2 = TestBranchingWorkflow(), TestBranchingWorkflow()
+        w2.stp1["input2"] = w2.inp
+        self.assertNotEqual(w1.structural_hash(), w2.structural_hash())
+
+    def test_cached_until_changed(self):
+        w = TestBranchingWorkflow()
+        h = w.structural_hash()
+        self.assertEqual(h, w.structural_hash())
+        w.output("out2", source=w.stp1.out)
+        self.assertNotEqual(h, w.structural_hash())
+
+    def test_subworkflow_change(self):
+        w = TestBranchingWorkflow()
+        sub = w.sub.tool
+        h, subh = w.structural_hash(), sub.structural_hash()
+        sub.output("out3", source=sub.inner1.out)
+        self.assertNotEqual(subh, sub.structural_hash())
+        self.assertNotEqual(h, w.structural_hash())
+
+    def test_pruned_workflow(self):
+        w = TestBranchingWorkflow()
+        self.assertNotEqual(
+            w.structural_hash(), w.prune(steps=["stp2"]).structural_hash()
+        )
+
+
+class LazyTestWorkflow(Workflow):
+    LAZY_CONSTRUCTION = True
+    constructed = 0
+
+    def id(self):
+        return "lazy_test_workflow"
+
+    def friendly_name(self):
+        return "Lazy test workflow"
+
+    def version(self):
+        return "v0.1.0"
+
+    def constructor(self):
+        LazyTestWorkflow.constructed += 1
+        self.input("inp", String)
+        self.step("stp", SingleTestTool(input1=self.inp))
+        self.output("out", source=self.stp.out)
+
+
+class TestLazyConstruction(TestCase):
+    def setUp(self):
+        Logger.mute()
+        LazyTestWorkflow.constructed = 0
+
+    def tearDown(self):
+        Logger.unmute()
+
+    def test_not_constructed(self):
+        w = LazyTestWorkflow()
+        self.assertFalse(w.is_constructed())
+        self.assertEqual("lazy_test_workflow", w.id())
+        self.assertEqual("v0.1.0", w.version())
+        self.assertEqual(0, LazyTestWorkflow.constructed)
+
+    def test_constructed_on_access(self):
+        for access in [
+            lambda w: w.nodes,
+            lambda w: w.step_nodes,
+            lambda w: w.tool_inputs(),
+            lambda w: w.stp,
+        ]:
+            w = LazyTestWorkflow()
+            access(w)
+            self.assertTrue(w.is_constructed())
+        self.assertEqual(4, LazyTestWorkflow.constructed)
+
+        w = LazyTestWorkflow()
+        self.assertListEqual(["inp", "stp", "out"], list(w.nodes))
+        w.nodes
+        self.assertEqual(5, LazyTestWorkflow.constructed)
+
+    def test_copy_before_constructed(self):
+        for copier in [copy.copy, copy.deepcopy]:
+            w = LazyTestWorkflow()
+            copied = copier(w)
+            self.assertListEqual(["inp", "stp", "out"], list(w.nodes))
+            self.assertFalse(copied.is_constructed())
+            self.assertListEqual(["inp", "stp", "out"], list(copied.nodes))
+            self.assertIsNot(w.nodes, copied.nodes)
+
+    def test_translate(self):
+        w = LazyTestWorkflow()
+        tool, _, _ = w.translate("wdl", to_console=False, allow_empty_container=True)
+        self.assertIn("as stp", tool)
+
+    def test_nested(self):
+        w = WorkflowBuilder("lazy_parent")
+        w.input("inp", String)
+        sub = LazyTestWorkflow()
+        self.assertFalse(sub.is_constructed())
+        # the step needs the inputs of the subworkflow
+        w.step("sub", sub(inp=w.inp))
+        self.assertTrue(sub.is_constructed())
+        self.assertEqual(1, LazyTestWorkflow.constructed)
+
+    def test_builder_is_not_lazy(self):
+        try:
+            Workflow.LAZY_CONSTRUCTION = True
+            self.assertTrue(WorkflowBuilder("lazy_builder").is_constructed())
+        finally:
+            Workflow.LAZY_CONSTRUCTION = False
@@ -19,6 +19,7 @@ from janis_core import (
     InputQualityType,
     Workflow,
     ForEachSelector,
+    CommandToolBuilder,
 )
 
 
@@ -328,3 +329,159 @@ class TestForEach(Workflow):
 
     def id(self) -> str:
         return "TestForEach"
+
+
+class TestSubworkflow(Workflow):
+    def constructor(self):
+        self.input("inp", str)
+        self.step("stp1", EchoTestTool(inp=self.inp))
+        self.output("out", source=self.stp1.out)
+
+    def friendly_name(self):
+        return "TEST: Subworkflow"
+
+    def id(self) -> str:
+        return self.__class__.__name__
+
+
+class TestWorkflowWithSubworkflow(Workflow):
+    """
+    A subworkflow (TestSubworkflow), the tool (a CatTestTool by default, of the 'file'
+    input) and an EchoTestTool, which is also the tool of the subworkflow's step
+    """
+
+    def __init__(self, tool=CatTestTool, identifier: str = None, **connections):
+        self._tool = tool
+        self._identifier = identifier
+        super().__init__(**connections)
+
+    def constructor(self):
+        self.input("inp", str)
+        self.input("file", File)
+        self.step("stp1", TestSubworkflow(inp=self.inp))
+        self.step("stp2", self._tool(inp=self.file))
+        self.step("stp3", EchoTestTool(inp=self.inp))
+        self.output("out", source=self.stp2.out)
+
+    def friendly_name(self):
+        return "TEST: WorkflowWithSubworkflow"
+
+    def id(self) -> str:
+        return self._identifier or self.__class__.__name__
+
+
+class TestWorkflowWithNestedSubworkflows(Workflow):
+    """
+    The TestSubworkflow is nested at two levels (directly, and in each
+    TestWorkflowWithSubworkflow), and its tool at every level
+    """
+
+    def constructor(self):
+        self.input("inp", str)
+        self.input("file", File)
+        self.step(
+            "stp1",
+            TestWorkflowWithSubworkflow(identifier="TestMidWorkflow1")(
+                inp=self.inp, file=self.file
+            ),
+        )
+        self.step(
+            "stp2",
+            TestWorkflowWithSubworkflow(identifier="TestMidWorkflow2")(
+                inp=self.inp, file=self.file
+            ),
+        )
+        self.step("stp3", TestSubworkflow(inp=self.inp))
+        self.output("out1", source=self.stp1.out)
+        self.output("out2", source=self.stp2.out)
+
+    def friendly_name(self):
+        return "TEST: WorkflowWithNestedSubworkflows"
+
+    def id(self) -> str:
+        return self.__class__.__name__
+
+
+class TestBranchingSubworkflow(Workflow):
+    def constructor(self):
+        self.input("inp", String)
+        self.step("inner1", SingleTestTool(input1=self.inp))
+        self.step("inner2", SingleTestTool(input1=self.inp))
+        self.output("out1", source=self.inner1.out)
+        self.output("out2", source=self.inner2.out)
+
+    def friendly_name(self):
+        return "TEST: BranchingSubworkflow"
+
+    def id(self) -> str:
+        return self.__class__.__name__
+
+
+class TestBranchingWorkflow(Workflow):
+    """
+    stp1 branches to stp2 and stp3, stp2 to the subworkflow (TestBranchingSubworkflow),
+    and stp4 is only connected to the 'unused' input
+    """
+
+    def constructor(self):
+        self.input("inp", String)
+        self.input("unused", String)
+        self.step("stp1", SingleTestTool(input1=self.inp))
+        self.step("stp2", SingleTestTool(input1=self.stp1.out, input2=self.inp))
+        self.step("stp3", SingleTestTool(input1=self.stp1.out))
+        self.step("stp4", SingleTestTool(input1=self.unused))
+        self.step("sub", TestBranchingSubworkflow(inp=self.stp2.out))
+        self.output("out", source=self.stp2.out)
+        self.output("out4", source=self.stp4.out)
+        self.output("outsub", source=self.sub.out1)
+
+    def friendly_name(self):
+        return "TEST: BranchingWorkflow"
+
+    def id(self) -> str:
+        return self.__class__.__name__
+
+
+def resources_test_tool(identifier: str, cpus, memory, time):
+    return CommandToolBuilder(
+        tool=identifier,
+        base_command="echo",
+        inputs=[
+            ToolInput("inp", String(), position=0),
+            ToolInput("inp2", File(optional=True), position=1),
+        ],
+        outputs=[ToolOutput("out", Stdout())],
+        container="ubuntu:latest",
+        version="v0.1",
+        cpus=cpus,
+        memory=memory,
+        time=time,
+    )
+
+
+class TestResourcesWorkflow(Workflow):
+    """
+    'slow' is the critical path, 'last' waits for 'fast' and 'scattered' is scattered
+    """
+
+    def constructor(self):
+        self.input("inp", String)
+        self.input("inps", Array(String))
+        self.step("fast", resources_test_tool("fast", 1, 2, 10)(inp=self.inp))
+        self.step("slow", resources_test_tool("slow", 4, 8, 100)(inp=self.inp))
+        self.step(
+            "scattered",
+            resources_test_tool("scattered", 2, 3, 20)(inp=self.inps),
+            scatter="inp",
+        )
+        self.step(
+            "last",
+            resources_test_tool("last", 1, 1, 5)(inp=self.inp, inp2=self.fast.out),
+        )
+        self.output("out", source=self.last.out)
+
+    def friendly_name(self):
+        return "TEST: ResourcesWorkflow"
+
+    def id(self) -> str:
+        return self.__class__.__name__
@@ -23,10 +23,28 @@ from janis_core.utils.metadata import ToolMetadata
 class ToolArgument:
     expr_pattern = "\$\(.*\)"
 
+    __slots__ = (
+        "prefix",
+        "value",
+        "position",
+        "is_expression",
+        "separate_value_from_prefix",
+        "doc",
+        "shell_quote",
+    )
+
     def __repr__(self):
+        # the slots (base class first), and the __dict__ of a subclass without slots
+        slots = [
+            s
+            for c in reversed(type(self).__mro__)
+            for s in c.__dict__.get("__slots__", ())
+        ]
+        items = [(k, getattr(self, k)) for k in slots if hasattr(self, k)]
+        items.extend(getattr(self, "__dict__", {}).items())
         attrs = ", ".join(
             f"{k}={repr(v)}"
-            for k, v in self.__dict__.items()
+            for k, v in items
             if not k.startswith("_") and not callable(v)
         )
         return f"{self.__class__.__name__}({attrs})"
@@ -86,6 +104,17 @@ class ToolArgument:
 
 # This should really be a CommandToolInput
 class ToolInput(ToolArgument):
+    __slots__ = (
+        "tag",
+        "input_type",
+        "default",
+        "prefix_applies_to_all_elements",
+        "separator",
+        "localise_file",
+        "presents_as",
+        "secondaries_present_as",
+    )
+
     def __init__(
         self,
         tag: str,
@@ -472,6 +501,26 @@ class CommandTool(Tool, ABC):
             container_override=container_override,
         )
 
+    def structural_components(self) -> dict:
+        components = super().structural_components()
+        components.update(
+            {
+                "inputs": self.inputs(),
+                "outputs": self.outputs(),
+                "container": self.container(),
+                "base_command": self.base_command(),
+                "arguments": self.arguments(),
+                "env_vars": self.env_vars(),
+                "directories_to_create": self.directories_to_create(),
+                "files_to_create": self.files_to_create(),
+                "cpus": self.cpus({}),
+                "memory": self.memory({}),
+                "time": self.time({}),
+                "disk": self.disk({}),
+            }
+        )
+        return components
+
     def tool_inputs(self) -> List[TInput]:
         return [
             TInput(t.id(), t.input_type, default=t.default, doc=t.doc)
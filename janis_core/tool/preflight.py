@@ -0,0 +1,211 @@
+"""
+    preflight.py
+
+    Checks that the File / Directory values of a tool's (or workflow's) inputs exist,
+    with the secondary files their types require (eg: the .bai of a BAM), before the
+    tool is submitted to an engine. The paths are checked in a pool of threads.
+"""
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from janis_core.operators import Selector
+from janis_core.types import Array, DataType, Directory, File, UnionType
+from janis_core.utils.logger import Logger
+from janis_core.utils.secondary import apply_secondary_file_formats_to_filenames
+
+# the kind of path a type expects
+PATH_FILE = "file"
+PATH_DIRECTORY = "directory"
+
+# the number of paths each thread checks at a time
+PATHS_PER_TASK = 64
+
+
+class PreflightReport:
+    """
+    The paths that were checked for the inputs of a tool, see Tool.preflight_inputs
+    """
+
+    def __init__(self, tool_id: str):
+        self.tool_id = tool_id
+        # the paths (or secondary files) that don't exist, by input id
+        self.missing: Dict[str, List[str]] = {}
+        # the paths that exist, but aren't the kind the type expects, by input id
+        self.wrong_kind: Dict[str, List[str]] = {}
+        # the paths that couldn't be checked (eg: s3://), by input id
+        self.unchecked: Dict[str, List[str]] = {}
+        self.checked = 0
+
+    def __repr__(self):
+        return (
+            f"PreflightReport({self.tool_id}, checked={self.checked}, missing="
+            f"{sum(len(v) for v in self.missing.values())})"
+        )
+
+    def is_valid(self) -> bool:
+        return not self.missing and not self.wrong_kind
+
+    def summary(self) -> str:
+        if self.is_valid():
+            return f"All {self.checked} paths of '{self.tool_id}' exist"
+        lines = [f"Found missing paths for the inputs of '{self.tool_id}':"]
+        for inpid, paths in self.missing.items():
+            lines.append(f"  {inpid}: " + ", ".join(paths))
+        for inpid, paths in self.wrong_kind.items():
+            lines.append(f"  {inpid} (not a file / directory): " + ", ".join(paths))
+        return "\n".join(lines)
+
+    def to_dict(self):
+        return {
+            "tool": self.tool_id,
+            "checked": self.checked,
+            "missing": self.missing,
+            "wrong_kind": self.wrong_kind,
+            "unchecked": self.unchecked,
+        }
+
+
+def get_path_kind(path: str) -> Optional[str]:
+    """
+    Whether the path is a file or directory, or None if it doesn't exist
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        return None
+    return PATH_DIRECTORY if stat.S_ISDIR(mode) else PATH_FILE
+
+
+def get_path_kinds(paths: List[str]) -> List[Optional[str]]:
+    return [get_path_kind(p) for p in paths]
+
+
+def get_expected_paths(datatype: DataType, value) -> List[Tuple[str, str]]:
+    """
+    The (path, kind) of each path in the value of an input with the datatype,
+    including the secondary files of File types
+    """
+    if value is None:
+        return []
+    if isinstance(datatype, Array):
+        if not isinstance(value, list):
+            return []
+        st = datatype.subtype()
+        if isinstance(st, File):
+            # resolve the secondary files of every element at once
+            return get_file_paths(st, [v for v in value if isinstance(v, str)])
+        return [p for v in value for p in get_expected_paths(st, v)]
+    if isinstance(datatype, UnionType):
+        # only if every subtype is a file, otherwise the value could be a string
+        if all(isinstance(t, File) for t in datatype.subtypes) and isinstance(
+            value, str
+        ):
+            return get_file_paths(
+                datatype.subtypes[0], [value], get_union_secondaries(datatype, value)
+            )
+        return []
+    if not isinstance(value, str):
+        return []
+    if isinstance(datatype, Directory):
+        return [(value, PATH_DIRECTORY)]
+    if isinstance(datatype, File):
+        return get_file_paths(datatype, [value])
+    return []
+
+
+def get_union_secondaries(datatype: UnionType, value: str) -> List[str]:
+    """
+    The secondary files of the (File) subtype of the union whose extension the value
+    has (the longest if many match), or if none match, the secondaries of every subtype
+    """
+    matched, matched_length = None, 0
+    for subtype in datatype.subtypes:
+        for ext in subtype.get_extensions():
+            ext = ext if ext.startswith(".") else "." + ext
+            if len(ext) > matched_length and value.endswith(ext):
+                matched, matched_length = subtype, len(ext)
+    if matched is not None:
+        return matched.secondary_files() or []
+
+    shared = None
+    for subtype in datatype.subtypes:
+        secs = subtype.secondary_files() or []
+        shared = secs if shared is None else [s for s in shared if s in secs]
+    return shared or []
+
+
+def get_file_paths(
+    datatype: File, values: List[str], secondaries: List[str] = None
+) -> List[Tuple[str, str]]:
+    """
+    The (path, kind) of each file and its secondary files
+
+    :param secondaries: The secondary files to use instead of the datatype's
+    """
+    secs = secondaries if secondaries is not None else datatype.secondary_files()
+    if not secs:
+        return [(v, PATH_FILE) for v in values]
+    paths = []
+    names = apply_secondary_file_formats_to_filenames(values, secs)
+    for v, secondaries in zip(values, names):
+        paths.append((v, PATH_FILE))
+        paths.extend((s, PATH_FILE) for s in secondaries)
+    return paths
+
+
+def preflight_inputs(
+    tool,
+    inputs: Dict[str, Any],
+    max_workers: int = 8,
+    cache: Dict[str, Optional[str]] = None,
+) -> PreflightReport:
+    """
+    Check the File / Directory paths (and the secondary files) of the inputs exist,
+    the defaults of the tool's inputs are checked if they're not in inputs.
+
+    :param max_workers: The number of threads that stat the paths
+    :param cache: The kind of each path (see get_path_kind) that's already been
+        checked, by the path. It's updated with the paths that are checked, so it can
+        be shared between calls.
+    """
+    cache = cache if cache is not None else {}
+    report = PreflightReport(tool.id())
+
+    # (input id, path, kind) of every path to check
+    expected: List[Tuple[str, str, str]] = []
+    for inp in tool.tool_inputs():
+        value = inputs.get(inp.id(), inp.default)
+        if isinstance(value, Selector):
+            continue
+        for path, kind in get_expected_paths(inp.intype, value):
+            if "://" in path:
+                report.unchecked.setdefault(inp.id(), []).append(path)
+                continue
+            expected.append((inp.id(), path, kind))
+
+    to_check = list({path for _, path, _ in expected if path not in cache})
+    if to_check:
+        Logger.log(
+            f"Checking {len(to_check)} paths for the inputs of '{tool.id()}' "
+            f"with {max_workers} threads"
+        )
+        # in chunks, as a future per path costs more than a (local) stat
+        chunks = [
+            to_check[i : i + PATHS_PER_TASK]
+            for i in range(0, len(to_check), PATHS_PER_TASK)
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for chunk, kinds in zip(chunks, executor.map(get_path_kinds, chunks)):
+                cache.update(zip(chunk, kinds))
+
+    report.checked = len(expected)
+    for inpid, path, kind in expected:
+        found = cache[path]
+        if found is None:
+            report.missing.setdefault(inpid, []).append(path)
+        elif found != kind:
+            report.wrong_kind.setdefault(inpid, []).append(path)
+
+    return report
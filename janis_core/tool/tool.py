@@ -13,6 +13,7 @@ from janis_core.tool.documentation import (
 )
 from janis_core.types import get_instantiated_type, DataType
 from janis_core.utils import find_duplicates
+from janis_core.utils.fingerprint import fingerprint
 from janis_core.utils.metadata import Metadata
 from janis_core.utils.validators import Validators
 from janis_core.tool.test_classes import (
@@ -39,6 +40,8 @@ class ToolType(Enum):
 
 
 class TInput(object):
+    __slots__ = ("tag", "intype", "default", "doc")
+
     def __init__(
         self, tag: str, intype: DataType, default=None, doc: InputDocumentation = None
     ):
@@ -58,6 +61,8 @@ class TInput(object):
 
 
 class TOutput(object):
+    __slots__ = ("tag", "outtype", "doc")
+
     def __init__(self, tag, outtype, doc: OutputDocumentation = None):
         self.tag = tag
         self.outtype = get_instantiated_type(outtype)
@@ -128,6 +133,15 @@ class Tool(ABC, object):
         raise Exception("Must implement outputs() method")
 
     def inputs_map(self) -> Dict[str, TInput]:
+        """
+        The inputs of the tool by tag, this is computed once per tool instance (see
+        invalidate_io_maps), so the returned dictionary must not be modified.
+        """
+        # (through __dict__, as some tools don't call Tool.__init__)
+        indict = self.__dict__.get("_cached_inputs_map")
+        if indict is not None:
+            return indict
+
         ins = self.tool_inputs()
         indict = {inp.tag: inp for inp in ins}
 
@@ -138,9 +152,18 @@ class Tool(ABC, object):
                 f"There are {len(dups)} duplicate values in {self.id()}'s inputs: {dupstext}"
             )
 
+        self.__dict__["_cached_inputs_map"] = indict
         return indict
 
     def outputs_map(self) -> Dict[str, TOutput]:
+        """
+        The outputs of the tool by tag, this is computed once per tool instance (see
+        invalidate_io_maps), so the returned dictionary must not be modified.
+        """
+        outdict = self.__dict__.get("_cached_outputs_map")
+        if outdict is not None:
+            return outdict
+
         outs = self.tool_outputs()
         outdict = {outp.tag: outp for outp in outs}
 
@@ -151,8 +174,56 @@ class Tool(ABC, object):
                 f"There are {len(dups)} duplicate values in {self.id()}'s outputs: {dupstext}"
             )
 
+        self.__dict__["_cached_outputs_map"] = outdict
         return outdict
 
+    def invalidate_io_maps(self):
+        """
+        Clear the cached inputs_map / outputs_map, this must be called if the inputs
+        or outputs of the tool are changed after they've been used (eg: by a step).
+        """
+        self.__dict__.pop("_cached_inputs_map", None)
+        self.__dict__.pop("_cached_outputs_map", None)
+
+    def structural_components(self) -> dict:
+        """
+        Everything that changes how the tool is translated, see structural_hash
+        """
+        return {
+            "type": self.type(),
+            "id": self.id(),
+            "version": self.version(),
+            "friendly_name": self.friendly_name(),
+            "doc": self.doc(),
+            "metadata": self.bind_metadata() or self.metadata,
+            "inputs": list(self.inputs_map().values()),
+            "outputs": list(self.outputs_map().values()),
+        }
+
+    def structural_hash(self) -> str:
+        """
+        A hex digest of the structure of the tool (its structural_components), two tools
+        with the same hash are translated identically. This is computed once per tool
+        instance (see invalidate_structural_hash).
+        """
+        h = self.__dict__.get("_cached_structural_hash")
+        if h is None:
+            h = fingerprint(self.structural_components())
+            self.__dict__["_cached_structural_hash"] = h
+        return h
+
+    def invalidate_structural_hash(self):
+        """
+        Clear the cached structural_hash, this must be called if the tool is changed
+        after it's been hashed (eg: by a translation cache).
+        """
+        self.__dict__.pop("_cached_structural_hash", None)
+
+    def fingerprint_state(self):
+        # a tool is identified by its hash when it's part of a bigger structure (eg: the
+        # tool of a workflow step), so it's only hashed once
+        return self.structural_hash()
+
     def friendly_name(self) -> Optional[str]:
         """
         Overriding this method is not required UNLESS you distribute your tool.
@@ -165,6 +236,23 @@ class Tool(ABC, object):
     def all_input_keys(self) -> List[str]:
         return [t.id() for t in self.tool_inputs()]
 
+    def preflight_inputs(
+        self, inputs: Dict[str, any], max_workers: int = 8, cache: dict = None
+    ):
+        """
+        Check that the File / Directory paths of the inputs (and their secondary
+        files) exist before the tool is submitted.
+
+        :param inputs: The input values by input id
+        :param max_workers: The number of threads that check the paths
+        :param cache: The result of each path by the path, shared between calls
+        :return: janis_core.tool.preflight.PreflightReport, with the missing paths
+            grouped by input (.missing) and a .summary()
+        """
+        from janis_core.tool.preflight import preflight_inputs
+
+        return preflight_inputs(self, inputs, max_workers=max_workers, cache=cache)
+
     @abstractmethod
     def has_tool_with_no_container(self):
         pass
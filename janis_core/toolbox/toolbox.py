@@ -5,7 +5,7 @@ from janis_core.tool.commandtool import Tool, ToolType, CommandTool, CommandTool
 from janis_core.code.pythontool import CodeTool, PythonTool
 from janis_core.types import get_instantiated_type, File
 from janis_core.workflow.workflow import Workflow, WorkflowBuilder
-from janis_core.types.data_types import DataType
+from janis_core.types.data_types import DataType, clear_compatibility_cache
 from janis_core.utils.logger import Logger, LogLevel
 import janis_core.toolbox.entrypoints as EP
 from janis_core.toolbox.register import TaggedRegistry, Registry
@@ -79,6 +79,8 @@ class JanisShed:
 
     @staticmethod
     def add_type(datatype: Type[DataType]) -> bool:
+        # types can be redefined when they're registered (eg: a reloaded module)
+        clear_compatibility_cache()
         JanisShed._byclassname.register(datatype.__name__, datatype)
         return JanisShed._typeshed.register(datatype.name().lower(), datatype)
 
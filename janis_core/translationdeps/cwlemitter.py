@@ -0,0 +1,148 @@
+"""
+    cwlemitter.py
+
+    Emits CWL in the canonical format of cwlformat (Rabix/cwl-format) directly from the
+    saved (cwlgen) dictionary, rather than dumping the YAML and parsing it again to
+    reformat it. The key order and layout mirror cwlformat == 2020.5.19.
+"""
+from io import StringIO
+from typing import Dict, List, Union
+
+import ruamel.yaml
+from ruamel.yaml.comments import CommentedMap
+from ruamel.yaml.scalarstring import LiteralScalarString
+
+SHEBANG = "#!/usr/bin/env cwl-runner"
+
+# strings longer than this are emitted as literal blocks
+LITERAL_STRING_LENGTH = 80
+
+SPACED_CLASSES = {"CommandLineTool", "ExpressionTool", "Workflow"}
+SPACED_SECTIONS = {"inputs", "outputs", "steps", "requirements", "hints", "baseCommand"}
+
+KEY_ORDER: Dict[str, List[str]] = {
+    "generic-ordering": [
+        "id",
+        "label",
+        "name",
+        "doc",
+        "class",
+        "type",
+        "format",
+        "default",
+        "secondaryFiles",
+        "inputBinding",
+        "prefix",
+        "position",
+        "valueFrom",
+        "separate",
+        "itemSeparator",
+        "shellQuote",
+        "outputBinding",
+        "glob",
+        "outputEval",
+        "loadContents",
+        "loadListing",
+        "dockerPull",
+        # Dirent
+        "entryname",
+        "writable",
+        # WorkflowStep
+        "in",
+        "scatter",
+        "scatterMethod",
+        "run",
+        "when",
+        "out",
+        "requirements",
+        "hints",
+        # WorkflowStepInput
+        "source",
+        "outputSource",
+        "linkMerge",
+    ],
+    "CommandLineTool": [
+        "class",
+        "cwlVersion",
+        "label",
+        "doc",
+        "$namespaces",
+        "requirements",
+        "inputs",
+        "outputs",
+        "stdout",
+        "stderr",
+        "baseCommand",
+        "arguments",
+        "hints",
+        "id",
+    ],
+    "ExpressionTool": [
+        "class",
+        "cwlVersion",
+        "label",
+        "doc",
+        "requirements",
+        "inputs",
+        "outputs",
+        "expression",
+        "hints",
+        "id",
+    ],
+    "Workflow": [
+        "class",
+        "cwlVersion",
+        "label",
+        "doc",
+        "$namespaces",
+        "requirements",
+        "inputs",
+        "outputs",
+        "steps",
+        "hints",
+        "id",
+    ],
+}
+
+yaml = ruamel.yaml.YAML()
+yaml.indent(mapping=2, sequence=2, offset=0)
+
+
+def ordered_items(node: dict):
+    known_order = KEY_ORDER.get(node.get("class"), KEY_ORDER["generic-ordering"])
+    known = set(known_order)
+    for k in known_order:
+        if k in node:
+            yield k, node[k]
+    for k in sorted(k for k in node if k not in known):
+        yield k, node[k]
+
+
+def format_node(node: Union[dict, list, str, int, float, bool, None]):
+    if isinstance(node, str):
+        if len(node) > LITERAL_STRING_LENGTH:
+            return LiteralScalarString(node)
+        return node
+
+    if isinstance(node, dict):
+        formatted = CommentedMap((k, format_node(v)) for k, v in ordered_items(node))
+        if formatted.get("class") in SPACED_CLASSES:
+            for k in formatted:
+                if k in SPACED_SECTIONS:
+                    formatted.yaml_set_comment_before_after_key(key=k, before="\n")
+        return formatted
+
+    if isinstance(node, list):
+        return [format_node(v) for v in node]
+
+    return node
+
+
+def emit_cwl(saved: dict) -> str:
+    """
+    Emit the saved CWL document (with the cwl-runner shebang) in one pass
+    """
+    stream = StringIO()
+    stream.write(SHEBANG + "\n")
+    yaml.dump(format_node(saved), stream)
+    return stream.getvalue()
@@ -0,0 +1,252 @@
+import json
+import os
+from abc import ABC, abstractmethod
+from hashlib import sha256
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+
+from janis_core.utils.logger import Logger
+
+
+class ExportReport:
+    """
+    Which files an export wrote, and which it skipped as they were unchanged
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = directory
+        self.written: List[str] = []
+        self.skipped: List[str] = []
+
+    def __repr__(self):
+        return f"ExportReport(written={len(self.written)}, skipped={len(self.skipped)})"
+
+    def to_dict(self):
+        return {
+            "directory": self.directory,
+            "written": self.written,
+            "skipped": self.skipped,
+        }
+
+
+def _to_bytes(content: Union[str, bytes]) -> bytes:
+    return content.encode("utf-8") if isinstance(content, str) else content
+
+
+def hash_content(content: Union[str, bytes]) -> str:
+    return sha256(_to_bytes(content)).hexdigest()
+
+
+# zip can't represent dates before 1980, and a fixed date keeps the zip reproducible
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+DEFAULT_ZIP_COMPRESSION_LEVEL = 6
+
+
+def build_zip(
+    files: List[Tuple[str, Union[str, bytes]]],
+    compression_level: Optional[int] = DEFAULT_ZIP_COMPRESSION_LEVEL,
+) -> bytes:
+    """
+    Build a zip (in memory) of the (relative path, content) pairs. Entries are sorted
+    and timestamped with a fixed date, so the same files always produce the same
+    bytes. The parent directories are added as entries (like 'zip -r').
+
+    :param compression_level: 0 (store) to 9, or None for zlib's default
+    """
+    import io
+
+    buffer = io.BytesIO()
+    writer = ZipWriter(buffer, compression_level=compression_level)
+    for path, content in sorted(files, key=lambda f: f[0]):
+        writer.write(path, content)
+    writer.close()
+
+    return buffer.getvalue()
+
+
+class ExportWriter(ABC):
+    """
+    Somewhere to write the (relative path, content) pairs of an export to, see
+    TranslatorBase.translate_to_writer.
+    """
+
+    def __init__(self, location: Optional[str] = None):
+        self.report = ExportReport(location)
+
+    @abstractmethod
+    def write(self, relpath: str, content: Union[str, bytes]) -> bool:
+        """
+        :return: Whether the file was written (ie: not skipped as it was unchanged)
+        """
+        pass
+
+    def close(self) -> ExportReport:
+        return self.report
+
+
+class CallbackWriter(ExportWriter):
+    """
+    Passes each file of the export to callback(relative path, content)
+    """
+
+    def __init__(self, callback: Callable[[str, Union[str, bytes]], Any]):
+        super().__init__()
+        self.callback = callback
+
+    def write(self, relpath: str, content: Union[str, bytes]) -> bool:
+        self.callback(relpath, content)
+        self.report.written.append(relpath)
+        return True
+
+
+class ZipWriter(ExportWriter):
+    """
+    Streams the files of an export into a zip, which can be a path or a (writable)
+    file object. Entries are timestamped with a fixed date, so the same files in the
+    same order always produce the same bytes.
+    """
+
+    def __init__(
+        self,
+        file: Union[str, BinaryIO],
+        compression_level: Optional[int] = DEFAULT_ZIP_COMPRESSION_LEVEL,
+    ):
+        import zipfile
+
+        super().__init__(file if isinstance(file, str) else None)
+        self.compression_level = compression_level
+        self.compression = (
+            zipfile.ZIP_STORED if compression_level == 0 else zipfile.ZIP_DEFLATED
+        )
+        self._zipfile = zipfile.ZipFile(file, "w")
+        self._directories = set()
+
+    def write(self, relpath: str, content: Union[str, bytes]) -> bool:
+        import zipfile
+
+        parts = relpath.split("/")[:-1]
+        for i in range(1, len(parts) + 1):
+            directory = "/".join(parts[:i]) + "/"
+            if directory in self._directories:
+                continue
+            self._directories.add(directory)
+            info = zipfile.ZipInfo(directory, date_time=ZIP_DATE_TIME)
+            info.create_system = 3  # unix, so the permissions are used
+            info.external_attr = (0o40755 << 16) | 0x10
+            self._zipfile.writestr(info, b"")
+
+        info = zipfile.ZipInfo(relpath, date_time=ZIP_DATE_TIME)
+        info.create_system = 3
+        info.external_attr = 0o100644 << 16
+        info.compress_type = self.compression
+        self._zipfile.writestr(
+            info,
+            _to_bytes(content),
+            compress_type=self.compression,
+            compresslevel=self.compression_level,
+        )
+        self.report.written.append(relpath)
+        return True
+
+    def close(self) -> ExportReport:
+        self._zipfile.close()
+        return self.report
+
+
+class DirectoryWriter(ExportWriter):
+    """
+    Writes the files of an export into a directory.
+
+    If incremental, each file is compared (by hash) with what's already on disk, and
+    only the files that changed are written, so unchanged files keep their modified
+    time. The hashes are stored in a manifest alongside the export, so an unchanged
+    file (with the same size and modified time as the manifest) isn't read again.
+    """
+
+    MANIFEST_FILENAME = ".janis-manifest.json"
+
+    def __init__(self, directory: str, incremental=False, use_manifest=True):
+        super().__init__(directory)
+        self.directory = directory
+        self.incremental = incremental
+        self.use_manifest = incremental and use_manifest
+
+        self._manifest: Dict[str, dict] = {}
+        if self.use_manifest:
+            self._manifest = self.read_manifest()
+        self._original_manifest = dict(self._manifest)
+
+    def manifest_path(self):
+        return os.path.join(self.directory, self.MANIFEST_FILENAME)
+
+    def read_manifest(self) -> Dict[str, dict]:
+        try:
+            with open(self.manifest_path()) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError as e:
+            Logger.warn(
+                f"Ignoring the invalid export manifest '{self.manifest_path()}': {e}"
+            )
+            return {}
+
+    def is_unchanged(self, relpath: str, path: str, content_hash: str) -> bool:
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            return False
+
+        entry = self._manifest.get(relpath)
+        if (
+            entry
+            and entry.get("sha256") == content_hash
+            and entry.get("size") == st.st_size
+            and entry.get("mtime") == st.st_mtime
+        ):
+            return True
+
+        with open(path, "rb") as f:
+            return hash_content(f.read()) == content_hash
+
+    def write(self, relpath: str, content: Union[str, bytes]) -> bool:
+        """
+        :return: Whether the file was written (ie: not skipped as it was unchanged)
+        """
+        path = os.path.join(self.directory, relpath)
+        content_hash = hash_content(content) if self.incremental else None
+
+        written = not (
+            self.incremental and self.is_unchanged(relpath, path, content_hash)
+        )
+        if not written:
+            Logger.log(f"Skipping {relpath} as it hasn't changed")
+            self.report.skipped.append(relpath)
+        else:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with open(path, "w+" if isinstance(content, str) else "wb+") as f:
+                Logger.log(f"Writing {relpath} to disk")
+                f.write(content)
+                Logger.log(f"Written {relpath} to disk")
+            self.report.written.append(relpath)
+
+        if self.use_manifest:
+            st = os.stat(path)
+            self._manifest[relpath] = {
+                "sha256": content_hash,
+                "size": st.st_size,
+                "mtime": st.st_mtime,
+            }
+
+        return written
+
+    def close(self) -> ExportReport:
+        if self.use_manifest and self._manifest != self._original_manifest:
+            with open(self.manifest_path(), "w+") as f:
+                json.dump(self._manifest, f, indent=2, sort_keys=True)
+
+        Logger.info(
+            f"Exported {len(self.report.written) + len(self.report.skipped)} files to "
+            f"'{self.directory}' ({len(self.report.written)} written, "
+            f"{len(self.report.skipped)} unchanged)"
+        )
+        return self.report
@@ -0,0 +1,135 @@
+import json
+from contextlib import contextmanager
+from functools import wraps
+from time import perf_counter
+from typing import Dict, List, Optional
+
+from janis_core.utils.logger import Logger
+
+
+class PhaseTiming:
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+
+    def __repr__(self):
+        return f"PhaseTiming(calls={self.calls}, seconds={self.seconds:.6f})"
+
+    def to_dict(self):
+        return {"calls": self.calls, "seconds": self.seconds}
+
+
+class TimingReport:
+    """
+    The wall time and number of calls of each phase of an export (eg: translating
+    the tools, building the inputs file, stringifying, writing to disk), and of
+    translating each tool.
+
+    A phase that's re-entered (eg: the recursive unwrap_expression) counts each call,
+    but its time is only counted once, from the outermost call.
+    """
+
+    FILENAME = ".janis-timings.json"
+
+    def __init__(self, name: Optional[str] = None):
+        self.name = name
+        self.phases: Dict[str, PhaseTiming] = {}
+        self.tools: Dict[str, PhaseTiming] = {}
+        self.total_seconds = 0.0
+        self._active: Dict[str, int] = {}
+
+    def __repr__(self):
+        return f"TimingReport(name={self.name}, total_seconds={self.total_seconds:.6f})"
+
+    @contextmanager
+    def phase(self, name: str, tool: Optional[str] = None):
+        timing = self.phases.setdefault(name, PhaseTiming())
+        timing.calls += 1
+        tool_timing = None
+        if tool is not None:
+            tool_timing = self.tools.setdefault(tool, PhaseTiming())
+            tool_timing.calls += 1
+
+        depth = self._active.get(name, 0)
+        self._active[name] = depth + 1
+        start = perf_counter()
+        try:
+            yield timing
+        finally:
+            elapsed = perf_counter() - start
+            self._active[name] = depth
+            if depth == 0:
+                timing.seconds += elapsed
+            if tool_timing is not None:
+                tool_timing.seconds += elapsed
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "total_seconds": self.total_seconds,
+            "phases": {k: v.to_dict() for k, v in self.phases.items()},
+            "tools": {k: v.to_dict() for k, v in self.tools.items()},
+        }
+
+    def write(self, path: str):
+        with open(path, "w+") as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def log(self):
+        """
+        Log the report, for when it isn't kept in a session or written to disk
+        """
+        Logger.info(f"Timings of '{self.name}': " + json.dumps(self.to_dict()))
+
+
+# the reports being recorded, the innermost (last) one records the phases
+_active_reports: List[TimingReport] = []
+
+
+@contextmanager
+def no_timing():
+    yield None
+
+
+@contextmanager
+def recording(report: TimingReport):
+    """
+    Record the phases (from timed / @timed_phase) into the report, and the total time
+    """
+    _active_reports.append(report)
+    start = perf_counter()
+    try:
+        yield report
+    finally:
+        report.total_seconds += perf_counter() - start
+        _active_reports.remove(report)
+
+
+def timed(name: str, tool: Optional[str] = None):
+    """
+    Time a phase into the report that's being recorded, this is a no-op otherwise:
+
+        with timed("build_inputs_file"):
+            ...
+    """
+    if not _active_reports:
+        return no_timing()
+    return _active_reports[-1].phase(name, tool=tool)
+
+
+def timed_phase(name: str):
+    """
+    Decorate a function so its calls are timed as the phase 'name'
+    """
+
+    def decorator(f):
+        @wraps(f)
+        def wrapper(*args, **kwargs):
+            if not _active_reports:
+                return f(*args, **kwargs)
+            with _active_reports[-1].phase(name):
+                return f(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,147 @@
+import os
+from typing import Optional, Union
+
+from janis_core.__meta__ import __version__
+from janis_core.utils.fingerprint import fingerprint
+from janis_core.utils.logger import Logger
+
+
+class TranslationCache:
+    """
+    A content-addressed, on-disk store of stringified tool translations.
+
+    Entries are keyed by a structural fingerprint of the tool and the options that
+    change its translation, so a tool is only translated again when it changes. The
+    directory is bounded by max_size (bytes), the least recently used entries are
+    evicted first.
+    """
+
+    DEFAULT_MAX_SIZE = 100 * 1024 * 1024  # 100MB
+    EXTENSION = ".txt"
+
+    def __init__(self, directory: str, max_size: Optional[int] = DEFAULT_MAX_SIZE):
+        self.directory = os.path.abspath(os.path.expanduser(directory))
+        self.max_size = max_size
+
+        self.hits = 0
+        self.misses = 0
+        self._size = None
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    @staticmethod
+    def try_get_cache(
+        cache: Union[None, str, "TranslationCache"]
+    ) -> Optional["TranslationCache"]:
+        if cache is None or isinstance(cache, TranslationCache):
+            return cache
+        if isinstance(cache, str):
+            return TranslationCache(cache)
+        raise TypeError(
+            f"Couldn't create a translation cache from '{cache}' ({type(cache).__name__}), "
+            f"expected a directory or TranslationCache"
+        )
+
+    @staticmethod
+    def key_for(
+        translator: str,
+        tool,
+        with_container=True,
+        with_resource_overrides=False,
+        allow_empty_container=False,
+        container=None,
+    ) -> str:
+        """
+        Generate the key for a CommandTool / CodeTool. The container is the container
+        that this tool will be translated with (after any container override is applied).
+        """
+        return fingerprint(
+            __version__,
+            translator,
+            tool.structural_hash(),
+            with_container,
+            with_resource_overrides,
+            allow_empty_container,
+            container,
+        )
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.EXTENSION)
+
+    def get(self, key: str) -> Optional[str]:
+        path = self.path_for(key)
+        try:
+            with open(path) as f:
+                value = f.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+
+        # bump the modified time, so eviction is least recently used
+        os.utime(path, None)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: str):
+        path = self.path_for(key)
+        tmppath = path + ".tmp"
+        with open(tmppath, "w+") as f:
+            f.write(value)
+
+        # the size of the entry this replaces (if any), to keep the running total right
+        try:
+            replaced = os.path.getsize(path)
+        except FileNotFoundError:
+            replaced = 0
+        os.replace(tmppath, path)
+
+        # keep a running total so we only list the directory when we need to evict
+        if self._size is None:
+            self._size = self.size()
+        else:
+            self._size += os.path.getsize(path) - replaced
+
+        if self.max_size is not None and self._size > self.max_size:
+            self.evict()
+
+    def entries(self):
+        entries = []
+        for fn in os.listdir(self.directory):
+            if not fn.endswith(self.EXTENSION):
+                continue
+            try:
+                st = os.stat(os.path.join(self.directory, fn))
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime, st.st_size, fn))
+        return entries
+
+    def size(self) -> int:
+        return sum(e[1] for e in self.entries())
+
+    def evict(self):
+        if self.max_size is None:
+            return
+
+        entries = self.entries()
+        total = sum(e[1] for e in entries)
+        self._size = total
+        if total <= self.max_size:
+            return
+
+        for _, size, fn in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(os.path.join(self.directory, fn))
+            except FileNotFoundError:
+                pass
+            total -= size
+            Logger.log(f"Evicted '{fn}' from the translation cache")
+
+        self._size = total
+
+    def clear(self):
+        for _, _, fn in self.entries():
+            os.remove(os.path.join(self.directory, fn))
+        self._size = 0
@@ -0,0 +1,154 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from janis_core.translationdeps.exportwriter import ExportReport
+from janis_core.translationdeps.timingreport import TimingReport
+from janis_core.translationdeps.translationcache import TranslationCache
+
+
+class TranslationSession:
+    """
+    Holds the state of one (or more) exports, it's threaded through the recursive
+    translation so each distinct tool and subworkflow is only translated once,
+    regardless of how many times (or how deeply) it's nested.
+
+    Translations are memoized by the translator, the tool's versioned id (and
+    structural hash) and the options that change its translation.
+    """
+
+    def __init__(self, cache: Union[str, TranslationCache] = None):
+        self.cache: Optional[TranslationCache] = TranslationCache.try_get_cache(cache)
+
+        self.tools: Dict[Tuple, Any] = {}
+        self.workflows: Dict[Tuple, Tuple[Any, Dict[str, Any]]] = {}
+        self._preloaded = set()
+
+        # stringified translations by the id of the translated object, the object is
+        # kept alongside so its id can't be reused
+        self._stringified: Dict[int, Tuple[Any, str]] = {}
+
+        # ExportReport for each export that was written to disk
+        self.export_reports: List[ExportReport] = []
+        # TimingReport for each export that was timed (translate(..., timings=True))
+        self.timing_reports: List[TimingReport] = []
+
+        self.tool_translations = 0
+        self.tool_hits = 0
+        self.workflow_translations = 0
+        self.workflow_hits = 0
+        self.stringify_hits = 0
+
+    @staticmethod
+    def try_get_session(
+        session: Optional["TranslationSession"], cache=None
+    ) -> "TranslationSession":
+        if session is None:
+            return TranslationSession(cache=cache)
+        if (
+            cache is not None
+            and TranslationCache.try_get_cache(cache) is not session.cache
+        ):
+            raise Exception(
+                "Couldn't use the cache as a translation session was also provided, "
+                "construct the TranslationSession with the cache instead"
+            )
+        return session
+
+    @staticmethod
+    def tool_key(
+        translator: str,
+        tool,
+        with_container=True,
+        with_resource_overrides=False,
+        allow_empty_container=False,
+        container=None,
+    ) -> Tuple:
+        return (
+            translator,
+            tool.versioned_id(),
+            # eg: two tools built with the same id and version, but different commands
+            tool.structural_hash(),
+            with_container,
+            with_resource_overrides,
+            allow_empty_container,
+            container,
+        )
+
+    @staticmethod
+    def workflow_key(
+        translator: str,
+        workflow,
+        is_nested_tool=False,
+        with_container=True,
+        with_resource_overrides=False,
+        allow_empty_container=False,
+        container_override: dict = None,
+    ) -> Tuple:
+        return (
+            translator,
+            workflow.versioned_id(),
+            # eg: a pruned workflow keeps the id of the original
+            workflow.structural_hash(),
+            is_nested_tool,
+            with_container,
+            with_resource_overrides,
+            allow_empty_container,
+            tuple(sorted((container_override or {}).items())),
+        )
+
+    def get_tool(self, key: Tuple):
+        translated = self.tools.get(key)
+        if translated is not None:
+            if key in self._preloaded:
+                # the first use of a preloaded tool isn't a repeat translation
+                self._preloaded.discard(key)
+            else:
+                self.tool_hits += 1
+        return translated
+
+    def set_tool(self, key: Tuple, translated):
+        self.tools[key] = translated
+
+    def preload_tool(self, key: Tuple, translated):
+        """
+        Store a tool that was translated ahead of time (eg: in a process pool)
+        """
+        self.tools[key] = translated
+        self._preloaded.add(key)
+
+    def get_workflow(self, key: Tuple) -> Optional[Tuple[Any, Dict[str, Any]]]:
+        translated = self.workflows.get(key)
+        if translated is not None:
+            self.workflow_hits += 1
+        return translated
+
+    def set_workflow(self, key: Tuple, translated: Tuple[Any, Dict[str, Any]]):
+        self.workflow_translations += 1
+        self.workflows[key] = translated
+
+    def stringify(self, translated, stringify: Callable[[Any], str]) -> str:
+        """
+        Stringify a translated tool once, however many exports it's part of. Tools
+        loaded from the cache are already stringified.
+        """
+        if isinstance(translated, str):
+            return translated
+
+        key = id(translated)
+        if key in self._stringified:
+            self.stringify_hits += 1
+        else:
+            self._stringified[key] = (translated, stringify(translated))
+        return self._stringified[key][1]
+
+    def summary(self) -> Dict[str, int]:
+        summary = {
+            "tool_translations": self.tool_translations,
+            "tool_hits": self.tool_hits,
+            "workflow_translations": self.workflow_translations,
+            "workflow_hits": self.workflow_hits,
+            "stringify_hits": self.stringify_hits,
+        }
+        if self.cache is not None:
+            summary["cache_hits"] = self.cache.hits
+            summary["cache_misses"] = self.cache.misses
+        return summary
@@ -1,8 +1,11 @@
-from typing import Dict, Union
+from typing import Dict, List, Tuple, Union
 
+from janis_core.tool.tool import ToolType
 from janis_core.utils import lowercase_dictkeys
 
 from janis_core.translationdeps.exportpath import ExportPathKeywords
+from janis_core.translationdeps.exportwriter import DEFAULT_ZIP_COMPRESSION_LEVEL
+from janis_core.translationdeps.translationsession import TranslationSession
 from janis_core.translations.wdl import WdlTranslator
 from .cwl import CwlTranslator
 from .translationbase import TranslatorBase
@@ -37,6 +40,14 @@ def translate_workflow(
     max_duration=None,
     allow_empty_container=False,
     container_override: dict = None,
+    cache=None,
+    parallel: int = None,
+    session=None,
+    incremental=False,
+    zip_compression_level: int = DEFAULT_ZIP_COMPRESSION_LEVEL,
+    packed=False,
+    as_json=False,
+    timings=False,
 ):
     translator = get_translator(translation)
     return translator.translate(
@@ -59,9 +70,88 @@ def translate_workflow(
         max_duration=max_duration,
         allow_empty_container=allow_empty_container,
         container_override=lowercase_dictkeys(container_override),
+        cache=cache,
+        parallel=parallel,
+        session=session,
+        incremental=incremental,
+        zip_compression_level=zip_compression_level,
+        packed=packed,
+        as_json=as_json,
+        timings=timings,
     )
 
 
+def translate_many(
+    workflows: list,
+    translations: List[Union[str, SupportedTranslation]],
+    to_console=False,
+    with_docker=True,
+    with_resource_overrides=False,
+    allow_empty_container=False,
+    container_override: dict = None,
+    cache=None,
+    parallel: int = None,
+    session: TranslationSession = None,
+    **kwargs,
+) -> Tuple[Dict[str, Dict[str, tuple]], Dict[str, int]]:
+    """
+    Export many workflows (to each of the translations) in one pass, with one
+    translation session, so a tool shared between workflows is only translated (and
+    stringified) once per translation.
+
+    :param workflows: The workflows (or tools) to export, their versioned ids must be unique
+    :param translations: eg: ["cwl", "wdl"]
+    :param cache: A TranslationCache (or a directory to create one in)
+    :param parallel: Translate the unique tools of all the workflows in a pool of this
+        many processes (one pool per translation).
+    :param session: The TranslationSession to share, one is created if not provided.
+    :param kwargs: Passed to each translate call (eg: to_disk, export_path). The timings
+        (timings=True) are added to the session, and logged if there's neither a session
+        provided nor to_disk.
+    :return: ({versioned_id: {translation: (str_tool, str_inp, str_tools)}}, summary),
+        where the summary has the tool / workflow / cache hits of the session.
+    """
+    ids = [w.versioned_id() for w in workflows]
+    duplicates = sorted(set(i for i in ids if ids.count(i) > 1))
+    if duplicates:
+        raise Exception(
+            "Couldn't translate the workflows as their (versioned) ids must be unique, "
+            "found duplicates: " + ", ".join(duplicates)
+        )
+
+    log_timings = session is None and not kwargs.get("to_disk")
+    session = TranslationSession.try_get_session(session, cache=cache)
+    container_override = lowercase_dictkeys(container_override)
+    options = {
+        "with_container": with_docker,
+        "with_resource_overrides": with_resource_overrides,
+        "allow_empty_container": allow_empty_container,
+        "container_override": container_override,
+    }
+
+    results = {i: {} for i in ids}
+    for translation in translations:
+        translator = get_translator(translation)
+        if parallel is not None and parallel > 1:
+            translator.translate_tools_in_parallel(
+                [w for w in workflows if w.type() == ToolType.Workflow],
+                parallel=parallel,
+                session=session,
+                **options,
+            )
+
+        for w in workflows:
+            results[w.versioned_id()][str(translation)] = translator.translate(
+                w, to_console=to_console, session=session, **options, **kwargs
+            )
+
+    if log_timings:
+        for report in session.timing_reports:
+            report.log()
+
+    return results, session.summary()
+
+
 def translate_code_tool(
     tool,
     translation: Union[str, SupportedTranslation],
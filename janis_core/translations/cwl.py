@@ -28,7 +28,10 @@ import ruamel.yaml
 
 from janis_core.deps import cwlgen
 
+from janis_core.translationdeps.cwlemitter import emit_cwl, SHEBANG
 from janis_core.translationdeps.supportedtranslations import SupportedTranslation
+from janis_core.translationdeps.timingreport import timed_phase
+from janis_core.translationdeps.translationsession import TranslationSession
 from janis_core.code.codetool import CodeTool
 from janis_core.graph.steptaginput import Edge, StepTagInput
 from janis_core.operators import (
@@ -70,7 +73,6 @@ from janis_core.utils.metadata import ToolMetadata
 from janis_core.workflow.workflow import StepNode, InputNode, OutputNode
 
 CWL_VERSION = "v1.2"
-SHEBANG = "#!/usr/bin/env cwl-runner"
 yaml = ruamel.yaml.YAML()
 
 STDOUT_NAME = "_stdout"
@@ -99,13 +101,10 @@ class CwlTranslator(TranslatorBase, metaclass=TranslatorMeta):
         if as_json:
             return json.dumps(saved)
 
-        formatted = SHEBANG + "\n" + CwlTranslator.stringify_commentedmap(saved)
         if should_format:
-            from cwlformat.formatter import cwl_format
+            return emit_cwl(saved)
 
-            formatted = cwl_format(formatted)
-
-        return formatted
+        return SHEBANG + "\n" + CwlTranslator.stringify_commentedmap(saved)
 
     @staticmethod
     def stringify_translated_tool(
@@ -116,13 +115,10 @@ class CwlTranslator(TranslatorBase, metaclass=TranslatorMeta):
         if as_json:
             return json.dumps(saved)
 
-        formatted = SHEBANG + "\n" + CwlTranslator.stringify_commentedmap(saved)
         if should_format:
-            from cwlformat.formatter import cwl_format
-
-            formatted = cwl_format(formatted)
+            return emit_cwl(saved)
 
-        return formatted
+        return SHEBANG + "\n" + CwlTranslator.stringify_commentedmap(saved)
 
     @staticmethod
     def stringify_translated_inputs(inputs):
@@ -143,7 +139,17 @@ class CwlTranslator(TranslatorBase, metaclass=TranslatorMeta):
         is_packed=False,
         allow_empty_container=False,
         container_override=None,
+        session: TranslationSession = None,
+        translate_tools=True,
     ) -> Tuple[cwlgen.Workflow, Dict[str, any]]:
+        """
+        :param session: Memoizes the translated tools and subworkflows, so each is only
+            translated once. If the session has a cache, command and code tools are
+            returned already stringified.
+        :param translate_tools: If False, only this workflow is translated (the returned
+            tools are empty), eg: to stream the tools separately
+        """
+        session = TranslationSession.try_get_session(session)
 
         metadata = wf.metadata
         w = cwlgen.Workflow(
@@ -208,14 +214,16 @@ class CwlTranslator(TranslatorBase, metaclass=TranslatorMeta):
 
         tools = {}
         tools_to_build: Dict[str, Tool] = {
-            s.tool.id(): s.tool for s in wf.step_nodes.values()
+            s.tool.versioned_id(): s.tool
+            for s in wf.step_nodes.values()
+            if translate_tools
         }
         for t in tools_to_build:
             tool: Tool = tools_to_build[t]
             if tool.type() == ToolType.Workflow:
-                wf_cwl, subtools = cls.translate_workflow(
+                wf_cwl, subtools = cls.translate_subworkflow_in_session(
                     tool,
-                    is_nested_tool=True,
+                    session=session,
                     with_container=with_container,
                     with_resource_overrides=with_resource_overrides,
                     allow_empty_container=allow_empty_container,
@@ -223,23 +231,15 @@ class CwlTranslator(TranslatorBase, metaclass=TranslatorMeta):
                 )
                 tools[tool.versioned_id()] = wf_cwl
                 tools.update(subtools)
-            elif isinstance(tool, CommandTool):
-                tool_cwl = cls.translate_tool_internal(
+            elif isinstance(tool, (CommandTool, CodeTool)):
+                tools[tool.versioned_id()] = cls.translate_tool_in_session(
                     tool,
+                    session=session,
                     with_container=with_container,
                     with_resource_overrides=with_resource_overrides,
                     allow_empty_container=allow_empty_container,
                     container_override=container_override,
                 )
-                tools[tool.versioned_id()] = tool_cwl
-            elif isinstance(tool, CodeTool):
-                tool_cwl = cls.translate_code_tool_internal(
-                    tool,
-                    with_docker=with_container,
-                    allow_empty_container=allow_empty_container,
-                    container_override=container_override,
-                )
-                tools[tool.versioned_id()] = tool_cwl
             else:
                 raise Exception(f"Unknown tool type: '{type(tool)}'")
 
@@ -399,6 +399,53 @@ class CwlTranslator(TranslatorBase, metaclass=TranslatorMeta):
 
         return inp
 
+    @classmethod
+    def translate_packed_workflow(
+        cls,
+        wf,
+        with_container=True,
+        with_resource_overrides=False,
+        allow_empty_container=False,
+        container_override=None,
+        as_json=False,
+    ) -> str:
+        """
+        Translate the workflow into a single (packed) $graph document, where each
+        distinct tool and subworkflow is defined once, and the steps refer to it by id.
+        The workflow itself has the id 'main'.
+        """
+        # the tools need to be translated (not stringified), so don't use the cache
+        w, tools = cls.translate_workflow(
+            wf,
+            with_container=with_container,
+            with_resource_overrides=with_resource_overrides,
+            allow_empty_container=allow_empty_container,
+            container_override=container_override,
+            session=TranslationSession(),
+        )
+
+        # run references are relative to the tools directory, or to a nested workflow
+        run_refs = {}
+        for vid in tools:
+            run_refs[cls.tool_filename(vid)] = "#" + vid
+            run_refs["tools/" + cls.tool_filename(vid)] = "#" + vid
+
+        graph = []
+        for vid, translated in [*tools.items(), ("main", w)]:
+            saved = translated.save()
+            saved["id"] = vid
+            saved.pop("cwlVersion", None)
+            for step in saved.get("steps", []):
+                if isinstance(step.get("run"), str):
+                    step["run"] = run_refs.get(step["run"], step["run"])
+            graph.append(saved)
+
+        packed = {"cwlVersion": CWL_VERSION, "$graph": graph}
+        if as_json:
+            return json.dumps(packed)
+
+        return emit_cwl(packed)
+
     @classmethod
     @try_catch_translate(type="workflow (all in one)")
     def translate_workflow_to_all_in_one(
@@ -840,6 +887,7 @@ class CwlTranslator(TranslatorBase, metaclass=TranslatorMeta):
             )
 
     @classmethod
+    @timed_phase("unwrap_expression")
     def unwrap_expression(
         cls,
         value,
@@ -101,6 +101,16 @@ class JanisTranslator(TranslatorBase):
             f"Unrecognised tool type {tool}: {tool.__class__.__name__}"
         )
 
+    @classmethod
+    def translate_tools_in_parallel(cls, workflow, parallel: int, session, **kwargs):
+        # tools are generated inline with the workflow, so there's nothing to share out
+        pass
+
+    @classmethod
+    def translate_tools_iter(cls, workflow, seen, **options):
+        # tools are generated inline with the workflow, so there are no tool files
+        return iter(())
+
     def translate_workflow(
         self,
         workflow,
@@ -108,7 +118,10 @@ class JanisTranslator(TranslatorBase):
         with_resource_overrides=False,
         allow_empty_container=False,
         container_override: dict = None,
+        session=None,
+        translate_tools=True,
     ) -> Tuple[any, Dict[str, any]]:
+        # tools are generated inline in the same file, so the session (and its cache) don't apply
         str_wf, subtools = self.generate_workflow_string(workflow)
 
         nl = "\n"
@@ -1,6 +1,6 @@
 import os
 from abc import ABC, abstractmethod
-from typing import Tuple, List, Dict
+from typing import Tuple, List, Dict, Callable, Any, Optional, Union, Iterator, Set
 import functools
 
 from path import Path
@@ -9,6 +9,21 @@ from janis_core.code.codetool import CodeTool
 from janis_core.tool.commandtool import ToolInput
 from janis_core.tool.tool import ToolType
 from janis_core.translationdeps.exportpath import ExportPathKeywords
+from janis_core.translationdeps.exportwriter import (
+    DirectoryWriter,
+    ExportReport,
+    ExportWriter,
+    build_zip,
+    DEFAULT_ZIP_COMPRESSION_LEVEL,
+)
+from janis_core.translationdeps.timingreport import (
+    TimingReport,
+    no_timing,
+    recording,
+    timed,
+)
+from janis_core.translationdeps.translationcache import TranslationCache
+from janis_core.translationdeps.translationsession import TranslationSession
 from janis_core.types.common_data_types import Int
 from janis_core.utils import lowercase_dictkeys
 from janis_core.utils.logger import Logger
@@ -54,6 +69,24 @@ def try_catch_translate(type):
     return try_catch_translate_inner
 
 
+def _detached(tool):
+    # the connections (and workflow) refer back into the workflow graph, which
+    # we don't need (or want) to send to the process pool
+    from copy import copy
+
+    t = copy(tool)
+    t.connections = {}
+    t.__dict__.pop("workflow", None)
+    return t
+
+
+def _translate_and_stringify_tool(translator, tool, options: dict) -> str:
+    # module level, so it can be pickled into the process pool
+    return translator.stringify_translated_tool(
+        translator.translate_unique_tool_internal(tool, **options)
+    )
+
+
 class TranslatorMeta(type(ABC)):
     def __repr__(cls):
         return cls.__name__
@@ -117,152 +150,327 @@ class TranslatorBase(ABC):
         with_container=True,
         allow_empty_container=False,
         container_override=None,
+        cache: Union[str, TranslationCache] = None,
+        parallel: int = None,
+        session: TranslationSession = None,
+        incremental=False,
+        zip_compression_level: int = DEFAULT_ZIP_COMPRESSION_LEVEL,
+        packed=False,
+        as_json=False,
+        timings=False,
     ):
-
+        """
+        :param cache: A TranslationCache (or a directory to create one in), tools that
+            haven't changed since they were last translated are loaded from this cache.
+        :param parallel: Translate the unique tools of a workflow in a pool of this many
+            processes, the output is identical to translating them serially.
+        :param session: A TranslationSession to share translated tools and subworkflows
+            between exports, one is created for this export if not provided.
+        :param incremental: When writing to disk, only write the files that have changed
+            since the last export. The written and skipped files are recorded in
+            session.export_reports.
+        :param zip_compression_level: The compression level (0-9) of tools.zip, which is
+            reproducible (sorted entries with a fixed timestamp) for the same tools.
+        :param packed: Export the workflow as one self-contained document, where each
+            distinct tool is defined once (see translate_packed_workflow), there are no
+            tool files or tools.zip.
+        :param as_json: Output the packed workflow as JSON.
+        :param timings: Record the wall time and calls of each phase (and of translating
+            each tool) into a TimingReport, which is appended to session.timing_reports
+            (and written to the export directory as '.janis-timings.json' if to_disk),
+            if neither a session is provided nor the export written to disk, it's logged.
+        """
+
+        log_timings = session is None and not to_disk
         str_tool, tr_tools = None, []
+        session = TranslationSession.try_get_session(session, cache=cache)
+        container_override = lowercase_dictkeys(container_override)
+
+        report = TimingReport(tool.versioned_id()) if timings else None
+        with recording(report) if report is not None else no_timing():
+
+            if tool.type() == ToolType.Workflow and packed:
+                tr_tools = {}
+                with timed("translate_packed_workflow"):
+                    str_tool = self.translate_packed_workflow(
+                        tool,
+                        with_container=with_container,
+                        with_resource_overrides=with_resource_overrides,
+                        allow_empty_container=allow_empty_container,
+                        container_override=container_override,
+                        as_json=as_json,
+                    )
+            elif tool.type() == ToolType.Workflow:
+                if parallel is not None and parallel > 1:
+                    with timed("translate_tools_in_parallel"):
+                        self.translate_tools_in_parallel(
+                            tool,
+                            parallel=parallel,
+                            session=session,
+                            with_container=with_container,
+                            with_resource_overrides=with_resource_overrides,
+                            allow_empty_container=allow_empty_container,
+                            container_override=container_override,
+                        )
 
-        if tool.type() == ToolType.Workflow:
-            tr_tool, tr_tools = self.translate_workflow(
-                tool,
-                with_container=with_container,
-                with_resource_overrides=with_resource_overrides,
-                allow_empty_container=allow_empty_container,
-                container_override=lowercase_dictkeys(container_override),
-            )
-            str_tool = self.stringify_translated_workflow(tr_tool)
-        elif isinstance(tool, CodeTool):
-            tr_tool = self.translate_code_tool_internal(
-                tool,
-                allow_empty_container=allow_empty_container,
-                container_override=lowercase_dictkeys(container_override),
-            )
-            str_tool = self.stringify_translated_tool(tr_tool)
-        else:
-            tr_tool = self.translate_tool_internal(
-                tool,
-                with_container=with_container,
-                with_resource_overrides=with_resource_overrides,
-                allow_empty_container=allow_empty_container,
-                container_override=lowercase_dictkeys(container_override),
-            )
-            str_tool = self.stringify_translated_tool(tr_tool)
+                with timed("translate_workflow"):
+                    tr_tool, tr_tools = self.translate_workflow(
+                        tool,
+                        with_container=with_container,
+                        with_resource_overrides=with_resource_overrides,
+                        allow_empty_container=allow_empty_container,
+                        container_override=container_override,
+                        session=session,
+                    )
+                with timed("stringify"):
+                    str_tool = self.stringify_translated_workflow(tr_tool)
+            else:
+                tr_tool = self.translate_single_tool_in_session(
+                    tool,
+                    session=session,
+                    with_container=with_container,
+                    with_resource_overrides=with_resource_overrides,
+                    allow_empty_container=allow_empty_container,
+                    container_override=container_override,
+                )
+                with timed("stringify"):
+                    str_tool = (
+                        tr_tool
+                        if isinstance(tr_tool, str)
+                        else self.stringify_translated_tool(tr_tool)
+                    )
 
-        tr_inp = self.build_inputs_file(
-            tool,
-            recursive=False,
-            merge_resources=merge_resources,
-            hints=hints,
-            additional_inputs=additional_inputs,
-            max_cores=max_cores,
-            max_mem=max_mem,
-            max_duration=max_duration,
-        )
-        tr_res = self.build_resources_input(tool, hints)
+            with timed("build_inputs_file"):
+                tr_inp = self.build_inputs_file(
+                    tool,
+                    recursive=False,
+                    merge_resources=merge_resources,
+                    hints=hints,
+                    additional_inputs=additional_inputs,
+                    max_cores=max_cores,
+                    max_mem=max_mem,
+                    max_duration=max_duration,
+                )
+            with timed("build_resources_input"):
+                tr_res = self.build_resources_input(tool, hints)
+
+            with timed("stringify"):
+                str_inp = self.stringify_translated_inputs(tr_inp)
+                str_tools = [
+                    (
+                        "tools/" + self.tool_filename(t),
+                        session.stringify(
+                            tr_tools[t], self.stringify_translated_workflow
+                        ),
+                    )
+                    for t in tr_tools
+                ]
+                str_resources = self.stringify_translated_inputs(tr_res)
+
+            if to_console:
+                print("=== WORKFLOW ===")
+                print(str_tool)
+                if tool_to_console:
+                    print("\n=== TOOLS ===")
+                    [print(f":: {t[0]} ::\n" + t[1]) for t in str_tools]
+                print("\n=== INPUTS ===")
+                print(str_inp)
+                if not merge_resources and with_resource_overrides:
+                    print("\n=== RESOURCES ===")
+                    print(str_resources)
 
-        str_inp = self.stringify_translated_inputs(tr_inp)
-        str_tools = [
-            (
-                "tools/" + self.tool_filename(t),
-                self.stringify_translated_workflow(tr_tools[t]),
+            d = ExportPathKeywords.resolve(
+                export_path, workflow_spec=self.name, workflow_name=tool.versioned_id()
             )
-            for t in tr_tools
-        ]
-        str_resources = self.stringify_translated_inputs(tr_res)
 
-        if to_console:
-            print("=== WORKFLOW ===")
-            print(str_tool)
-            if tool_to_console:
-                print("\n=== TOOLS ===")
-                [print(f":: {t[0]} ::\n" + t[1]) for t in str_tools]
-            print("\n=== INPUTS ===")
-            print(str_inp)
-            if not merge_resources and with_resource_overrides:
-                print("\n=== RESOURCES ===")
-                print(str_resources)
-
-        d = ExportPathKeywords.resolve(
-            export_path, workflow_spec=self.name, workflow_name=tool.versioned_id()
-        )
+            fn_workflow = self.workflow_filename(tool)
+            fn_inputs = self.inputs_filename(tool)
+            fn_resources = self.resources_filename(tool)
 
-        fn_workflow = self.workflow_filename(tool)
-        fn_inputs = self.inputs_filename(tool)
-        fn_resources = self.resources_filename(tool)
+            if to_disk:
+                with timed("write_to_disk"):
+                    writer = DirectoryWriter(d, incremental=incremental)
 
-        if to_disk and write_inputs_file:
-            if not os.path.isdir(d):
-                os.makedirs(d)
+                    if write_inputs_file:
+                        writer.write(fn_inputs, str_inp)
+                    else:
+                        Logger.log("Skipping writing input (yaml) job file")
 
-            with open(os.path.join(d, fn_inputs), "w+") as f:
-                Logger.log(f"Writing {fn_inputs} to disk")
-                f.write(str_inp)
-                Logger.log(f"Written {fn_inputs} to disk")
-        else:
-            Logger.log("Skipping writing input (yaml) job file")
+                    Logger.info(f"Exporting tool files to '{d}'")
 
-        if to_disk:
+                    if not packed:
+                        os.makedirs(os.path.join(d, "tools"), exist_ok=True)
+                    writer.write(fn_workflow, str_tool)
 
-            toolsdir = os.path.join(d, "tools")
-            if not os.path.isdir(toolsdir):
-                os.makedirs(toolsdir)
-
-            Logger.info(f"Exporting tool files to '{d}'")
-
-            with open(os.path.join(d, fn_workflow), "w+") as wf:
-                Logger.log(f"Writing {fn_workflow} to disk")
-                wf.write(str_tool)
-                Logger.log(f"Wrote {fn_workflow}  to disk")
-
-            for (fn_tool, disk_str_tool) in str_tools:
-                with open(os.path.join(d, fn_tool), "w+") as toolfp:
-                    Logger.log(f"Writing {fn_tool} to disk")
-                    toolfp.write(disk_str_tool)
-                    Logger.log(f"Written {fn_tool} to disk")
-
-            if not merge_resources and with_resource_overrides:
-                print("\n=== RESOURCES ===")
-                with open(os.path.join(d, fn_resources), "w+") as wf:
-                    Logger.log(f"Writing {fn_resources} to disk")
-                    wf.write(str_inp)
-                    Logger.log(f"Wrote {fn_resources}  to disk")
-                print(str_resources)
-
-            import subprocess
-
-            if should_zip:
-                Logger.debug("Zipping tools")
-                with Path(d):
-                    FNULL = open(os.devnull, "w")
-                    zip_result = subprocess.run(
-                        ["zip", "-r", "tools.zip", "tools/"], stdout=FNULL
-                    )
-                    if zip_result.returncode == 0:
+                    for (fn_tool, disk_str_tool) in str_tools:
+                        writer.write(fn_tool, disk_str_tool)
+
+                    if not merge_resources and with_resource_overrides:
+                        print("\n=== RESOURCES ===")
+                        writer.write(fn_resources, str_inp)
+                        print(str_resources)
+
+                    if should_zip and not packed:
+                        Logger.debug("Zipping tools")
+                        with timed("zip"):
+                            zipped = build_zip(
+                                str_tools, compression_level=zip_compression_level
+                            )
+                        writer.write("tools.zip", zipped)
                         Logger.debug("Zipped tools")
-                    else:
-                        Logger.critical(str(zip_result.stderr.decode()))
 
-            if should_validate:
-                with Path(d):
+                    session.export_reports.append(writer.close())
 
-                    Logger.info(f"Validating outputted {self.name}")
+                import subprocess
 
-                    enved_vcs = [
-                        (os.getenv(x[1:]) if x.startswith("$") else x)
-                        for x in self.validate_command_for(
-                            fn_workflow, fn_inputs, "tools/", "tools.zip"
-                        )
-                    ]
+                if should_validate:
+                    with Path(d), timed("validate"):
 
-                    cwltool_result = subprocess.run(enved_vcs)
-                    if cwltool_result.returncode == 0:
-                        Logger.info(
-                            "Exported tool was validated by: " + " ".join(enved_vcs)
-                        )
-                    else:
-                        Logger.critical(str(cwltool_result.stderr))
+                        Logger.info(f"Validating outputted {self.name}")
+
+                        enved_vcs = [
+                            (os.getenv(x[1:]) if x.startswith("$") else x)
+                            for x in self.validate_command_for(
+                                fn_workflow, fn_inputs, "tools/", "tools.zip"
+                            )
+                        ]
+
+                        cwltool_result = subprocess.run(enved_vcs)
+                        if cwltool_result.returncode == 0:
+                            Logger.info(
+                                "Exported tool was validated by: " + " ".join(enved_vcs)
+                            )
+                        else:
+                            Logger.critical(str(cwltool_result.stderr))
+
+        if report is not None:
+            session.timing_reports.append(report)
+            if to_disk:
+                report.write(os.path.join(d, TimingReport.FILENAME))
+            elif log_timings:
+                report.log()
 
         return str_tool, str_inp, str_tools
 
+    def translate_iter(
+        self,
+        tool,
+        with_container=True,
+        with_resource_overrides=False,
+        allow_empty_container=False,
+        container_override=None,
+        write_inputs_file=True,
+        merge_resources=False,
+        hints=None,
+        additional_inputs: Dict = None,
+        max_cores=None,
+        max_mem=None,
+        max_duration=None,
+        session: TranslationSession = None,
+        cache=None,
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Translate the tool, yielding the (relative path, content) of each file of the
+        export as soon as it's translated. Unlike translate, the translations aren't held
+        onto, so the memory used is proportional to the largest file (not the export).
+
+        :param session: Translate (and stringify) each CommandTool / CodeTool once in
+            the session, or load it from the session's cache. The session holds onto
+            these translations, the subworkflows are still streamed.
+        :param cache: A TranslationCache (or a directory to create one in), for a new
+            session. Without a session or cache, every tool is translated.
+        """
+        container_override = lowercase_dictkeys(container_override)
+        options = {
+            "with_container": with_container,
+            "with_resource_overrides": with_resource_overrides,
+            "allow_empty_container": allow_empty_container,
+            "container_override": container_override,
+        }
+        fn_workflow = self.workflow_filename(tool)
+        if session is not None or cache is not None:
+            session = TranslationSession.try_get_session(session, cache=cache)
+
+        if tool.type() == ToolType.Workflow:
+            yield from self.translate_tools_iter(
+                tool, seen=set(), session=session, **options
+            )
+            tr_tool, _ = self.translate_workflow(tool, translate_tools=False, **options)
+            yield fn_workflow, self.stringify_translated_workflow(tr_tool)
+        elif session is not None:
+            tr_tool = self.translate_single_tool_in_session(
+                tool, session=session, **options
+            )
+            yield fn_workflow, session.stringify(tr_tool, self.stringify_translated_tool)
+        elif isinstance(tool, CodeTool):
+            tr_tool = self.translate_code_tool_internal(
+                tool,
+                allow_empty_container=allow_empty_container,
+                container_override=container_override,
+            )
+            yield fn_workflow, self.stringify_translated_tool(tr_tool)
+        else:
+            tr_tool = self.translate_tool_internal(tool, **options)
+            yield fn_workflow, self.stringify_translated_tool(tr_tool)
+
+        if write_inputs_file:
+            tr_inp = self.build_inputs_file(
+                tool,
+                recursive=False,
+                merge_resources=merge_resources,
+                hints=hints,
+                additional_inputs=additional_inputs,
+                max_cores=max_cores,
+                max_mem=max_mem,
+                max_duration=max_duration,
+            )
+            yield self.inputs_filename(tool), self.stringify_translated_inputs(tr_inp)
+
+        if not merge_resources and with_resource_overrides:
+            tr_res = self.build_resources_input(tool, hints)
+            yield self.resources_filename(tool), self.stringify_translated_inputs(tr_res)
+
+    @classmethod
+    def translate_tools_iter(
+        cls, workflow, seen: Set[str], session: TranslationSession = None, **options
+    ) -> Iterator[Tuple[str, str]]:
+        """
+        Recursively translate the tools and subworkflows of a workflow (skipping
+        those in seen), yielding the (relative path, content) of each.
+
+        :param session: Translate the tools in the session, see translate_iter
+        """
+        for s in workflow.step_nodes.values():
+            tool = s.tool
+            if tool.versioned_id() in seen:
+                continue
+            seen.add(tool.versioned_id())
+
+            fn_tool = "tools/" + cls.tool_filename(tool)
+            if tool.type() == ToolType.Workflow:
+                tr_tool, _ = cls.translate_workflow(
+                    tool, is_nested_tool=True, translate_tools=False, **options
+                )
+                yield fn_tool, cls.stringify_translated_workflow(tr_tool)
+                yield from cls.translate_tools_iter(
+                    tool, seen=seen, session=session, **options
+                )
+            elif session is not None:
+                tr_tool = cls.translate_tool_in_session(tool, session=session, **options)
+                yield fn_tool, session.stringify(tr_tool, cls.stringify_translated_tool)
+            else:
+                tr_tool = cls.translate_unique_tool_internal(tool, **options)
+                yield fn_tool, cls.stringify_translated_tool(tr_tool)
+
+    def translate_to_writer(self, tool, writer: ExportWriter, **kwargs) -> ExportReport:
+        """
+        Stream the translation of the tool into the writer, eg: a DirectoryWriter,
+        ZipWriter or CallbackWriter. The kwargs are passed to translate_iter.
+        """
+        for relpath, content in self.translate_iter(tool, **kwargs):
+            writer.write(relpath, content)
+        return writer.close()
+
     def translate_tool(
         self,
         tool,
@@ -342,6 +550,296 @@ class TranslatorBase(ABC):
 
         return tool_out
 
+    @classmethod
+    def translate_tool_in_session(
+        cls,
+        tool,
+        session: TranslationSession,
+        with_container=True,
+        with_resource_overrides=False,
+        allow_empty_container=False,
+        container_override: dict = None,
+        translate: Callable[[], Any] = None,
+    ):
+        """
+        Translate a CommandTool / CodeTool, unless the session has already translated
+        it (with the same options). If the session has a cache, the tool is returned
+        stringified, and is loaded from the cache if it's unchanged since it was last
+        translated.
+
+        :param translate: Performs the translation, defaults to translate_unique_tool_internal
+        """
+        container = (
+            cls.get_container_override_for_tool(tool, container_override)
+            or tool.container()
+        )
+        key = TranslationSession.tool_key(
+            cls.__name__,
+            tool,
+            with_container=with_container,
+            with_resource_overrides=with_resource_overrides,
+            allow_empty_container=allow_empty_container,
+            container=container,
+        )
+        translated = session.get_tool(key)
+        if translated is not None:
+            return translated
+
+        if translate is None:
+            translate = lambda: cls.translate_unique_tool_internal(
+                tool,
+                with_container=with_container,
+                with_resource_overrides=with_resource_overrides,
+                allow_empty_container=allow_empty_container,
+                container_override=container_override,
+            )
+
+        if session.cache is None:
+            session.tool_translations += 1
+            with timed("translate_tool", tool=tool.versioned_id()):
+                translated = translate()
+        else:
+            cache_key = TranslationCache.key_for(
+                cls.__name__,
+                tool,
+                with_container=with_container,
+                with_resource_overrides=with_resource_overrides,
+                allow_empty_container=allow_empty_container,
+                container=container,
+            )
+            translated = session.cache.get(cache_key)
+            if translated is not None:
+                Logger.log(f"Loaded translation of '{tool.versioned_id()}' from cache")
+            else:
+                session.tool_translations += 1
+                with timed("translate_tool", tool=tool.versioned_id()):
+                    translated = cls.stringify_translated_tool(translate())
+                session.cache.set(cache_key, translated)
+
+        session.set_tool(key, translated)
+        return translated
+
+    def translate_single_tool_in_session(
+        self,
+        tool,
+        session: TranslationSession,
+        with_container=True,
+        with_resource_overrides=False,
+        allow_empty_container=False,
+        container_override: dict = None,
+    ):
+        """
+        Translate a CommandTool / CodeTool that's exported on its own (rather than as
+        the step of a workflow) in the session, see translate_tool_in_session
+        """
+        options = {
+            "with_container": with_container,
+            "with_resource_overrides": with_resource_overrides,
+        }
+        translate = None
+        if isinstance(tool, CodeTool):
+            # a code tool on its own is translated with the translator's defaults,
+            # so it gets its own key (rather than sharing one with a workflow step)
+            options = {"with_container": True, "with_resource_overrides": None}
+            translate = lambda: self.translate_code_tool_internal(
+                tool,
+                allow_empty_container=allow_empty_container,
+                container_override=container_override,
+            )
+        return self.translate_tool_in_session(
+            tool,
+            session=session,
+            allow_empty_container=allow_empty_container,
+            container_override=container_override,
+            translate=translate,
+            **options,
+        )
+
+    @classmethod
+    def translate_subworkflow_in_session(
+        cls,
+        workflow,
+        session: TranslationSession,
+        with_container=True,
+        with_resource_overrides=False,
+        allow_empty_container=False,
+        container_override: dict = None,
+        **kwargs,
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Translate a nested workflow, unless the session has already translated it
+        (with the same options).
+        """
+        key = TranslationSession.workflow_key(
+            cls.__name__,
+            workflow,
+            is_nested_tool=True,
+            with_container=with_container,
+            with_resource_overrides=with_resource_overrides,
+            allow_empty_container=allow_empty_container,
+            container_override=container_override,
+        )
+        translated = session.get_workflow(key)
+        if translated is not None:
+            return translated
+
+        with timed("translate_subworkflow", tool=workflow.versioned_id()):
+            translated = cls.translate_workflow(
+                workflow,
+                is_nested_tool=True,
+                with_container=with_container,
+                with_resource_overrides=with_resource_overrides,
+                allow_empty_container=allow_empty_container,
+                container_override=container_override,
+                session=session,
+                **kwargs,
+            )
+        session.set_workflow(key, translated)
+        return translated
+
+    @classmethod
+    def translate_unique_tool_internal(
+        cls,
+        tool,
+        with_container=True,
+        with_resource_overrides=False,
+        allow_empty_container=False,
+        container_override: dict = None,
+    ):
+        """
+        Translate a CommandTool / CodeTool the way it's translated for a workflow step
+        """
+        if isinstance(tool, CodeTool):
+            return cls.translate_code_tool_internal(
+                tool,
+                with_docker=with_container,
+                allow_empty_container=allow_empty_container,
+                container_override=container_override,
+            )
+        return cls.translate_tool_internal(
+            tool,
+            with_container=with_container,
+            with_resource_overrides=with_resource_overrides,
+            allow_empty_container=allow_empty_container,
+            container_override=container_override,
+        )
+
+    @staticmethod
+    def get_unique_tools(workflow, tools: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Recursively collect the CommandTools / CodeTools of a workflow by versioned id
+        """
+        tools = tools if tools is not None else {}
+        for s in workflow.step_nodes.values():
+            tool = s.tool
+            if tool.type() == ToolType.Workflow:
+                TranslatorBase.get_unique_tools(tool, tools)
+            elif tool.versioned_id() not in tools:
+                tools[tool.versioned_id()] = tool
+        return tools
+
+    @classmethod
+    def translate_packed_workflow(
+        cls,
+        workflow,
+        with_container=True,
+        with_resource_overrides=False,
+        allow_empty_container=False,
+        container_override: dict = None,
+        as_json=False,
+    ) -> str:
+        raise Exception(f"The {cls.__name__} doesn't support packed workflows")
+
+    @classmethod
+    def translate_tools_in_parallel(
+        cls,
+        workflow,
+        parallel: int,
+        session: TranslationSession,
+        with_container=True,
+        with_resource_overrides=False,
+        allow_empty_container=False,
+        container_override: dict = None,
+    ):
+        """
+        Translate and stringify the unique tools of a workflow (or list of workflows)
+        in a pool of 'parallel' processes, and preload them into the session. Tools
+        that couldn't be translated in the pool (eg: they can't be pickled) are left
+        out, and are translated in the usual way.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        options = {
+            "with_container": with_container,
+            "with_resource_overrides": with_resource_overrides,
+            "allow_empty_container": allow_empty_container,
+            "container_override": container_override,
+        }
+
+        unique_tools = {}
+        for w in workflow if isinstance(workflow, list) else [workflow]:
+            unique_tools.update(cls.get_unique_tools(w))
+
+        to_translate = {}
+        for vid, tool in unique_tools.items():
+            container = (
+                cls.get_container_override_for_tool(tool, container_override)
+                or tool.container()
+            )
+            key = TranslationSession.tool_key(
+                cls.__name__,
+                tool,
+                with_container=with_container,
+                with_resource_overrides=with_resource_overrides,
+                allow_empty_container=allow_empty_container,
+                container=container,
+            )
+            if key in session.tools:
+                continue
+
+            cache_key = None
+            if session.cache is not None:
+                cache_key = TranslationCache.key_for(
+                    cls.__name__,
+                    tool,
+                    with_container=with_container,
+                    with_resource_overrides=with_resource_overrides,
+                    allow_empty_container=allow_empty_container,
+                    container=container,
+                )
+                str_tool = session.cache.get(cache_key)
+                if str_tool is not None:
+                    session.preload_tool(key, str_tool)
+                    continue
+
+            to_translate[vid] = (tool, key, cache_key)
+
+        if not to_translate:
+            return
+
+        with ProcessPoolExecutor(max_workers=parallel) as executor:
+            futures = {
+                vid: executor.submit(
+                    _translate_and_stringify_tool, cls, _detached(tool), options
+                )
+                for vid, (tool, _, _) in to_translate.items()
+            }
+            for vid, future in futures.items():
+                _, key, cache_key = to_translate[vid]
+                try:
+                    str_tool = future.result()
+                except Exception as e:
+                    Logger.log(
+                        f"Couldn't translate '{vid}' in parallel, translating "
+                        f"it in this process instead: {repr(e)}"
+                    )
+                    continue
+
+                session.tool_translations += 1
+                session.preload_tool(key, str_tool)
+                if cache_key is not None:
+                    session.cache.set(cache_key, str_tool)
+
     @classmethod
     def validate_inputs(cls, inputs, allow_null_if_optional):
         return True
@@ -383,6 +881,8 @@ class TranslatorBase(ABC):
         with_resource_overrides=False,
         allow_empty_container=False,
         container_override: dict = None,
+        session: TranslationSession = None,
+        translate_tools=True,
     ) -> Tuple[any, Dict[str, any]]:
         pass
 
@@ -42,6 +42,8 @@ from janis_core.operators import (
 from janis_core.tool.commandtool import CommandTool, ToolInput, ToolArgument, ToolOutput
 from janis_core.tool.tool import Tool, ToolType
 from janis_core.translationdeps.supportedtranslations import SupportedTranslation
+from janis_core.translationdeps.timingreport import timed_phase
+from janis_core.translationdeps.translationsession import TranslationSession
 from janis_core.translations.translationbase import (
     TranslatorBase,
     TranslatorMeta,
@@ -71,6 +73,7 @@ from janis_core.utils.scatter import ScatterDescription, ScatterMethod
 from janis_core.utils.secondary import (
     split_secondary_file_carats,
     apply_secondary_file_format_to_filename,
+    apply_secondary_file_formats_to_filenames,
 )
 from janis_core.utils.validators import Validators
 
@@ -126,6 +129,8 @@ class WdlTranslator(TranslatorBase, metaclass=TranslatorMeta):
         is_nested_tool=False,
         allow_empty_container=False,
         container_override=None,
+        session: TranslationSession = None,
+        translate_tools=True,
     ) -> Tuple[wdl.Workflow, Dict[str, any]]:
         """
         Translate the workflow into wdlgen classes!
@@ -134,8 +139,13 @@ class WdlTranslator(TranslatorBase, metaclass=TranslatorMeta):
         :param with_resource_overrides:
         :param with_container:
         :param is_nested_tool:
+        :param session: Memoizes the translated tasks and subworkflows, so each is only
+            translated once. If the session has a cache, tasks are returned already stringified.
+        :param translate_tools: If False, only this workflow is translated (the returned
+            tasks are empty), eg: to stream the tasks separately
         :return:
         """
+        session = TranslationSession.try_get_session(session)
 
         # Import needs to be here, otherwise we end up circularly importing everything
         # I need the workflow for type comparison
@@ -269,12 +279,12 @@ class WdlTranslator(TranslatorBase, metaclass=TranslatorMeta):
         for s in steps:
             t = s.tool
 
-            if t.versioned_id() not in wtools:
+            if translate_tools and t.versioned_id() not in wtools:
                 if t.type() == ToolType.Workflow:
-                    wf_wdl, wf_tools = cls.translate_workflow(
+                    wf_wdl, wf_tools = cls.translate_subworkflow_in_session(
                         t,
+                        session=session,
                         with_container=with_container,
-                        is_nested_tool=True,
                         with_resource_overrides=with_resource_overrides,
                         allow_empty_container=allow_empty_container,
                         container_override=container_override,
@@ -282,22 +292,15 @@ class WdlTranslator(TranslatorBase, metaclass=TranslatorMeta):
                     wtools[t.versioned_id()] = wf_wdl
                     wtools.update(wf_tools)
 
-                elif isinstance(t, CommandTool):
-                    wtools[t.versioned_id()] = cls.translate_tool_internal(
+                elif isinstance(t, (CommandTool, CodeTool)):
+                    wtools[t.versioned_id()] = cls.translate_tool_in_session(
                         t,
+                        session=session,
                         with_container=with_container,
                         with_resource_overrides=with_resource_overrides,
                         allow_empty_container=allow_empty_container,
                         container_override=container_override,
                     )
-                elif isinstance(t, CodeTool):
-                    wtools[t.versioned_id()] = cls.translate_code_tool_internal(
-                        t,
-                        with_docker=with_container,
-                        with_resource_overrides=with_resource_overrides,
-                        allow_empty_container=allow_empty_container,
-                        container_override=container_override,
-                    )
 
             resource_overrides = {}
 
@@ -411,6 +414,31 @@ class WdlTranslator(TranslatorBase, metaclass=TranslatorMeta):
 
         return wdl.Task(tool.id(), ins, outs, commands, r, version="development")
 
+    @classmethod
+    def translate_unique_tool_internal(
+        cls,
+        tool,
+        with_container=True,
+        with_resource_overrides=False,
+        allow_empty_container=False,
+        container_override: dict = None,
+    ):
+        if isinstance(tool, CodeTool):
+            return cls.translate_code_tool_internal(
+                tool,
+                with_docker=with_container,
+                with_resource_overrides=with_resource_overrides,
+                allow_empty_container=allow_empty_container,
+                container_override=container_override,
+            )
+        return super().translate_unique_tool_internal(
+            tool,
+            with_container=with_container,
+            with_resource_overrides=with_resource_overrides,
+            allow_empty_container=allow_empty_container,
+            container_override=container_override,
+        )
+
     @classmethod
     @try_catch_translate(type="code tool")
     def translate_code_tool_internal(
@@ -503,6 +531,7 @@ EOT"""
         return f'"{value}"' if not string_environment else value
 
     @classmethod
+    @timed_phase("unwrap_expression")
     def unwrap_expression(
         cls,
         expression,
@@ -1080,14 +1109,15 @@ EOT"""
                     ] = apply_secondary_file_format_to_filename(inp_val, sec)
             elif i.intype.is_array() and i.intype.subtype().secondary_files():
                 # handle array of secondary files
-                for sec in i.intype.subtype().secondary_files():
+                secs = i.intype.subtype().secondary_files()
+                names = (
+                    apply_secondary_file_formats_to_filenames(inp_val, secs)
+                    if inp_val
+                    else None
+                )
+                for idx, sec in enumerate(secs):
                     inp[get_secondary_tag_from_original_tag(inp_key, sec)] = (
-                        [
-                            apply_secondary_file_format_to_filename(iinp_val, sec)
-                            for iinp_val in inp_val
-                        ]
-                        if inp_val
-                        else None
+                        [n[idx] for n in names] if names is not None else None
                     )
 
         if merge_resources:
@@ -4,14 +4,21 @@
 import operator
 import os.path
 from inspect import isclass
-from typing import Dict, Any, Set, List, Optional
+from typing import Dict, Any, Set, List, Optional, Tuple, Type
 
 from janis_core.deps import cwlgen, wdlgen
 from janis_core.tool.test_classes import TTestExpectedOutput, TTestPreprocessor
 
 from janis_core.utils.logger import Logger
 from janis_core.__meta__ import GITHUB_URL
-from janis_core.types.data_types import DataType, NativeTypes, NativeType, ParseableType
+from janis_core.types.data_types import (
+    DataType,
+    NativeTypes,
+    NativeType,
+    ParseableType,
+    get_invalid_indices,
+    intern_type,
+)
 from janis_core.utils.generics_util import is_generic, is_qualified_generic
 
 
@@ -81,10 +88,29 @@ class UnionType(DataType):
     def validate_value(self, *args, **kwargs) -> bool:
         return any(t.validate_value(*args, **kwargs) for t in self.subtypes)
 
+    def validate_values(self, values: List[Any], allow_null_if_not_optional: bool):
+        # a value is invalid if none of the subtypes accept it, so each subtype only
+        # checks the values the previous subtypes rejected
+        invalid = list(range(len(values)))
+        for t in self.subtypes:
+            if not invalid:
+                break
+            rejected = t.validate_values(
+                [values[i] for i in invalid], allow_null_if_not_optional
+            )
+            invalid = [invalid[i] for i in rejected]
+        return invalid
+
     def invalid_value_hint(self, *args, **kwargs):
         hints = [t.invalid_value_hint(*args, **kwargs) for t in self.subtypes]
         return ", ".join(t for t in hints if t)
 
+    def compatibility_key(self) -> tuple:
+        return (
+            *super().compatibility_key(),
+            tuple(t.compatibility_key() for t in self.subtypes),
+        )
+
     def can_receive_from(self, other, *args, **kwargs):
         if isinstance(other, UnionType):
             # we'll require all elements in the source to be received by this type-
@@ -154,6 +180,14 @@ class String(DataType):
             return self.optional or allow_null_if_not_optional
         return isinstance(meta, (str, float, int))
 
+    def validate_values(self, values: List[Any], allow_null_if_not_optional: bool):
+        if type(self).validate_value is not String.validate_value:
+            # a subclass that validates differently
+            return super().validate_values(values, allow_null_if_not_optional)
+        return get_invalid_indices(
+            values, (str, float, int), self.optional or allow_null_if_not_optional
+        )
+
     def coerce_value_if_possible(self, value):
         return str(value)
 
@@ -273,6 +307,14 @@ class Int(DataType):
             return self.optional or allow_null_if_not_optional
         return isinstance(meta, int)
 
+    def validate_values(self, values: List[Any], allow_null_if_not_optional: bool):
+        if type(self).validate_value is not Int.validate_value:
+            # a subclass that validates differently
+            return super().validate_values(values, allow_null_if_not_optional)
+        return get_invalid_indices(
+            values, (int,), self.optional or allow_null_if_not_optional
+        )
+
     def coerce_value_if_possible(self, value):
         try:
             return int(value)
@@ -307,6 +349,14 @@ class Float(DataType):
             return self.optional or allow_null_if_not_optional
         return isinstance(meta, float) or isinstance(meta, int)
 
+    def validate_values(self, values: List[Any], allow_null_if_not_optional: bool):
+        if type(self).validate_value is not Float.validate_value:
+            # a subclass that validates differently
+            return super().validate_values(values, allow_null_if_not_optional)
+        return get_invalid_indices(
+            values, (float, int), self.optional or allow_null_if_not_optional
+        )
+
     def coerce_value_if_possible(self, value):
         try:
             return float(value)
@@ -449,6 +499,14 @@ class File(DataType):
             return self.optional or allow_null_if_not_optional
         return isinstance(meta, str)
 
+    def validate_values(self, values: List[Any], allow_null_if_not_optional: bool):
+        if type(self).validate_value is not File.validate_value:
+            # a subclass that validates differently
+            return super().validate_values(values, allow_null_if_not_optional)
+        return get_invalid_indices(
+            values, (str,), self.optional or allow_null_if_not_optional
+        )
+
     def invalid_value_hint(self, meta):
         if meta is None:
             return "value was null"
@@ -534,6 +592,14 @@ class Directory(DataType):
             return self.optional or allow_null_if_not_optional
         return isinstance(meta, str)
 
+    def validate_values(self, values: List[Any], allow_null_if_not_optional: bool):
+        if type(self).validate_value is not Directory.validate_value:
+            # a subclass that validates differently
+            return super().validate_values(values, allow_null_if_not_optional)
+        return get_invalid_indices(
+            values, (str,), self.optional or allow_null_if_not_optional
+        )
+
     def invalid_value_hint(self, meta):
         if meta is None:
             return "value was null"
@@ -608,6 +674,9 @@ class Array(DataType):
         ar = wdlgen.ArrayType(self._t.wdl(has_default=False), requires_multiple=False)
         return wdlgen.WdlType(ar, optional=self.optional or has_default)
 
+    def compatibility_key(self) -> tuple:
+        return (*super().compatibility_key(), self._t.compatibility_key())
+
     def can_receive_from(self, other, source_has_default=False):
         if other.is_array():
             return self._t.can_receive_from(other._t)
@@ -623,22 +692,21 @@ class Array(DataType):
             return self.optional or allow_null_if_not_optional
         if not isinstance(meta, list):
             return False
-        return all(
-            self.subtype().validate_value(q, allow_null_if_not_optional) for q in meta
-        )
+        return not self.subtype().validate_values(meta, allow_null_if_not_optional)
 
     def invalid_value_hint(self, meta):
         if meta is None:
             return "value was null"
-        if self.validate_value(meta, True):
-            return None
-
         if not isinstance(meta, list):
             return f"Value was of type {type(meta)}, expected type Array<{self.subtype().id()}>"
 
-        hints = []
         st = self.subtype()
-        for i in range(len(meta)):
+        invalid = st.validate_values(meta, True)
+        if not invalid:
+            return None
+
+        hints = []
+        for i in invalid:
             hint = st.invalid_value_hint(meta[i])
             if not hint:
                 continue
@@ -681,7 +749,7 @@ class Stdout(File):
 
         subtype = get_instantiated_type(subtype) if subtype is not None else File()
         if optional is not None:
-            subtype.optional = optional
+            subtype = subtype.with_optional(optional)
 
         if subtype and not isinstance(subtype, File):
             raise Exception(
@@ -703,11 +771,17 @@ class Stdout(File):
     def id(self):
         return f"stdout<{self.subtype.id()}>"
 
+    def compatibility_key(self) -> tuple:
+        return (*super().compatibility_key(), self.subtype.compatibility_key())
+
+    def interning_key(self):
+        # received_type changes the subtype
+        return None
+
     def received_type(self):
-        st = self.subtype
-        if self.optional is not None:
-            st.optional = self.optional
-        return st
+        if self.optional is not None and self.subtype.optional != self.optional:
+            self.subtype = self.subtype.with_optional(self.optional)
+        return self.subtype
 
     def validate_value(self, meta: Any, allow_null_if_not_optional: bool) -> bool:
         """
@@ -729,7 +803,7 @@ class Stderr(File):
 
         subtype = get_instantiated_type(subtype) if subtype is not None else File()
         if optional is not None:
-            subtype.optional = optional
+            subtype = subtype.with_optional(optional)
 
         if subtype and not isinstance(subtype, File):
             raise Exception(
@@ -752,11 +826,17 @@ class Stderr(File):
     def id(self):
         return f"stderr<{self.subtype.id()}>"
 
+    def compatibility_key(self) -> tuple:
+        return (*super().compatibility_key(), self.subtype.compatibility_key())
+
+    def interning_key(self):
+        # received_type changes the subtype
+        return None
+
     def received_type(self):
-        st = self.subtype
-        if self.optional is not None:
-            st.optional = self.optional
-        return st
+        if self.optional is not None and self.subtype.optional != self.optional:
+            self.subtype = self.subtype.with_optional(self.optional)
+        return self.subtype
 
     def validate_value(self, meta: Any, allow_null_if_not_optional: bool) -> bool:
         """
@@ -878,6 +958,11 @@ def get_from_python_type(dt, optional: bool = None, overrider=None):
         raise Exception(f"Generic {dt} was generic typing, but unqualified")
 
 
+# the interned type for (DataType class, optional) so get_instantiated_type doesn't
+# construct a type that's already shared
+_instantiated_types: Dict[Tuple[Type[DataType], Optional[bool]], DataType] = {}
+
+
 def get_instantiated_type(datatype: ParseableType, optional=None, overrider=None):
 
     bc = overrider or get_instantiated_type
@@ -891,11 +976,17 @@ def get_instantiated_type(datatype: ParseableType, optional=None, overrider=None
         return datatype
 
     if isclass(datatype) and issubclass(datatype, DataType):
-        return datatype(optional=optional)
+        key = (datatype, optional)
+        dt = _instantiated_types.get(key)
+        if dt is None:
+            dt = intern_type(datatype(optional=optional))
+            if dt.is_interned():
+                _instantiated_types[key] = dt
+        return dt
 
     dt = get_from_python_type(datatype, optional=optional, overrider=bc)
     if dt:
-        return dt
+        return intern_type(dt)
 
     raise TypeError(f"Unable to parse type '{str(datatype)}'")
 
@@ -12,7 +12,9 @@
 
 """
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional, Union, Type
+from copy import copy
+from functools import wraps
+from typing import Any, Dict, List, Optional, Union, Type
 
 from janis_core.deps import cwlgen, wdlgen
 
@@ -32,6 +34,121 @@ def is_python_primitive(t):
 # see below for ParseableType
 
 
+# the result of can_receive_from, by the class that implements it, the compatibility
+# keys of the receiving and source types, and source_has_default
+_compatibility_cache: Dict[tuple, bool] = {}
+
+
+def clear_compatibility_cache():
+    """
+    Clear the memoized can_receive_from results, eg: when new types are registered
+    """
+    _compatibility_cache.clear()
+
+
+def memoize_can_receive_from(owner, can_receive_from):
+    """
+    Memoize a can_receive_from implementation by the compatibility keys of the types.
+    The class that implements it is part of the key, so calling super() (with the same
+    types) isn't answered by the subclass's result.
+    """
+
+    @wraps(can_receive_from)
+    def wrapper(self, other, *args, **kwargs):
+        if other is self:
+            # a (shared) type can always receive from itself
+            return True
+        if (
+            not isinstance(other, DataType)
+            or len(args) + len(kwargs) > 1
+            or (kwargs and "source_has_default" not in kwargs)
+        ):
+            return can_receive_from(self, other, *args, **kwargs)
+
+        has_default = bool(args[0] if args else kwargs.get("source_has_default"))
+        key = (
+            owner,
+            self.compatibility_key(),
+            other.compatibility_key(),
+            has_default,
+        )
+        compatible = _compatibility_cache.get(key)
+        if compatible is None:
+            compatible = can_receive_from(self, other, *args, **kwargs)
+            _compatibility_cache[key] = compatible
+        return compatible
+
+    return wrapper
+
+
+def get_invalid_indices(
+    values: List[Any], valid_types: tuple, allow_null: bool
+) -> List[int]:
+    """
+    The indices of the values that aren't instances of the valid_types (or None if
+    allow_null), for types whose validate_value is an isinstance check
+    """
+    # the values are mostly of one (valid) type, so check each distinct type first
+    value_types = set(map(type, values))
+    if all(
+        issubclass(t, valid_types) or (allow_null and t is type(None))
+        for t in value_types
+    ):
+        return []
+    return [
+        i
+        for i, v in enumerate(values)
+        if not (isinstance(v, valid_types) or (allow_null and v is None))
+    ]
+
+
+# the shared (frozen) types by their interning key, see DataType.interning_key
+_interned_types: Dict[tuple, "DataType"] = {}
+
+
+def intern_type(datatype: "DataType") -> "DataType":
+    """
+    The shared, frozen instance that's equivalent to the datatype (the types it wraps
+    are interned too), or the datatype itself if it can't be interned
+    """
+    if datatype._frozen:
+        return datatype
+    key = datatype.interning_key()
+    if key is None:
+        return datatype
+
+    interned = _interned_types.get(key)
+    if interned is None:
+        # a copy, so the instance that was passed in isn't frozen
+        interned = copy(datatype)
+        for k, v in interned.__dict__.items():
+            if isinstance(v, DataType):
+                interned.__dict__[k] = intern_type(v)
+            elif isinstance(v, list) and any(isinstance(i, DataType) for i in v):
+                interned.__dict__[k] = [
+                    intern_type(i) if isinstance(i, DataType) else i for i in v
+                ]
+        interned._frozen = True
+        _interned_types[key] = interned
+    return interned
+
+
+def get_interning_value(value):
+    """
+    A hashable version of an attribute of a type for its interning key, or None if
+    the attribute can't be part of a key (and so the type can't be interned)
+    """
+    if isinstance(value, DataType):
+        return value.interning_key()
+    if isinstance(value, (list, tuple)):
+        values = tuple(get_interning_value(v) for v in value)
+        return None if any(v is None for v in values) else (type(value), values)
+    if value is None or isinstance(value, (str, int, float, bool)):
+        # the type, as True == 1
+        return type(value), value
+    return None
+
+
 class NativeTypes:
     kStr: NativeType = "str"
     kInt: NativeType = "int"
@@ -148,10 +265,81 @@ class NativeTypes:
 
 
 class DataType(ABC):
+    # interned types are shared, so they can't be changed (see intern_type)
+    _frozen = False
+
     def __init__(self, optional=False):
         self.optional = optional if optional is not None else False
         self.is_prim = NativeTypes.is_primitive(self.primitive())
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # memoize each implementation of can_receive_from, see compatibility_key
+        if "can_receive_from" in cls.__dict__:
+            cls.can_receive_from = memoize_can_receive_from(
+                cls, cls.__dict__["can_receive_from"]
+            )
+
+    def compatibility_key(self) -> tuple:
+        """
+        Everything that can_receive_from depends on, the results are memoized by the
+        keys of both types. A type that wraps other types (eg: Array) includes their
+        keys, and a type whose compatibility depends on other attributes must add them.
+        """
+        return type(self), self.optional
+
+    def interning_key(self) -> Optional[tuple]:
+        """
+        The key of the shared instance for this type (see intern_type), which is the
+        class and every attribute, or None if an attribute isn't hashable. A type that
+        mutates itself (or the types it wraps) after it's constructed must return None.
+        """
+        values = []
+        for k, v in sorted(self.__dict__.items()):
+            if k == "_frozen":
+                continue
+            value = get_interning_value(v)
+            if value is None:
+                return None
+            values.append((k, value))
+        return type(self), tuple(values)
+
+    def is_interned(self) -> bool:
+        return self._frozen
+
+    def with_optional(self, optional: bool) -> "DataType":
+        """
+        This type with optional set, without changing this (possibly shared) type
+        """
+        if self.optional == optional and self.is_interned():
+            return self
+        copied = copy(self)
+        copied.optional = optional
+        return intern_type(copied)
+
+    @property
+    def optional(self) -> bool:
+        return self._optional
+
+    @optional.setter
+    def optional(self, optional: bool):
+        if self._frozen:
+            raise Exception(
+                f"Couldn't change whether the type {self.id()} is optional as it's "
+                f"shared between tools and workflows, use with_optional() instead"
+            )
+        self._optional = optional
+
+    def __getstate__(self):
+        # copies (and unpickled types) aren't shared, so they're mutable
+        state = dict(self.__dict__)
+        state.pop("_frozen", None)
+        return state
+
+    def fingerprint_state(self):
+        # an interned type has the same fingerprint as an equivalent constructed one
+        return self.__getstate__()
+
     def is_array(self):
         return False
 
@@ -199,6 +387,19 @@ class DataType(ABC):
     def validate_value(self, meta: Any, allow_null_if_not_optional: bool) -> bool:
         pass
 
+    def validate_values(
+        self, values: List[Any], allow_null_if_not_optional: bool
+    ) -> List[int]:
+        """
+        Validate many values at once (eg: the elements of an array)
+        :return: The indices of every invalid value
+        """
+        return [
+            i
+            for i, v in enumerate(values)
+            if not self.validate_value(v, allow_null_if_not_optional)
+        ]
+
     def coerce_value_if_possible(self, value):
         return value
 
@@ -307,5 +508,9 @@ class DataType(ABC):
     #     return self.default_value
 
 
+DataType.can_receive_from = memoize_can_receive_from(
+    DataType, DataType.can_receive_from
+)
+
 ParseableTypeBase = Union[Type[PythonPrimitive], DataType, Type[DataType]]
 ParseableType = ParseableTypeBase
@@ -0,0 +1,100 @@
+"""
+    fingerprint.py
+
+    Provides a stable, content-based hash of arbitrary (janis) python values, this
+    lets us tell if two tools would translate identically without translating them.
+"""
+import json
+from enum import Enum
+from hashlib import sha256
+from inspect import isclass
+from typing import Any
+
+
+def _qualified_name(obj) -> str:
+    return f"{getattr(obj, '__module__', '')}.{getattr(obj, '__qualname__', repr(obj))}"
+
+
+def _object_state(obj) -> dict:
+    state = dict(getattr(obj, "__dict__", {}))
+    for cls in type(obj).__mro__:
+        for slot in getattr(cls, "__slots__", ()):
+            if slot not in state and hasattr(obj, slot):
+                state[slot] = getattr(obj, slot)
+    return state
+
+
+def canonical_value(value: Any, _seen: set = None):
+    """
+    Reduce a value into a JSON serialisable structure that only depends on its contents,
+    classes and functions are reduced to their qualified name (and function bytecode),
+    and objects with a fingerprint_state() method to the value it returns.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+
+    seen = _seen if _seen is not None else set()
+
+    if isinstance(value, (list, tuple)):
+        return [canonical_value(v, seen) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(
+            (canonical_value(v, seen) for v in value), key=lambda v: json.dumps(v)
+        )
+    if isinstance(value, dict):
+        return {
+            str(k): canonical_value(v, seen)
+            for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))
+        }
+    if isinstance(value, Enum):
+        return [_qualified_name(type(value)), canonical_value(value.value, seen)]
+    if isclass(value):
+        return _qualified_name(value)
+
+    # an object can provide the (smaller) state that identifies it, eg: a tool's
+    # structural hash rather than all of its attributes. It's looked up on the class
+    # as some janis objects resolve unknown attributes (eg: StepNode)
+    fingerprint_state = getattr(type(value), "fingerprint_state", None)
+    if callable(fingerprint_state):
+        return [
+            _qualified_name(type(value)),
+            canonical_value(fingerprint_state(value), seen),
+        ]
+    if callable(value) and hasattr(value, "__code__"):
+        code = value.__code__
+        return [
+            _qualified_name(value),
+            code.co_code.hex(),
+            canonical_value(
+                [c for c in code.co_consts if not hasattr(c, "co_code")], seen
+            ),
+        ]
+
+    if id(value) in seen:
+        return ["<cycle>", _qualified_name(type(value))]
+
+    raw_state = _object_state(value)
+    if not raw_state:
+        rep = repr(value)
+        # the default repr includes the memory address, which isn't stable
+        return [_qualified_name(type(value)), None if " at 0x" in rep else rep]
+
+    seen.add(id(value))
+    state = {
+        k: canonical_value(v, seen)
+        for k, v in sorted(raw_state.items())
+        if not callable(v) or hasattr(v, "__code__")
+    }
+    seen.discard(id(value))
+
+    return [_qualified_name(type(value)), state]
+
+
+def fingerprint(*values) -> str:
+    """
+    Generate a hex digest that uniquely identifies the contents of the values
+    """
+    serialised = json.dumps(
+        canonical_value(list(values)), sort_keys=True, separators=(",", ":")
+    )
+    return sha256(serialised.encode("utf-8")).hexdigest()
@@ -1,4 +1,5 @@
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 
 def split_secondary_file_carats(secondary_annotation: str):
@@ -7,6 +8,18 @@ def split_secondary_file_carats(secondary_annotation: str):
     return secondary_annotation[leading:], leading
 
 
+@lru_cache(maxsize=None)
+def parse_secondary_file_formats(
+    secondary_files: Tuple[str, ...],
+) -> Tuple[Tuple[str, int], ...]:
+    """
+    The (suffix, number of extensions to remove) of each secondary format, this is
+    cached by the formats, so each datatype's secondary_files are only parsed once.
+    :param secondary_files: A tuple (so it can be cached) of CWL secondary formats
+    """
+    return tuple(split_secondary_file_carats(s) for s in secondary_files)
+
+
 def apply_secondary_file_format_to_filename(
     filepath: Optional[str], secondary_file: str
 ):
@@ -36,3 +49,44 @@ def apply_secondary_file_format_to_filename(
     if len(split) > 1:
         newfname = ".".join(split[: -min(leading, len(split) - 1)]) + fixed_sec
     return basepath + newfname
+
+
+def apply_secondary_file_formats_to_filenames(
+    filepaths: List[Optional[str]], secondary_files: List[str]
+) -> List[List[Optional[str]]]:
+    """
+    Apply every secondary format to every filename (see
+    apply_secondary_file_format_to_filename), each filename is only split once.
+    :return: The secondary filenames of each filepath, in the order of secondary_files
+    """
+    formats = parse_secondary_file_formats(tuple(secondary_files))
+    names = []
+    for filepath in filepaths:
+        if not filepath:
+            names.append([None] * len(formats))
+            continue
+
+        basepath, sep, filename = filepath.rpartition("/")
+        basepath += sep
+        split = None
+        # the filename without its last n extensions, by n
+        stems = {}
+
+        secondaries = []
+        for suffix, leading in formats:
+            if leading <= 0:
+                secondaries.append(filepath + suffix)
+                continue
+            if split is None:
+                split = filename.split(".")
+            if len(split) <= 1:
+                secondaries.append(filepath + suffix)
+                continue
+            n = min(leading, len(split) - 1)
+            stem = stems.get(n)
+            if stem is None:
+                stem = basepath + ".".join(split[:-n])
+                stems[n] = stem
+            secondaries.append(stem + suffix)
+        names.append(secondaries)
+    return names
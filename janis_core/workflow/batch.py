@@ -0,0 +1,94 @@
+"""
+    batch.py
+
+    Holds the validation that's deferred while steps are added to a workflow in bulk
+    (see WorkflowBase.batch), so it can run once when the batch finishes and report
+    every error together.
+"""
+from typing import List, Tuple
+
+from janis_core.utils.logger import Logger
+from janis_core.utils.validators import Validators
+
+
+class DeferredValidation:
+    def __init__(self):
+        # (identifier, component) of each node that was added
+        self.identifiers: List[Tuple[str, str]] = []
+        # (step, ignore_missing) of each step that was added
+        self.steps: List[Tuple[object, bool]] = []
+        # every edge that was added (including to steps added before the batch)
+        self.edges: List = []
+        # the errors that were found while adding the steps, eg: unrecognised inputs
+        self.errors: List[str] = []
+
+    def add_identifier(self, identifier: str, component: str):
+        self.identifiers.append((identifier, component))
+
+    def add_step(self, step, ignore_missing: bool):
+        self.steps.append((step, ignore_missing))
+
+    def add_edge(self, edge):
+        self.edges.append(edge)
+
+    def add_error(self, message: str):
+        self.errors.append(message)
+
+    def validate(self, workflow):
+        """
+        Validate the identifiers, missing inputs and edges that were added, raises an
+        exception with every error that was found
+        """
+        errors = list(self.errors)
+
+        for identifier, component in self.identifiers:
+            if identifier in workflow.__dict__:
+                errors.append(
+                    f"'{identifier}' ({component}) is a protected keyword for a janis "
+                    f"workflow"
+                )
+            elif not Validators.validate_identifier(identifier):
+                errors.append(
+                    f"The identifier '{identifier}' ({component}) was invalid because "
+                    f"{Validators.reason_for_failure(identifier)}"
+                )
+
+        # inputs can be connected after the step is added (stp["tag"] = source), so
+        # the missing inputs are checked against the connections the step ends up with
+        for step, ignore_missing in self.steps:
+            if ignore_missing:
+                continue
+            missing = [
+                k
+                for k, v in step.tool.inputs_map().items()
+                if not (v.intype.optional or v.default is not None)
+                and k not in step.sources
+            ]
+            if missing:
+                errors.append(
+                    "Missing the parameters "
+                    + ", ".join(f"'{k}'" for k in missing)
+                    + f" when creating '{step.id()}' ({step.tool.id()})"
+                )
+
+        # (the compatibility of the types is cached by the types, see can_receive_from)
+        for edge in self.edges:
+            try:
+                edge.validate_tags()
+                mismatch = edge.check_types()
+            except Exception as e:
+                errors.append(str(e))
+                continue
+            if mismatch is not None:
+                errors.append(mismatch)
+
+        Logger.log(
+            f"Validated {len(self.identifiers)} nodes and {len(self.edges)} edges "
+            f"added to '{workflow.id()}'"
+        )
+
+        if errors:
+            raise Exception(
+                f"Found {len(errors)} error(s) when adding to '{workflow.id()}':\n"
+                + "\n".join("  - " + e for e in errors)
+            )
@@ -0,0 +1,255 @@
+"""
+    pruning.py
+
+    Builds a slice of a workflow that only contains the steps (transitively) required
+    to produce some of its outputs, or to run some of its steps. The slice keeps the
+    identifiers of the original, so it translates (and takes inputs) the same way.
+"""
+import copy
+from typing import Dict, Iterable, List, Set, Tuple
+
+from janis_core.operators import (
+    AliasSelector,
+    InputNodeSelector,
+    InputSelector,
+    Operator,
+    Selector,
+    StepOutputSelector,
+)
+from janis_core.graph.node import NodeType
+from janis_core.utils.fingerprint import fingerprint
+
+
+def get_selector_args(operator: Operator) -> List[Selector]:
+    """
+    The selectors (and operators) that are direct arguments of the operator
+    """
+    args, to_visit = [], [operator.args, getattr(operator, "kwargs", None)]
+    while to_visit:
+        arg = to_visit.pop()
+        if isinstance(arg, list):
+            to_visit.extend(arg)
+        elif isinstance(arg, dict):
+            to_visit.extend(arg.values())
+        elif isinstance(arg, Selector):
+            args.append(arg)
+    return args
+
+
+def rewrite_source(source, workflow):
+    """
+    Point a source (or selector / operator) at the nodes of the same name on workflow
+    """
+    if isinstance(source, list):
+        return [rewrite_source(s, workflow) for s in source]
+    if isinstance(source, InputNodeSelector):
+        return InputNodeSelector(workflow.input_nodes[source.input_node.id()])
+    if isinstance(source, StepOutputSelector):
+        return StepOutputSelector(workflow.step_nodes[source.node.id()], source.tag)
+    if isinstance(source, AliasSelector):
+        return AliasSelector(
+            rewrite_source(source.inner_selector, workflow), source.data_type
+        )
+    if isinstance(source, Operator):
+        return source.rewrite_operator(
+            {a: rewrite_source(a, workflow) for a in get_selector_args(source)}
+        )
+    return source
+
+
+def get_input_selector_ids(value) -> Set[str]:
+    """
+    The workflow inputs referenced by name (InputSelector) in an output's name / folder
+    """
+    if isinstance(value, list):
+        return {i for v in value for i in get_input_selector_ids(v)}
+    if isinstance(value, InputSelector):
+        return {value.input_to_select}
+    if isinstance(value, Operator):
+        return get_input_selector_ids(value.get_leaves())
+    return set()
+
+
+def prune_workflow(
+    workflow,
+    outputs: Iterable[str] = None,
+    steps: Iterable[str] = None,
+    identifier: str = None,
+):
+    """
+    Build a copy of the workflow with only the steps and inputs that are required
+    to produce the outputs, or to run the steps. See WorkflowBase.prune.
+
+    :param identifier: The id of the copy, defaults to the id of the workflow
+    """
+    from janis_core.workflow.workflow import (
+        WorkflowBase,
+        WorkflowBuilder,
+        get_source_nodes,
+        get_source_outputs,
+    )
+
+    outputs, steps = list(outputs or []), list(steps or [])
+    if not outputs and not steps:
+        raise Exception(
+            f"Couldn't prune '{workflow.id()}' as no outputs or steps were provided"
+        )
+
+    unknown_outputs = [o for o in outputs if o not in workflow.output_nodes]
+    if unknown_outputs:
+        raise Exception(
+            f"Couldn't prune '{workflow.id()}' as it has no output(s) "
+            + ", ".join(f"'{o}'" for o in unknown_outputs)
+            + ", expected one of: "
+            + ", ".join(workflow.output_nodes)
+        )
+
+    # the steps of subworkflows to keep, by the step id of the subworkflow
+    inner_steps: Dict[str, List[str]] = {}
+    targets = set(outputs)
+    for s in steps:
+        stepid, _, inner = s.partition(".")
+        stp = workflow.step_nodes.get(stepid)
+        if stp is None or (inner and not isinstance(stp.tool, WorkflowBase)):
+            raise Exception(
+                f"Couldn't prune '{workflow.id()}' as it has no step '{s}', "
+                f"expected one of: " + ", ".join(workflow.step_nodes)
+            )
+        if inner:
+            inner_steps.setdefault(stepid, []).append(inner)
+        targets.add(stepid)
+
+    # everything the targets depend on
+    required, to_visit = set(), list(targets)
+    for o in outputs:
+        to_visit.extend(
+            get_input_selector_ids(
+                [
+                    workflow.output_nodes[o].output_name,
+                    workflow.output_nodes[o].output_folder,
+                ]
+            )
+        )
+    while to_visit:
+        n = to_visit.pop()
+        if n in required:
+            continue
+        required.add(n)
+        to_visit.extend(u.id() for u in workflow.upstream_nodes(n))
+
+    # prune the subworkflows to the outputs that the rest of the slice consumes
+    tools = {}
+    for stepid in workflow.step_nodes:
+        if stepid not in required:
+            continue
+        tool = workflow.step_nodes[stepid].tool
+        if not isinstance(tool, WorkflowBase) or (
+            stepid in targets and stepid not in inner_steps
+        ):
+            tools[stepid] = tool
+            continue
+
+        consumed = [
+            tag
+            for tag in tool.output_nodes
+            if any(c.id() in required for c, _ in workflow.consumers(stepid, tag))
+        ]
+        if stepid not in inner_steps and len(consumed) == len(tool.output_nodes):
+            tools[stepid] = tool
+        else:
+            # a distinct id for each way the subworkflow is pruned, so two steps that
+            # prune it differently aren't exported to the same file
+            inner = sorted(inner_steps.get(stepid, []))
+            tools[stepid] = prune_workflow(
+                tool,
+                outputs=consumed,
+                steps=inner,
+                identifier=f"{tool.id()}_{fingerprint(sorted(consumed), inner)[:8]}",
+            )
+
+    def is_available(source) -> bool:
+        for node, tag in get_source_outputs(source):
+            if node.id() not in required:
+                return False
+            if (
+                node.node_type == NodeType.STEP
+                and tag not in tools[node.id()].outputs_map()
+            ):
+                return False
+        return True
+
+    # keep the requested outputs, and if steps were requested, every output of them
+    # (and the steps they depend on) that's still available
+    output_ids = [
+        o
+        for o, node in workflow.output_nodes.items()
+        if o in outputs
+        or (
+            steps
+            and is_available(node.source)
+            and get_input_selector_ids([node.output_name, node.output_folder])
+            <= required
+        )
+    ]
+    required.update(output_ids)
+
+    pruned = WorkflowBuilder(
+        identifier or workflow.id(),
+        friendly_name=workflow.friendly_name(),
+        version=workflow.version(),
+        metadata=workflow.metadata,
+        tool_provider=workflow.tool_provider(),
+        tool_module=workflow.tool_module(),
+        doc=workflow.doc(),
+    )
+
+    # build the slice in the order of the original (so it translates the same way),
+    # connecting the edges that were added after their step was created at the end
+    later: List[Tuple[str, str, list]] = []
+    for node in workflow.nodes.values():
+        if node.id() not in required:
+            continue
+
+        if node.node_type == NodeType.INPUT:
+            pruned.input(
+                node.id(),
+                node.datatype,
+                default=node.default,
+                value=node.value,
+                doc=node.doc,
+            )
+        elif node.node_type == NodeType.STEP:
+            connections = {}
+            for tag, sti in node.sources.items():
+                sources = [e.source for e in sti.source_map]
+                if any(n.id() not in pruned.nodes for n in get_source_nodes(sources)):
+                    later.append((node.id(), tag, sources))
+                    continue
+                sources = rewrite_source(sources, pruned)
+                connections[tag] = sources[0] if len(sources) == 1 else sources
+            # a (shallow) copy, so the original tool isn't connected to this workflow
+            tool = copy.copy(tools[node.id()])
+            pruned.step(
+                node.id(),
+                tool(**connections),
+                scatter=node.scatter,
+                _foreach=rewrite_source(node.foreach, pruned),
+                when=rewrite_source(node.when, pruned),
+                ignore_missing=True,
+                doc=node.doc,
+            )
+        elif node.id() in output_ids:
+            pruned.output(
+                node.id(),
+                node.datatype,
+                source=rewrite_source(node.source, pruned),
+                output_folder=node.output_folder,
+                output_name=node.output_name,
+                extension=node.extension,
+                doc=node.doc,
+            )
+
+    for stepid, tag, sources in later:
+        pruned.step_nodes[stepid][tag] = rewrite_source(sources, pruned)
+
+    return pruned
@@ -0,0 +1,322 @@
+"""
+    resourceestimate.py
+
+    Estimates what a workflow needs to run, from the cpus / memory / time / disk hints
+    of its tools: the critical path (the longest chain of dependent steps), the
+    parallelism of each level of the graph and the peak concurrent resources if every
+    step starts as soon as the steps it depends on have finished.
+"""
+import json
+from typing import Any, Dict, List, Optional
+
+from janis_core.operators import Selector
+from janis_core.utils.logger import Logger
+
+# the values the translators use for the resources a tool doesn't specify
+DEFAULT_CPUS = 1
+DEFAULT_MEMORY = 4
+DEFAULT_DISK = 20
+DEFAULT_SECONDS = 86400
+
+
+class StepEstimate:
+    def __init__(
+        self,
+        identifier: str,
+        tool: str,
+        cpus: float,
+        memory: float,
+        disk: float,
+        seconds: float,
+        scatter_width: int = 1,
+        depth: int = 1,
+        defaulted: List[str] = None,
+        parallelism: int = None,
+    ):
+        """
+        The resources of one step, cpus, memory and disk are for all of its shards
+
+        :param defaulted: The resources the tool didn't specify (or were selectors), so
+            the translators' defaults were used.
+        :param parallelism: The number of jobs the step runs at once (for all of its
+            shards), the scatter width if not provided (eg: a subworkflow's is its
+            peak parallelism for each shard).
+        """
+        self.identifier = identifier
+        self.tool = tool
+        self.cpus = cpus
+        self.memory = memory
+        self.disk = disk
+        self.seconds = seconds
+        self.scatter_width = scatter_width
+        self.depth = depth
+        self.defaulted = defaulted or []
+        self.parallelism = parallelism if parallelism is not None else scatter_width
+
+        self.start = 0
+        self.finish = seconds
+
+    def __repr__(self):
+        return (
+            f"StepEstimate({self.identifier}, start={self.start}, finish={self.finish})"
+        )
+
+    def to_dict(self):
+        return {
+            "tool": self.tool,
+            "cpus": self.cpus,
+            "memory": self.memory,
+            "disk": self.disk,
+            "seconds": self.seconds,
+            "scatter_width": self.scatter_width,
+            "parallelism": self.parallelism,
+            "depth": self.depth,
+            "start": self.start,
+            "finish": self.finish,
+            "defaulted": self.defaulted,
+        }
+
+
+class ResourceEstimate:
+    """
+    The estimated requirements of a workflow, see WorkflowBase.estimate_resources
+    """
+
+    def __init__(self, workflow_id: str, steps: Dict[str, StepEstimate]):
+        self.workflow_id = workflow_id
+        self.steps = steps
+
+        self.critical_path: List[str] = []
+        self.critical_path_seconds = 0
+        self.levels: List[Dict[str, Any]] = []
+        self.peak_parallelism = 0
+        self.peak_cpus = 0
+        self.peak_memory = 0
+        self.peak_disk = 0
+
+    def __repr__(self):
+        return (
+            f"ResourceEstimate({self.workflow_id}, critical_path_seconds="
+            f"{self.critical_path_seconds}, peak_cpus={self.peak_cpus}, "
+            f"peak_memory={self.peak_memory})"
+        )
+
+    def table(self) -> List[List[Any]]:
+        """
+        One row for each step (in the order they'd start) with a header row, like
+        WorkflowBase.generate_resources_table
+        """
+        header = [
+            "step",
+            "tool",
+            "scatter",
+            "cpu",
+            "memory (GB)",
+            "disk (GB)",
+            "time (s)",
+            "start (s)",
+            "finish (s)",
+            "critical",
+        ]
+        critical = set(self.critical_path)
+        data = [
+            [
+                s.identifier,
+                s.tool,
+                s.scatter_width,
+                s.cpus,
+                s.memory,
+                s.disk,
+                s.seconds,
+                s.start,
+                s.finish,
+                s.identifier in critical,
+            ]
+            for s in sorted(self.steps.values(), key=lambda s: (s.start, s.depth))
+        ]
+        return [header, *data]
+
+    def summary(self) -> str:
+        return "\n".join(
+            [
+                f"Critical path ({self.critical_path_seconds} s): "
+                + " → ".join(self.critical_path),
+                f"Peak parallelism: {self.peak_parallelism}",
+                f"Peak CPUs: {self.peak_cpus}",
+                f"Peak memory (GB): {self.peak_memory}",
+                f"Peak disk (GB): {self.peak_disk}",
+            ]
+        )
+
+    def to_dict(self):
+        return {
+            "workflow": self.workflow_id,
+            "critical_path": self.critical_path,
+            "critical_path_seconds": self.critical_path_seconds,
+            "peak_parallelism": self.peak_parallelism,
+            "peak_cpus": self.peak_cpus,
+            "peak_memory": self.peak_memory,
+            "peak_disk": self.peak_disk,
+            "levels": self.levels,
+            "steps": {k: s.to_dict() for k, s in self.steps.items()},
+        }
+
+    def to_json(self, indent=2) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
+
+
+def resolve_resource(value, default, identifier: str, resource: str, defaulted: list):
+    if value is None or isinstance(value, Selector):
+        if isinstance(value, Selector):
+            Logger.log(
+                f"Using the default {resource} ({default}) for '{identifier}' as it's "
+                f"a selector ({value}) that can't be resolved before the workflow runs"
+            )
+        defaulted.append(resource)
+        return default
+    return value
+
+
+def estimate_resources(
+    workflow, hints: Dict[str, Any] = None, scatter_widths: Dict[str, int] = None
+) -> ResourceEstimate:
+    """
+    Estimate the resources of a workflow, where each step starts as soon as every step
+    it depends on has finished, and each shard of a scattered step runs concurrently.
+    A subworkflow step is estimated as a whole, with its critical path as its time and
+    its peak resources (and parallelism).
+
+    :param hints: Passed to each tool's cpus / memory / time / disk
+    :param scatter_widths: The number of shards of each scattered step by step id,
+        steps of a subworkflow are prefixed with the step id of the subworkflow
+        (eg: 'subworkflowstep.innerstep'). A scattered step without a width is 1 wide.
+    """
+    from janis_core.workflow.workflow import WorkflowBase
+
+    hints = hints or {}
+    scatter_widths = scatter_widths or {}
+
+    steps: Dict[str, StepEstimate] = {}
+    previous: Dict[str, Optional[StepEstimate]] = {}
+    for node in workflow.topological_order():
+        if node.id() not in workflow.step_nodes:
+            continue
+
+        tool = node.tool
+        width = 1
+        if node.scatter or node.foreach is not None:
+            width = scatter_widths.get(node.id())
+            if width is None:
+                Logger.log(
+                    f"The scattered step '{node.id()}' has no scatter width, "
+                    f"estimating it as 1 wide"
+                )
+                width = 1
+
+        if isinstance(tool, WorkflowBase):
+            prefix = node.id() + "."
+            inner = estimate_resources(
+                tool,
+                hints=hints,
+                scatter_widths={
+                    k[len(prefix) :]: v
+                    for k, v in scatter_widths.items()
+                    if k.startswith(prefix)
+                },
+            )
+            est = StepEstimate(
+                node.id(),
+                tool=tool.id(),
+                cpus=inner.peak_cpus * width,
+                memory=inner.peak_memory * width,
+                disk=inner.peak_disk * width,
+                seconds=inner.critical_path_seconds,
+                scatter_width=width,
+                depth=node.depth,
+                parallelism=inner.peak_parallelism * width,
+            )
+        else:
+            defaulted = []
+            cpus = resolve_resource(
+                tool.cpus(hints), DEFAULT_CPUS, node.id(), "cpus", defaulted
+            )
+            memory = resolve_resource(
+                tool.memory(hints), DEFAULT_MEMORY, node.id(), "memory", defaulted
+            )
+            disk = resolve_resource(
+                tool.disk(hints), DEFAULT_DISK, node.id(), "disk", defaulted
+            )
+            seconds = resolve_resource(
+                tool.time(hints), DEFAULT_SECONDS, node.id(), "time", defaulted
+            )
+            est = StepEstimate(
+                node.id(),
+                tool=tool.id(),
+                cpus=cpus * width,
+                memory=memory * width,
+                disk=disk * width,
+                seconds=seconds,
+                scatter_width=width,
+                depth=node.depth,
+                defaulted=defaulted,
+            )
+
+        upstream = [
+            steps[n.id()] for n in workflow.upstream_nodes(node.id()) if n.id() in steps
+        ]
+        est.start = max((u.finish for u in upstream), default=0)
+        est.finish = est.start + est.seconds
+        # the upstream step this one waits longest for, to walk the critical path back
+        previous[node.id()] = max(upstream, key=lambda u: u.finish, default=None)
+        steps[node.id()] = est
+
+    report = ResourceEstimate(workflow.id(), steps)
+    if not steps:
+        return report
+
+    # critical path: walk back from the step that finishes last
+    last: Optional[StepEstimate] = max(steps.values(), key=lambda s: s.finish)
+    report.critical_path_seconds = last.finish
+    while last is not None:
+        report.critical_path.insert(0, last.identifier)
+        last = previous[last.identifier]
+
+    levels: Dict[int, Dict[str, Any]] = {}
+    for s in steps.values():
+        level = levels.setdefault(
+            s.depth,
+            {
+                "depth": s.depth,
+                "steps": [],
+                "parallelism": 0,
+                "cpus": 0,
+                "memory": 0,
+                "disk": 0,
+            },
+        )
+        level["steps"].append(s.identifier)
+        level["parallelism"] += s.parallelism
+        level["cpus"] += s.cpus
+        level["memory"] += s.memory
+        level["disk"] += s.disk
+    report.levels = [levels[d] for d in sorted(levels)]
+
+    # peak concurrent resources: sweep the start / finish of each step, where a step
+    # that finishes at the same time another starts doesn't overlap with it
+    events = sorted(
+        [(s.start, 1, s) for s in steps.values()]
+        + [(s.finish, -1, s) for s in steps.values()],
+        key=lambda e: (e[0], e[1]),
+    )
+    parallelism, cpus, memory, disk = 0, 0, 0, 0
+    for _, sign, s in events:
+        parallelism += sign * s.parallelism
+        cpus += sign * s.cpus
+        memory += sign * s.memory
+        disk += sign * s.disk
+        report.peak_parallelism = max(report.peak_parallelism, parallelism)
+        report.peak_cpus = max(report.peak_cpus, cpus)
+        report.peak_memory = max(report.peak_memory, memory)
+        report.peak_disk = max(report.peak_disk, disk)
+
+    return report
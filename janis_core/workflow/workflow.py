@@ -1,6 +1,7 @@
 import copy
 import os
 from abc import abstractmethod, ABC
+from contextlib import contextmanager
 from inspect import isclass
 from typing import List, Union, Optional, Dict, Tuple, Any, Set, Iterable, Type
 
@@ -27,6 +28,7 @@ from janis_core.tool.documentation import (
 )
 from janis_core.tool.tool import Tool, ToolType, TInput, TOutput
 from janis_core.translationdeps.exportpath import ExportPathKeywords
+from janis_core.translationdeps.exportwriter import DEFAULT_ZIP_COMPRESSION_LEVEL
 from janis_core.translationdeps.supportedtranslations import SupportedTranslation
 from janis_core.types import (
     DataType,
@@ -40,7 +42,9 @@ from janis_core.utils import first_value, fully_qualify_filename
 from janis_core.utils.logger import Logger
 from janis_core.utils.metadata import WorkflowMetadata
 from janis_core.utils.scatter import ScatterDescription, ScatterMethod
+from janis_core.utils.fingerprint import fingerprint
 from janis_core.utils.validators import Validators
+from janis_core.workflow.batch import DeferredValidation
 
 ConnectionSource = Union[Node, StepOutputSelector, Tuple[Node, str]]
 
@@ -116,6 +120,31 @@ class InputNode(Node):
         return None
 
 
+def get_source_outputs(source) -> List[Tuple[Node, Optional[str]]]:
+    """
+    The (node, output tag) pairs that a source / selector / operator depends on, the
+    tag of an input node is None
+    """
+    if isinstance(source, list):
+        return [o for s in source for o in get_source_outputs(s)]
+    if isinstance(source, StepOutputSelector):
+        return [(source.node, source.tag)]
+    if isinstance(source, InputNodeSelector):
+        return [(source.input_node, None)]
+    if isinstance(source, AliasSelector):
+        return get_source_outputs(source.inner_selector)
+    if isinstance(source, Operator):
+        return get_source_outputs(source.get_leaves())
+    return []
+
+
+def get_source_nodes(source) -> List[Node]:
+    """
+    The (input and step) nodes that a source / selector / operator depends on
+    """
+    return [n for n, _ in get_source_outputs(source)]
+
+
 class StepNode(Node):
     def __init__(
         self,
@@ -157,12 +186,18 @@ class StepNode(Node):
         outs = self.tool.outputs_map()
 
         if self.has_conditionals:
+            # the optional copies are kept until the tool's outputs_map changes
+            cached = self.__dict__.get("_conditional_outputs")
+            if cached is not None and cached[0] is outs:
+                return cached[1]
+
             q = {}
             for ov in outs.values():
                 outtype = copy.copy(ov.outtype)
                 outtype.optional = True
                 q[ov.id()] = TOutput(ov.id(), outtype=outtype, doc=ov.doc)
 
+            self._conditional_outputs = (outs, q)
             outs = q
 
         return outs
@@ -177,17 +212,34 @@ class StepNode(Node):
         #     if node.has_conditionals or node.parent_has_conditionals:
         #         self.parent_has_conditionals = True
 
+        # edges added after the step was created (eg: stp["tag"] = source) may change
+        # the workflow's topological order
+        is_added = self.wf.nodes.get(self.identifier) is self
+        upstream = get_source_nodes(stepoperator) if is_added else []
+        if upstream:
+            self.wf.verify_acyclic(upstream, self)
+
         if tag not in self.sources:
             self.sources[tag] = StepTagInput(self, tag)
 
         # If tag is in scatter.fields, then we can
         scatter = self.scatter and tag in self.scatter.fields
 
-        return self.sources[tag].add_source(source, should_scatter=scatter)
+        batch = self.wf._batch
+        edge = self.sources[tag].add_source(
+            source, should_scatter=scatter, defer_checks=batch is not None
+        )
+        if batch is not None:
+            batch.add_edge(edge)
+        if is_added:
+            self.wf.index_edges(self, [(stepoperator, tag)])
+        return edge
 
     def __getattr__(self, item):
-        if item in self.__dict__:
-            return self.__dict__[item]
+        # only called when the regular lookup (incl. __dict__) misses, and identifiers
+        # can't start with an underscore, so private / dunder lookups fail fast
+        if item.startswith("_"):
+            raise AttributeError(item)
 
         return self.get_item(item)
 
@@ -284,6 +336,9 @@ class OutputNode(Node):
 
 
 class WorkflowBase(Tool):
+    # the validation that's deferred while adding steps in bulk, see batch()
+    _batch: Optional[DeferredValidation] = None
+
     def __init__(self, **connections):
         super().__init__(metadata_class=WorkflowMetadata)
 
@@ -303,6 +358,17 @@ class WorkflowBase(Tool):
         self.step_nodes: Dict[str, StepNode] = {}
         self.output_nodes: Dict[str, OutputNode] = {}
 
+        # The ids of the nodes that each node depends on (upstream) and that depend on
+        # it (downstream), as dicts to keep the order they were connected in. And
+        # the (node id, tag) of the consumers of each output, see index_edges().
+        self._upstream: Dict[str, Dict[str, None]] = {}
+        self._downstream: Dict[str, Dict[str, None]] = {}
+        self._consumers: Dict[
+            str, Dict[Optional[str], List[Tuple[str, Optional[str]]]]
+        ] = {}
+        # the (lazily built) topological order, see topological_order()
+        self._topological_order: Optional[List[Node]] = None
+
         # Flags for different requirements that a workflow might need
         self.has_scatter = False
         self.has_subworkflow = False
@@ -314,6 +380,11 @@ class WorkflowBase(Tool):
 
     def verify_identifier(self, identifier: str, component: str):
 
+        # a clash would replace the existing node, so it can't be deferred
+        if self._batch is not None and identifier not in self.nodes:
+            self._batch.add_identifier(identifier, component)
+            return
+
         if identifier in self.__dict__:
             raise Exception(
                 f"'{identifier}' is a protected keyword for a janis workflow"
@@ -348,7 +419,7 @@ class WorkflowBase(Tool):
 
         datatype = get_instantiated_type(datatype)
         if default is not None:
-            datatype.optional = True
+            datatype = datatype.with_optional(True)
 
         inp = InputNode(
             self,
@@ -360,6 +431,8 @@ class WorkflowBase(Tool):
         )
         self.nodes[identifier] = inp
         self.input_nodes[identifier] = inp
+        self.index_edges(inp, [])
+        self.invalidate_io_maps()
         return InputNodeSelector(inp)
 
     def output(
@@ -458,6 +531,8 @@ class WorkflowBase(Tool):
         )
         self.nodes[identifier] = otp
         self.output_nodes[identifier] = otp
+        self.index_edges(otp, [(sourceoperator, None)])
+        self.invalidate_io_maps()
         return otp
 
     def forward_inputs_from_tool(
@@ -719,6 +794,9 @@ class WorkflowBase(Tool):
                 f"Can't supply 'scatter' and 'foreach' value to step with id: {identifier} for tool: {tool.id()}"
             )
 
+        # in a batch, the errors are reported when the batch finishes
+        batch = self._batch
+
         # verify scatter
         if scatter:
             ins = set(tool.inputs_map().keys())
@@ -726,10 +804,13 @@ class WorkflowBase(Tool):
             if any(f not in ins for f in fields):
                 # if there is a field not in the input map, we have a problem
                 extra_keys = ", ".join(f"'{f}'" for f in (fields - ins))
-                raise Exception(
+                message = (
                     f"Couldn't scatter the field(s) {extra_keys} for step '{identifier}' "
                     f"as they are not inputs to the tool '{tool.id()}'"
                 )
+                if batch is None:
+                    raise Exception(message)
+                batch.add_error(message)
 
         tool.workflow = self
         inputs = tool.inputs_map()
@@ -738,28 +819,35 @@ class WorkflowBase(Tool):
 
         provided_keys = set(connections.keys())
         all_keys = set(inputs.keys())
-        required_keys = set(
-            # The input is optional if it's optional or has default)
-            i
-            for i, v in inputs.items()
-            if not (v.intype.optional or v.default is not None)
-        )
 
         if not provided_keys.issubset(all_keys):
             unrecparams = ", ".join(provided_keys - all_keys)
 
             tags = ", ".join([f"in.{i}" for i in all_keys])
 
-            raise Exception(
+            message = (
                 f"Unrecognised parameters {unrecparams} when creating '{identifier}' ({tool.id()}). "
                 f"Expected types: {tags}"
             )
-
-        if not ignore_missing and not required_keys.issubset(provided_keys):
-            missing = ", ".join(f"'{i}'" for i in (required_keys - provided_keys))
-            raise Exception(
-                f"Missing the parameters {missing} when creating '{identifier}' ({tool.id()})"
+            if batch is None:
+                raise Exception(message)
+            batch.add_error(message)
+            connections = {k: v for k, v in connections.items() if k in all_keys}
+
+        # in a batch, the missing inputs are checked when it finishes (so they can be
+        # connected after the step is added)
+        if batch is None and not ignore_missing:
+            required_keys = set(
+                # The input is optional if it's optional or has default)
+                i
+                for i, v in inputs.items()
+                if not (v.intype.optional or v.default is not None)
             )
+            if not required_keys.issubset(provided_keys):
+                missing = ", ".join(f"'{i}'" for i in (required_keys - provided_keys))
+                raise Exception(
+                    f"Missing the parameters {missing} when creating '{identifier}' ({tool.id()})"
+                )
 
         d = doc if isinstance(doc, DocumentationMeta) else DocumentationMeta(doc=doc)
         stp = StepNode(
@@ -778,7 +866,7 @@ class WorkflowBase(Tool):
             isfilename = isinstance(v, Filename)
             if is_python_primitive(v) or isfilename:
                 inp_identifier = f"{identifier}_{k}"
-                referencedtype = copy.copy(inputs[k].intype) if not isfilename else v
+                referencedtype = inputs[k].intype if not isfilename else v
                 parsed_type = get_instantiated_type(v)
 
                 if parsed_type and not referencedtype.can_receive_from(parsed_type):
@@ -787,7 +875,7 @@ class WorkflowBase(Tool):
                         f"compatible with the '{identifier}.{k}' type: {referencedtype.id()}"
                     )
 
-                referencedtype.optional = True
+                referencedtype = referencedtype.with_optional(True)
 
                 indoc = inputs[k].doc
                 indoc.quality = InputQualityType.configuration
@@ -822,9 +910,147 @@ class WorkflowBase(Tool):
         self.has_subworkflow = self.has_subworkflow or isinstance(tool, WorkflowBase)
         self.nodes[identifier] = stp
         self.step_nodes[identifier] = stp
+        if batch is not None:
+            batch.add_step(stp, ignore_missing)
+        self.index_edges(
+            stp,
+            [(e.source, e.ftag) for e in added_edges]
+            + [(when, None), (_foreach, None)],
+        )
 
         return stp
 
+    def index_edges(self, node: Node, sources: List[Tuple[Any, Optional[str]]]):
+        """
+        Index the connections of a node, so its upstream and downstream nodes (and the
+        consumers of each output) can be looked up without walking the graph.
+
+        :param sources: (source / selector / operator, tag of the node it connects to)
+        """
+        self._consumers.setdefault(node.id(), {})
+        for source, tag in sources:
+            for (u, utag) in get_source_outputs(source):
+                if u.wf is not self:
+                    continue
+                self._consumers.setdefault(u.id(), {}).setdefault(utag, []).append(
+                    (node.id(), tag)
+                )
+
+        self.add_dependencies(get_source_nodes([s for s, _ in sources]), node)
+        # every node and edge that's added is indexed, so the structure has changed
+        self.invalidate_structural_hash()
+
+    def add_dependencies(self, upstream: List[Node], node: Node):
+        """
+        Record that the node depends on the upstream nodes, and update the depth of
+        the node (and everything downstream of it). An input has depth 0, and every
+        other node is one deeper than its deepest upstream node.
+        """
+        self._topological_order = None
+        self._upstream.setdefault(node.id(), {})
+        self._downstream.setdefault(node.id(), {})
+
+        depth = 0 if node.node_type == NodeType.INPUT else 1
+        for u in upstream:
+            if u.wf is not self:
+                continue
+            self._upstream[node.id()][u.id()] = None
+            self._downstream.setdefault(u.id(), {})[node.id()] = None
+            depth = max(depth, u.depth + 1)
+
+        if depth <= node.depth:
+            return
+        node.set_depth(depth)
+
+        to_visit = [node]
+        while to_visit:
+            n = to_visit.pop()
+            for d in self._downstream.get(n.id(), []):
+                downstream = self.nodes[d]
+                if downstream.depth <= n.depth:
+                    downstream.depth = n.depth + 1
+                    to_visit.append(downstream)
+
+    def verify_acyclic(self, upstream: List[Node], node: Node):
+        """
+        Raise an exception if the node depending on any of the upstream nodes
+        would create a cycle
+        """
+        # a downstream node is always deeper, so there's only a cycle if an upstream
+        # node is at least as deep and is reachable from node
+        candidates = {
+            u.id() for u in upstream if u.wf is self and u.depth >= node.depth
+        }
+        if not candidates:
+            return
+        seen, to_visit = set(), [node.id()]
+        while to_visit:
+            n = to_visit.pop()
+            if n in candidates:
+                raise Exception(
+                    f"Couldn't connect '{n}' to '{node.id()}' as '{n}' depends on "
+                    f"'{node.id()}', and the workflow '{self.id()}' must be acyclic"
+                )
+            if n not in seen:
+                seen.add(n)
+                to_visit.extend(self._downstream.get(n, []))
+
+    def upstream_nodes(self, identifier: str) -> List[Node]:
+        """
+        The nodes that the node directly depends on
+        """
+        return [self.nodes[n] for n in self._upstream.get(identifier, {})]
+
+    def downstream_nodes(self, identifier: str) -> List[Node]:
+        """
+        The steps and outputs that directly depend on the node
+        """
+        return [self.nodes[n] for n in self._downstream.get(identifier, {})]
+
+    def consumers(
+        self, identifier: str, tag: Optional[str] = None
+    ) -> List[Tuple[Node, Optional[str]]]:
+        """
+        The (node, input tag) that consume an output of a step (or an input), an
+        output node (or a step's 'when' condition) has a tag of None.
+
+        :param tag: The output of the step, or None for every output of the step
+        """
+        outputs = self._consumers.get(identifier, {})
+        if tag is not None:
+            consumers = outputs.get(tag, [])
+        else:
+            consumers = [c for cs in outputs.values() for c in cs]
+        return [(self.nodes[n], t) for n, t in consumers]
+
+    def topological_order(self) -> List[Node]:
+        """
+        The nodes (inputs, steps and outputs) of the workflow, where each node is after
+        every node it depends on. Nodes of the same depth keep the order they were added.
+        """
+        if self._topological_order is None:
+            self._topological_order = sorted(
+                self.nodes.values(), key=lambda n: (n.depth, n._nodeId)
+            )
+        return self._topological_order
+
+    def levels(self) -> List[List[Node]]:
+        """
+        The nodes grouped by depth, the nodes of each level don't depend on each other
+        """
+        levels: List[List[Node]] = []
+        for n in self.topological_order():
+            while len(levels) <= n.depth:
+                levels.append([])
+            levels[n.depth].append(n)
+        return levels
+
+    def max_depth(self) -> int:
+        """
+        The number of steps on the longest path through the workflow
+        """
+        return max((n.depth for n in self.step_nodes.values()), default=0)
+
     def conditional(
         self, stepid: str, conditions: List[Union[Tuple[Operator, Tool], Tool]]
     ):
@@ -938,6 +1164,14 @@ class WorkflowBase(Tool):
         max_duration=None,
         allow_empty_container=False,
         container_override: dict = None,
+        cache=None,
+        parallel: int = None,
+        session=None,
+        incremental=False,
+        zip_compression_level: int = DEFAULT_ZIP_COMPRESSION_LEVEL,
+        packed=False,
+        as_json=False,
+        timings=False,
     ):
         from janis_core.translations import translate_workflow
 
@@ -962,6 +1196,14 @@ class WorkflowBase(Tool):
             max_duration=max_duration,
             allow_empty_container=allow_empty_container,
             container_override=container_override,
+            cache=cache,
+            parallel=parallel,
+            session=session,
+            incremental=incremental,
+            zip_compression_level=zip_compression_level,
+            packed=packed,
+            as_json=as_json,
+            timings=timings,
         )
 
     def generate_inputs_override(
@@ -1113,6 +1355,149 @@ class WorkflowBase(Tool):
 
         return data
 
+    def structural_components(self) -> dict:
+        components = super().structural_components()
+        components.update(
+            {
+                "inputs": [
+                    [n.id(), n.datatype, n.default, n.value, n.doc]
+                    for n in self.input_nodes.values()
+                ],
+                # the tool of a step is reduced to its structural_hash (see Tool)
+                "steps": [
+                    [
+                        n.id(),
+                        n.tool,
+                        n.scatter,
+                        n.foreach,
+                        n.when,
+                        n.doc,
+                        {
+                            tag: [[e.source, e.scatter] for e in sti.source_map]
+                            for tag, sti in n.sources.items()
+                        },
+                    ]
+                    for n in self.step_nodes.values()
+                ],
+                "outputs": [
+                    [
+                        n.id(),
+                        n.datatype,
+                        n.source,
+                        n.output_folder,
+                        n.output_name,
+                        n.extension,
+                        n.doc,
+                    ]
+                    for n in self.output_nodes.values()
+                ],
+            }
+        )
+        return components
+
+    def structural_hash(self) -> str:
+        """
+        A hex digest of the structure of the workflow: its inputs, steps (and their
+        tools' hashes), connections and outputs. It's cached until a node or edge is
+        added, or one of its subworkflows changes.
+        """
+        cached = self.__dict__.get("_cached_structural_hash")
+        if cached is not None:
+            h, subworkflows = cached
+            if all(w.structural_hash() == wh for w, wh in subworkflows):
+                return h
+
+        h = fingerprint(self.structural_components())
+        subworkflows = [
+            (n.tool, n.tool.structural_hash())
+            for n in self.step_nodes.values()
+            if isinstance(n.tool, WorkflowBase)
+        ]
+        self.__dict__["_cached_structural_hash"] = (h, subworkflows)
+        return h
+
+    @contextmanager
+    def batch(self):
+        """
+        Add steps (and inputs / outputs) in bulk, the validation of the identifiers,
+        missing inputs and types of the connections is deferred until the batch
+        finishes, and every error is reported together (in one exception):
+
+            with w.batch():
+                for i in range(1000):
+                    w.step(f"stp{i}", MyTool(inp=w.inp))
+
+        Missing inputs may be connected after the step is added. Connections between
+        incompatible types are reported as errors (outside a batch they're only logged).
+        If the batch raises, the steps that were added aren't removed.
+        """
+        if self._batch is not None:
+            # a nested batch is validated with the outer one
+            yield self
+            return
+
+        batch = DeferredValidation()
+        self._batch = batch
+        try:
+            yield self
+        finally:
+            self._batch = None
+
+        batch.validate(self)
+
+    def prune(self, outputs: Iterable[str] = None, steps: Iterable[str] = None):
+        """
+        Build a slice of this workflow that only contains the steps (and inputs) that
+        are transitively required to produce the outputs, or to run the steps. The
+        slice keeps the identifiers of this workflow, so it takes the same inputs and
+        translates in the same way. Subworkflows are pruned to the outputs the slice
+        consumes, with a suffix on their id for the outputs and steps they keep.
+
+        :param outputs: The ids of the outputs to keep
+        :param steps: The ids of the steps to keep, with the outputs that only depend on
+            the kept steps. A step of a subworkflow is prefixed with the step id of the
+            subworkflow (eg: 'subworkflowstep.innerstep').
+        :return: WorkflowBuilder
+        """
+        from janis_core.workflow.pruning import prune_workflow
+
+        return prune_workflow(self, outputs=outputs, steps=steps)
+
+    def estimate_resources(
+        self,
+        hints: Dict[str, Any] = None,
+        scatter_widths: Dict[str, int] = None,
+        to_console=True,
+        tabulate_tablefmt=None,
+    ):
+        """
+        Estimate the critical path, the parallelism of each level and the peak
+        concurrent resources of the workflow, from the resources of its tools.
+
+        :param hints: Passed to each tool's cpus / memory / time / disk
+        :param scatter_widths: The number of shards of each scattered step by step id
+            (eg: {"stp": 10, "subworkflowstep.innerstep": 4})
+        :return: janis_core.workflow.resourceestimate.ResourceEstimate, which has the
+            table of steps (.table()) and the report as JSON (.to_json())
+        """
+        from janis_core.workflow.resourceestimate import estimate_resources
+
+        estimate = estimate_resources(
+            self, hints=hints, scatter_widths=scatter_widths
+        )
+        if to_console:
+            import tabulate
+
+            print(
+                tabulate.tabulate(
+                    estimate.table(), headers="firstrow", tablefmt=tabulate_tablefmt
+                )
+            )
+            print()
+            print(estimate.summary())
+
+        return estimate
+
     @staticmethod
     def get_step_ids_from_selector(selector: Selector) -> Set[str]:
         if isinstance(selector, StepOutputSelector):
@@ -1151,7 +1536,8 @@ class WorkflowBase(Tool):
 
         pref = f"{prefix}_" if prefix else ""
 
-        for stp in tool.step_nodes.values():
+        wf = tool
+        for stp in wf.step_nodes.values():
             tool = stp.tool
 
             fn = stp.id()
@@ -1184,26 +1570,17 @@ class WorkflowBase(Tool):
                     color=bgcolor,
                 )
 
-            if stp.sources:
-                to_add = set()
-                for srcId, steptaginput in stp.sources.items():
-                    sti: StepTagInput = steptaginput
-                    src = sti.source()
-                    if src is None:
-                        continue
-                    if isinstance(src, list):
-                        for s in src:
-                            to_add.update(Workflow.get_step_ids_from_selector(s.source))
-                    else:
-
-                        to_add.update(Workflow.get_step_ids_from_selector(src.source))
-                # if len(to_add) == 0 and default_base_connection is not None:
-                #     to_add.add(default_base_connection)
-                if to_add:
-                    if stp.id() in add_later:
-                        add_later[stp.id()].update(to_add)
-                    else:
-                        add_later[stp.id()] = to_add
+            # the steps this step depends on, from the workflow's adjacency index
+            to_add = {
+                n.id()
+                for n in wf.upstream_nodes(stp.id())
+                if n.node_type == NodeType.STEP
+            }
+            if to_add:
+                if stp.id() in add_later:
+                    add_later[stp.id()].update(to_add)
+                else:
+                    add_later[stp.id()] = to_add
 
         for (src, finals) in add_later.items():
             for f in finals:
@@ -1296,12 +1673,78 @@ class WorkflowBase(Tool):
 
 
 class Workflow(WorkflowBase):
+    # Construct the workflow when its graph is first used (eg: nodes, tool_inputs,
+    # translate) rather than when it's initialised, so instantiating a workflow to
+    # list / search it (eg: JanisShed) is cheap. Set this on a subclass, or on
+    # Workflow for every workflow.
+    LAZY_CONSTRUCTION = False
+
+    # the attributes that hold the graph, accessing one constructs a lazy workflow
+    GRAPH_ATTRIBUTES = {
+        "nodes",
+        "input_nodes",
+        "step_nodes",
+        "output_nodes",
+        "_upstream",
+        "_downstream",
+        "_consumers",
+        "_topological_order",
+        "has_scatter",
+        "has_subworkflow",
+        "has_multiple_inputs",
+    }
+
     def __init__(self, **connections):
         super().__init__(**connections)
+        if self.LAZY_CONSTRUCTION:
+            # hold the (empty) graph aside, so the first access constructs it
+            self._pending_graph = {
+                k: self.__dict__.pop(k) for k in Workflow.GRAPH_ATTRIBUTES
+            }
+            return
+
         # Now that we've initialised everything, we can "construct" the workflows for that subclass this class
         # else, for the WorkflowBuilder it will do nothing and they'll add workflows later
         self.constructor()
 
+    def is_constructed(self) -> bool:
+        return "_pending_graph" not in self.__dict__
+
+    def ensure_constructed(self):
+        """
+        Construct a lazy workflow (see LAZY_CONSTRUCTION), if it hasn't been already
+        """
+        pending = self.__dict__.pop("_pending_graph", None)
+        if pending is not None:
+            self.__dict__.update(pending)
+            self.constructor()
+        return self
+
+    def __getattr__(self, item):
+        if item in Workflow.GRAPH_ATTRIBUTES and "_pending_graph" in self.__dict__:
+            return getattr(self.ensure_constructed(), item)
+
+        return super().__getattr__(item)
+
+    def __copy__(self):
+        copied = self.__class__.__new__(self.__class__)
+        copied.__dict__.update(self.__dict__)
+        pending = self.__dict__.get("_pending_graph")
+        if pending is not None:
+            # the copy constructs its own graph, rather than into the original's
+            copied.__dict__["_pending_graph"] = {
+                k: copy.copy(v) for k, v in pending.items()
+            }
+        return copied
+
+    def __deepcopy__(self, memo):
+        copied = self.__class__.__new__(self.__class__)
+        memo[id(self)] = copied
+        # (including the pending graph of a lazy workflow)
+        for k, v in self.__dict__.items():
+            copied.__dict__[k] = copy.deepcopy(v, memo)
+        return copied
+
     @abstractmethod
     def constructor(self):
         """
@@ -1336,6 +1779,9 @@ class DynamicWorkflow(WorkflowBase):
 
 
 class WorkflowBuilder(Workflow):
+    # there's nothing to construct
+    LAZY_CONSTRUCTION = False
+
     def __init__(
         self,
         identifier: str = None,